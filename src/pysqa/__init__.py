@@ -1,6 +1,28 @@
-from pysqa.queueadapter import QueueAdapter
+import importlib
+from typing import TYPE_CHECKING
 
 from . import _version
 
-__all__ = ["QueueAdapter"]
+if TYPE_CHECKING:
+    from pysqa.asyncadapter import AsyncQueueAdapter
+    from pysqa.queueadapter import QueueAdapter
+
+# The adapters are imported on first access, so the command line interface "python -m pysqa" which is called by the
+# RemoteQueueAdapter for every operation does not pay for importing modules it does not use.
+_lazy_import_dict = {
+    "AsyncQueueAdapter": "pysqa.asyncadapter",
+    "QueueAdapter": "pysqa.queueadapter",
+}
+
+__all__ = ["AsyncQueueAdapter", "QueueAdapter"]
 __version__ = _version.__version__
+
+
+def __getattr__(name: str):
+    if name in _lazy_import_dict:
+        return getattr(importlib.import_module(_lazy_import_dict[name]), name)
+    raise AttributeError("module 'pysqa' has no attribute '" + name + "'")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + __all__)
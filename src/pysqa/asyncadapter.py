@@ -0,0 +1,533 @@
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from pysqa.base.core import CommandPlan, QueueAdapterCore
+from pysqa.base.modular import ModularQueueAdapter
+from pysqa.base.status import StatusSnapshot, queue_status_to_dataframe
+from pysqa.queueadapter import QueueAdapter
+
+if TYPE_CHECKING:
+    import pandas
+    from jinja2 import Template
+
+
+async def execute_command_async(
+    commands: Union[str, list[str]],
+    working_directory: Optional[str] = None,
+    split_output: bool = True,
+    shell: bool = False,
+    error_filename: Optional[str] = "pysqa.err",
+) -> Union[str, list[str], None]:
+    """
+    A wrapper around the asyncio subprocess functions, which mirrors pysqa.base.core.execute_command.
+
+    Args:
+        commands (str): The command(s) to be executed on the command line
+        working_directory (str, optional): The directory where the command is executed. Defaults to None.
+        split_output (bool, optional): Boolean flag to split newlines in the output. Defaults to True.
+        shell (bool, optional): Additional switch to convert commands to a single string. Defaults to False.
+        error_filename (str, optional): In case the execution fails, the output is written to this file, None to
+                                        discard the output. Defaults to "pysqa.err".
+
+    Returns:
+        Union[str, List[str]]: Output of the shell command either as a string or as a list of strings
+    """
+    if shell and isinstance(commands, list):
+        commands = " ".join(commands)
+    if isinstance(commands, list):
+        process = await asyncio.create_subprocess_exec(
+            *commands,
+            cwd=working_directory,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    else:
+        process = await asyncio.create_subprocess_shell(
+            commands,
+            cwd=working_directory,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    stdout, _ = await process.communicate()
+    out: Union[str, None] = stdout.decode()
+    if process.returncode != 0:
+        if error_filename is not None:
+            if working_directory is not None:
+                error_file = os.path.join(working_directory, error_filename)
+            else:
+                error_file = error_filename
+            with open(error_file, "w") as f:
+                print(out, file=f)
+        out = None
+    if out is not None and split_output:
+        return out.split("\n")
+    else:
+        return out
+
+
+def _advance_command_plan(plan: CommandPlan, out_lst: Optional[list]) -> tuple:
+    """
+    Execute the next step of a command plan.
+
+    Args:
+        plan (CommandPlan): The command plan.
+        out_lst (list/None): The outputs of the commands of the previous step, None for the first step.
+
+    Returns:
+        tuple: A flag whether the command plan is completed and either the commands of the next step or the result.
+    """
+    try:
+        return False, next(plan) if out_lst is None else plan.send(out_lst)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+class AsyncQueueAdapter:
+    """
+    The AsyncQueueAdapter provides awaitable versions of the QueueAdapter functions for applications which are based on
+    asyncio. The commands of the queuing system are executed with asyncio subprocesses and the output is parsed with the
+    same SchedulerCommands as in the QueueAdapter. The number of concurrently running commands is limited by a
+    semaphore. Adapters which require a module swap or a SSH connection, namely the ModularQueueAdapter and the
+    RemoteQueueAdapter, are executed in a thread instead. The routing of the submissions, the ClusterJobIDs and the job
+    registry are shared with the synchronous QueueAdapter.
+
+    Args:
+        directory (str): Directory containing the queue.yaml files as well as corresponding jinja2 templates for the
+                         individual queues.
+        queue_type (str): Type of the queuing system in capital letters, alternative to the directory.
+        execute_command (Callable): Coroutine function to execute commands.
+        max_concurrency (int): Maximum number of commands executed at the same time.
+        status_cache_ttl (float/None): Time to live of the cached queue status in seconds.
+        job_registry (str/None): Path of a SQLite database to record the submitted jobs and their last known status.
+        cluster_routing (str/None): Selection of the cluster for submit_job() in a clusters.yaml configuration, either
+                                    "active" or "least_loaded".
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        queue_type: Optional[str] = None,
+        execute_command: Callable = execute_command_async,
+        max_concurrency: int = 64,
+        status_cache_ttl: Optional[float] = None,
+        job_registry: Optional[str] = None,
+        cluster_routing: Optional[str] = None,
+    ):
+        self._queue_adapter = QueueAdapter(
+            directory=directory,
+            queue_type=queue_type,
+            status_cache_ttl=status_cache_ttl,
+            job_registry=job_registry,
+            cluster_routing=cluster_routing,
+        )
+        self._execute_command_function = execute_command
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def queue_adapter(self) -> QueueAdapter:
+        """
+        Get the synchronous QueueAdapter which provides the configuration and the templates.
+
+        Returns:
+            QueueAdapter: The synchronous queue adapter.
+        """
+        return self._queue_adapter
+
+    def list_clusters(self) -> list[str]:
+        """
+        List available computing clusters for remote submission
+
+        Returns:
+            List of computing clusters
+        """
+        return self._queue_adapter.list_clusters()
+
+    def switch_cluster(self, cluster_name: str):
+        """
+        Switch to a different computing cluster
+
+        Args:
+            cluster_name (str): name of the computing cluster
+        """
+        self._queue_adapter.switch_cluster(cluster_name=cluster_name)
+
+    async def submit_job(
+        self,
+        queue: Optional[str] = None,
+        job_name: Optional[str] = None,
+        working_directory: Optional[str] = None,
+        cores: Optional[int] = None,
+        memory_max: Optional[Union[int, str]] = None,
+        run_time_max: Optional[int] = None,
+        dependency_list: Optional[list[int]] = None,
+        command: Optional[str] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
+        **kwargs,
+    ) -> Union[int, None]:
+        """
+        Submits command to the given queue.
+
+        Args:
+            queue (str/None):  Name of the queue to submit to, must be one of the names configured for this adapter
+                               (optional)
+            job_name (str/None):  Name of the job for the underlying queuing system (optional)
+            working_directory (str/None):  Directory to run the job in (optional)
+            cores (int/None):  Number of hardware threads requested (optional)
+            memory_max (int/None):  Amount of memory requested per node in GB (optional)
+            run_time_max (int/None):  Maximum runtime in seconds (optional)
+            dependency_list(list[str]/None: Job ids of jobs to be completed before starting (optional)
+            command (str/None): shell command to run in the job
+            **kwargs: allows writing additional parameters to the job submission script if they are available in the
+                      corresponding template.
+
+        Returns:
+            int: Job id received from the queuing system for the job which was submitted, for a clusters.yaml
+                 configuration a ClusterJobID which records the cluster the job was submitted to.
+        """
+        cluster = await asyncio.to_thread(
+            self._queue_adapter.get_submission_cluster,
+            queue=queue,
+            cores=cores,
+            run_time_max=run_time_max,
+            memory_max=memory_max,
+            dependency_list=dependency_list,
+        )
+        adapter = self._queue_adapter.get_adapter(cluster_name=cluster)
+        job_kwargs = dict(
+            queue=queue,
+            job_name=job_name,
+            working_directory=working_directory,
+            cores=cores,
+            memory_max=memory_max,
+            run_time_max=run_time_max,
+            dependency_list=dependency_list,
+            command=command,
+            submission_template=submission_template,
+            **kwargs,
+        )
+        if self._is_native(adapter=adapter):
+            # The first step of the command plan renders and writes the submission script, so it runs in a thread.
+            process_id = await self._run_command_plan(
+                plan=adapter.plan_submit_job(**job_kwargs), first_step_in_thread=True
+            )
+        else:
+            process_id = await self._run_in_thread(adapter.submit_job, **job_kwargs)
+        return self._queue_adapter.record_submitted_job(
+            job_spec={
+                "queue": queue,
+                "job_name": job_name,
+                "working_directory": working_directory,
+                "cores": cores,
+                "memory_max": memory_max,
+                "run_time_max": run_time_max,
+            },
+            process_id=process_id,
+            cluster=cluster,
+        )
+
+    async def enable_reservation(self, process_id: int) -> Union[str, None]:
+        """
+        Enable reservation for a process.
+
+        Args:
+            process_id (int): The process id.
+
+        Returns:
+            str: The result of enabling reservation.
+        """
+        adapter = self._queue_adapter.get_adapter(
+            cluster_name=self._queue_adapter.get_job_cluster(process_id=process_id)
+        )
+        if self._is_native(adapter=adapter):
+            return await self._run_command_plan(
+                plan=adapter.plan_enable_reservation(process_id=process_id)
+            )
+        return await self._run_in_thread(
+            adapter.enable_reservation, process_id=process_id
+        )
+
+    async def delete_job(self, process_id: int) -> Union[str, None]:
+        """
+        Delete a job.
+
+        Args:
+            process_id (int): The process id.
+
+        Returns:
+            str: The result of deleting the job.
+        """
+        adapter = self._queue_adapter.get_adapter(
+            cluster_name=self._queue_adapter.get_job_cluster(process_id=process_id)
+        )
+        if self._is_native(adapter=adapter):
+            return await self._run_command_plan(
+                plan=adapter.plan_delete_job(process_id=process_id)
+            )
+        return await self._run_in_thread(adapter.delete_job, process_id=process_id)
+
+    async def get_queue_status(
+        self, user: Optional[str] = None
+    ) -> Union["pandas.DataFrame", None]:
+        """
+        Get the status of the queue.
+
+        Args:
+            user (str/None): The user.
+
+        Returns:
+            pandas.DataFrame: The status of the queue.
+        """
+        return queue_status_to_dataframe(
+            queue_status=await self.get_queue_status_dict(user=user)
+        )
+
+    async def get_queue_status_dict(
+        self, user: Optional[str] = None
+    ) -> Union[dict[str, list], None]:
+        """
+        Get the status of the queue as dictionary of columns.
+
+        Args:
+            user (str/None): The user.
+
+        Returns:
+            dict[str, list]: The status of the queue with one list per column.
+        """
+        adapter = self._queue_adapter.get_adapter()
+        if self._is_native(adapter=adapter):
+            return await self._run_command_plan(
+                plan=adapter.plan_queue_status_dict(user=user)
+            )
+        return await self._run_in_thread(adapter.get_queue_status_dict, user=user)
+
+    async def get_status_of_my_jobs(
+        self, refresh: bool = False
+    ) -> Union["pandas.DataFrame", None]:
+        """
+        Get the status of the user's jobs.
+
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+           pandas.DataFrame: The status of the user's jobs.
+        """
+        adapter = self._queue_adapter.get_adapter()
+        if self._is_native(adapter=adapter):
+            df = await self._run_command_plan(
+                plan=adapter.plan_status_of_my_jobs(refresh=refresh)
+            )
+        else:
+            df = await self._run_in_thread(
+                adapter.get_status_of_my_jobs, refresh=refresh
+            )
+        if self._queue_adapter.job_registry is not None and df is not None:
+            self._queue_adapter.record_status_of_jobs(
+                cluster=self._queue_adapter.active_cluster,
+                status_dict=dict(zip(df["jobid"].tolist(), df["status"].tolist())),
+            )
+        return df
+
+    async def get_status_of_job(
+        self, process_id: int, refresh: bool = False
+    ) -> Union[str, None]:
+        """
+        Get the status of a job.
+
+        Args:
+            process_id: The process id.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+             str: The status of the job. Possible values are ['running', 'pending', 'error'].
+        """
+        cluster = self._queue_adapter.get_job_cluster(process_id=process_id)
+        adapter = self._queue_adapter.get_adapter(cluster_name=cluster)
+        if self._is_native(adapter=adapter):
+            status = await self._run_command_plan(
+                plan=adapter.plan_status_of_job(process_id=process_id, refresh=refresh)
+            )
+        else:
+            status = await self._run_in_thread(
+                adapter.get_status_of_job, process_id=process_id, refresh=refresh
+            )
+        self._queue_adapter.record_status_of_jobs(
+            cluster=cluster, status_dict={process_id: status}
+        )
+        return status
+
+    async def get_status_of_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> list[Optional[str]]:
+        """
+        Get the status of multiple jobs, the clusters of a clusters.yaml configuration are queried concurrently.
+
+        Args:
+            process_id_lst: The list of process ids.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+             List[str]: The status of the jobs. Possible values are ['running', 'pending', 'error', ...].
+        """
+        cluster_dict = self._queue_adapter.group_jobs_by_cluster(
+            process_id_lst=process_id_lst
+        )
+        cluster_status_lst = await asyncio.gather(
+            *[
+                self._get_status_of_cluster_jobs(
+                    cluster=cluster,
+                    process_id_lst=cluster_process_id_lst,
+                    refresh=refresh,
+                )
+                for cluster, cluster_process_id_lst in cluster_dict.items()
+            ]
+        )
+        return self._queue_adapter.assemble_status_of_jobs(
+            process_id_lst=process_id_lst,
+            cluster_status_dict=dict(zip(cluster_dict.keys(), cluster_status_lst)),
+        )
+
+    async def get_status_snapshot(
+        self, refresh: bool = False
+    ) -> Union[StatusSnapshot, None]:
+        """
+        Get a snapshot of the queue status indexed by the job ID, the snapshot is shared with the synchronous adapter.
+
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+            StatusSnapshot: The snapshot of the queue status.
+        """
+        adapter = self._queue_adapter.get_adapter()
+        if self._is_native(adapter=adapter):
+            return await self._run_command_plan(
+                plan=adapter.plan_status_snapshot(refresh=refresh)
+            )
+        return await self._run_in_thread(adapter.get_status_snapshot, refresh=refresh)
+
+    async def _get_status_of_cluster_jobs(
+        self, cluster: str, process_id_lst: list[int], refresh: bool = False
+    ) -> list[str]:
+        """
+        Get the status of multiple jobs which were submitted to the same cluster.
+
+        Args:
+            cluster (str): The name of the cluster.
+            process_id_lst (list[int]): List of process IDs.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+            list[str]: List of job statuses.
+        """
+        adapter = self._queue_adapter.get_adapter(cluster_name=cluster)
+        if self._is_native(adapter=adapter):
+            return await self._run_command_plan(
+                plan=adapter.plan_status_of_jobs(
+                    process_id_lst=process_id_lst, refresh=refresh
+                )
+            )
+        return await self._run_in_thread(
+            adapter.get_status_of_jobs, process_id_lst=process_id_lst, refresh=refresh
+        )
+
+    async def _run_command_plan(
+        self, plan: CommandPlan, first_step_in_thread: bool = False
+    ) -> Any:
+        """
+        Execute a command plan of the synchronous adapter, the commands of each step are executed concurrently with
+        asyncio subprocesses.
+
+        Args:
+            plan (CommandPlan): The command plan.
+            first_step_in_thread (bool): Execute the first step of the command plan in a thread, for command plans
+                                         which write files before the first command is executed.
+
+        Returns:
+            object: The result of the command plan.
+        """
+        if first_step_in_thread:
+            done, value = await asyncio.to_thread(_advance_command_plan, plan, None)
+        else:
+            done, value = _advance_command_plan(plan=plan, out_lst=None)
+        while not done:
+            out_lst = await asyncio.gather(
+                *[self._execute_command(**command_kwargs) for command_kwargs in value]
+            )
+            done, value = _advance_command_plan(plan=plan, out_lst=list(out_lst))
+        return value
+
+    async def _execute_command(
+        self,
+        commands: Union[str, list[str]],
+        working_directory: Optional[str] = None,
+        split_output: bool = True,
+        shell: bool = False,
+        error_filename: Optional[str] = "pysqa.err",
+    ):
+        """
+        Execute a command while respecting the maximum number of concurrently running commands.
+
+        Args:
+            commands (Union[str, List[str]]): The command(s) to be executed.
+            working_directory (Optional[str], optional): The working directory. Defaults to None.
+            split_output (bool, optional): Whether to split the output into lines. Defaults to True.
+            shell (bool, optional): Whether to use the shell to execute the command. Defaults to False.
+            error_filename (str, optional): The name of the error file, None to discard the output. Defaults to
+                                            "pysqa.err".
+
+        Returns:
+            str: The output of the command(s).
+        """
+        async with self._get_semaphore():
+            return await self._execute_command_function(
+                commands=commands,
+                working_directory=working_directory,
+                split_output=split_output,
+                shell=shell,
+                error_filename=error_filename,
+            )
+
+    async def _run_in_thread(self, function: Callable, **kwargs):
+        """
+        Execute a blocking function of the synchronous adapter in a thread while respecting the maximum number of
+        concurrently running commands.
+
+        Args:
+            function (Callable): The blocking function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            object: The return value of the function.
+        """
+        async with self._get_semaphore():
+            return await asyncio.to_thread(function, **kwargs)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore which limits the number of concurrently running commands. It is created lazily, so the
+        adapter can be constructed outside of a running event loop.
+
+        Returns:
+            asyncio.Semaphore: The semaphore.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    @staticmethod
+    def _is_native(adapter: QueueAdapterCore) -> bool:
+        """
+        Check if the commands of the adapter can be executed with asyncio subprocesses directly.
+
+        Args:
+            adapter (QueueAdapterCore): The queue adapter.
+
+        Returns:
+            bool: True if the commands can be executed natively.
+        """
+        return not isinstance(adapter, ModularQueueAdapter) and not getattr(
+            adapter, "remote_flag", False
+        )
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-import pandas
-from jinja2 import Template
+if TYPE_CHECKING:
+    import pandas
+    from jinja2 import Template
 
 
 class QueueAdapterAbstractClass(ABC):
@@ -17,7 +18,7 @@ class QueueAdapterAbstractClass(ABC):
         run_time_max: Optional[int] = None,
         dependency_list: Optional[list[int]] = None,
         command: str = "",
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         **kwargs,
     ) -> Union[int, None]:
         pass
@@ -31,7 +32,7 @@ class QueueAdapterAbstractClass(ABC):
         pass
 
     @abstractmethod
-    def get_queue_status(self, user: Optional[str] = None) -> pandas.DataFrame:
+    def get_queue_status(self, user: Optional[str] = None) -> "pandas.DataFrame":
         """
         Get the status of the queue.
 
@@ -44,22 +45,43 @@ class QueueAdapterAbstractClass(ABC):
         pass
 
     @abstractmethod
-    def get_status_of_my_jobs(self) -> pandas.DataFrame:
+    def get_queue_status_dict(
+        self, user: Optional[str] = None
+    ) -> Union[dict[str, list], None]:
+        """
+        Get the status of the queue as dictionary of columns.
+
+        Args:
+            user (str): The user to filter the queue status for.
+
+        Returns:
+            dict[str, list]: The queue status.
+        """
+        pass
+
+    @abstractmethod
+    def get_status_of_my_jobs(self, refresh: bool = False) -> "pandas.DataFrame":
         """
         Get the status of the user's jobs.
 
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
         Returns:
             pandas.DataFrame: The status of the user's jobs.
         """
         pass
 
     @abstractmethod
-    def get_status_of_job(self, process_id: int) -> Union[str, None]:
+    def get_status_of_job(
+        self, process_id: int, refresh: bool = False
+    ) -> Union[str, None]:
         """
         Get the status of a job.
 
         Args:
             process_id (int): The process ID.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
 
         Returns:
             str: The status of the job.
@@ -67,12 +89,15 @@ class QueueAdapterAbstractClass(ABC):
         pass
 
     @abstractmethod
-    def get_status_of_jobs(self, process_id_lst: list[int]) -> list[str]:
+    def get_status_of_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> list[Optional[str]]:
         """
         Get the status of multiple jobs.
 
         Args:
             process_id_lst (list[int]): List of process IDs.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
 
         Returns:
             list[str]: List of job statuses.
@@ -29,7 +29,7 @@ def command_line(
     memory_max = None
     run_time_max = None
     command = None
-    job_id = None
+    job_id_lst = []
     if arguments_lst is None:
         arguments_lst = sys.argv[1:]
     try:
@@ -87,7 +87,7 @@ def command_line(
                 mode_reservation = True
             elif opt in ("-i", "--id"):
                 if arg != "":
-                    job_id = int(arg)
+                    job_id_lst.append(int(arg))
             elif opt in ("-d", "--delete"):
                 mode_delete = True
             elif opt in ("-s", "--status"):
@@ -112,17 +112,19 @@ def command_line(
                     )
                 )
             elif mode_delete:
-                if job_id is not None:
-                    print(qa.delete_job(process_id=job_id))
+                if len(job_id_lst) == 1:
+                    print(qa.delete_job(process_id=job_id_lst[0]))
+                elif len(job_id_lst) > 1:
+                    print(json.dumps(qa.delete_jobs(process_id_lst=job_id_lst)))
                 else:
                     raise ValueError("Job ID not provided")
             elif mode_reservation:
-                if job_id is not None:
-                    print(qa.enable_reservation(process_id=job_id))
+                if len(job_id_lst) > 0:
+                    print(qa.enable_reservation(process_id=job_id_lst[-1]))
                 else:
                     raise ValueError("Job ID not provided")
             elif mode_status:
-                print(json.dumps(qa.get_queue_status().to_dict(orient="list")))
+                print(json.dumps(qa.get_queue_status_dict()))
         elif mode_list and working_directory is not None:
             working_directory = os.path.abspath(os.path.expanduser(working_directory))
             remote_dirs, remote_files = [], []
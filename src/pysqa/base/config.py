@@ -1,20 +1,100 @@
+import copy
+import functools
+import hashlib
+import json
 import os
-from typing import Callable, Optional, Union
-
-import pandas
-import yaml
-from jinja2 import Template
-from jinja2.exceptions import TemplateSyntaxError
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from pysqa.base.core import QueueAdapterCore, execute_command
 from pysqa.base.validate import check_queue_parameters, value_error_if_none
 
-try:
-    from pysqa.base.models import validate_config
-except ImportError:
+if TYPE_CHECKING:
+    import pandas
+    from jinja2 import Environment, Template
+
+
+# Environment variable with the directory of the on-disk cache of validated configurations, the on-disk cache is
+# disabled when the variable is not set.
+config_cache_environment_variable = "PYSQA_CONFIG_CACHE"
+
+_config_cache_lock = threading.Lock()
+_config_cache: dict[tuple[str, bool], tuple[tuple[int, int], dict]] = {}
+
+
+class ValidatedConfig(dict):
+    """
+    Configuration dictionary which was already validated by read_config(), so the queue adapter does not validate it
+    again.
+    """
+
+
+def validate_config(config: dict) -> dict:
+    """
+    Validate the configuration with the pydantic model, the configuration is returned unchanged if pydantic is not
+    installed.
+
+    Args:
+        config (dict): The configuration dictionary.
 
-    def validate_config(config: dict) -> dict:
+    Returns:
+        dict: The validated configuration dictionary.
+    """
+    try:
+        from pysqa.base.models import validate_config as validate_config_model
+    except ImportError:
         return config
+    return validate_config_model(config=config)
+
+
+@functools.cache
+def get_template_environment(search_path: tuple[str, ...]) -> "Environment":
+    """
+    Get the jinja2 environment for the templates in the given directories. The environment is shared by all queue
+    adapters in the same process and the compiled templates are stored in a bytecode cache on disk, so other processes
+    which load the same templates skip the compilation.
+
+    Args:
+        search_path (tuple[str, ...]): The directories to load the templates from.
+
+    Returns:
+        jinja2.Environment: The jinja2 environment.
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader(list(search_path)),
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+
+
+def load_template(file_name: str, directory: str = ".") -> "Template":
+    """
+    Load a submission script template from a file. The template is loaded from the directory of the file, so it can
+    include or extend other templates in the same directory or in the configuration directory.
+
+    Args:
+        file_name (str): The file name of the template, relative to the directory.
+        directory (str, optional): The directory of the configuration. Defaults to ".".
+
+    Returns:
+        jinja2.Template: The compiled template.
+    """
+    from jinja2.exceptions import TemplateSyntaxError
+
+    directory = os.path.abspath(os.path.expanduser(directory))
+    path = os.path.join(directory, file_name)
+    environment = get_template_environment(
+        search_path=tuple(dict.fromkeys([os.path.dirname(path), directory]))
+    )
+    try:
+        return environment.get_template(os.path.basename(path))
+    except TemplateSyntaxError as error:
+        raise TemplateSyntaxError(
+            message="File: " + file_name + " - " + (error.message or ""),
+            lineno=error.lineno,
+        )
 
 
 class Queues:
@@ -80,12 +160,20 @@ class QueueAdapterWithConfig(QueueAdapterCore):
         directory: str = "~/.queues",
         execute_command: Callable = execute_command,
     ):
-        self._config = validate_config(config)
+        self._config: dict = (
+            config if isinstance(config, ValidatedConfig) else validate_config(config)
+        )
         super().__init__(
-            queue_type=self._config["queue_type"], execute_command=execute_command
+            queue_type=self._config["queue_type"],
+            execute_command=execute_command,
+            status_cache_ttl=self._config.get("status_cache_ttl", 0.0),
+            status_format=self._config.get("status_format", "text"),
+            accounting=self._config.get("accounting", False),
         )
         self._fill_queue_dict(queue_lst_dict=self._config["queues"])
-        self._load_templates(queue_lst_dict=self._config["queues"], directory=directory)
+        self._directory = directory
+        self._template_dict: dict[str, Template] = {}
+        self._load_templates(queue_lst_dict=self._config["queues"])
         self._queues = Queues(self.queue_list)
         self._remote_flag = False
         self._ssh_delete_file_on_remote = True
@@ -131,15 +219,17 @@ class QueueAdapterWithConfig(QueueAdapterCore):
         return list(self._config["queues"].keys())
 
     @property
-    def queue_view(self) -> pandas.DataFrame:
+    def queue_view(self) -> "pandas.DataFrame":
         """
         Get the Pandas DataFrame representation of the available queues.
 
         Returns:
             pandas.DataFrame: The Pandas DataFrame representation of the available queues.
         """
+        import pandas
+
         return pandas.DataFrame(self._config["queues"]).T.drop(
-            ["script", "template"], axis=1
+            ["script", "template"], axis=1, errors="ignore"
         )
 
     @property
@@ -192,7 +282,7 @@ class QueueAdapterWithConfig(QueueAdapterCore):
     def check_queue_parameters(
         self,
         queue: Optional[str],
-        cores: int = 1,
+        cores: Optional[int] = 1,
         run_time_max: Optional[int] = None,
         memory_max: Optional[Union[int, str]] = None,
         active_queue: Optional[dict] = None,
@@ -204,7 +294,7 @@ class QueueAdapterWithConfig(QueueAdapterCore):
 
         Args:
             queue (str): The queue to check.
-            cores (int, optional): The number of cores. Defaults to 1.
+            cores (int/None, optional): The number of cores, None if no number of cores is requested. Defaults to 1.
             run_time_max (int, optional): The maximum run time. Defaults to None.
             memory_max (int, optional): The maximum memory. Defaults to None.
             active_queue (dict, optional): The active queue. Defaults to None.
@@ -221,10 +311,52 @@ class QueueAdapterWithConfig(QueueAdapterCore):
             memory_max=memory_max,
         )
 
+    def _get_pack_resources(
+        self, queue: Optional[str], cores: Optional[int], run_time_max: Optional[int]
+    ) -> tuple[int, Optional[int]]:
+        """
+        Get the number of cores and the run time of the jobs of packed tasks. By default the jobs use the maximum
+        number of cores and the maximum run time of the queue, requested values are limited to the queue limits.
+
+        Args:
+            queue (str/None): The queue name.
+            cores (int/None): The requested number of cores.
+            run_time_max (int/None): The requested maximum run time.
+
+        Returns:
+            tuple[int, int/None]: The number of cores and the maximum run time.
+        """
+        if queue is None:
+            queue = self._config["queue_primary"]
+        active_queue = self._config["queues"][queue]
+        if cores is None:
+            cores = active_queue.get("cores_max", 1)
+        if run_time_max is None:
+            run_time_max = active_queue.get("run_time_max")
+        cores_checked, run_time_max_checked, _ = check_queue_parameters(
+            active_queue={
+                "cores_min": active_queue.get("cores_min"),
+                "cores_max": active_queue.get("cores_max"),
+                "run_time_max": active_queue.get("run_time_max"),
+                "memory_max": active_queue.get("memory_max"),
+            },
+            cores=cores,
+            run_time_max=run_time_max,
+        )
+        if cores_checked is None:
+            raise ValueError(
+                "The number of cores could not be determined for queue '"
+                + str(queue)
+                + "'."
+            )
+        return int(cores_checked), (
+            int(run_time_max_checked) if run_time_max_checked is not None else None
+        )
+
     def _job_submission_template(
         self,
         queue: Optional[str] = None,
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         job_name: str = "job.py",
         working_directory: str = ".",
         cores: int = 1,
@@ -278,7 +410,7 @@ class QueueAdapterWithConfig(QueueAdapterCore):
             )
         return super()._job_submission_template(
             queue=None,
-            submission_template=active_queue["template"],
+            submission_template=self._get_queue_template(queue=queue),
             job_name=job_name,
             working_directory=working_directory,
             cores=int(cores_checked),
@@ -310,39 +442,143 @@ class QueueAdapterWithConfig(QueueAdapterCore):
             for key in set(queue_keys) - set(queue_dict.keys()):
                 queue_dict[key] = None
 
-    @staticmethod
-    def _load_templates(queue_lst_dict: dict, directory: str = ".") -> None:
+    def _load_templates(self, queue_lst_dict: dict):
         """
-        Load the queue templates from files and store them in the queue dictionary.
+        Load the queue templates from files and store them in the queue dictionary, so a broken template is reported
+        when the configuration is loaded. The compiled templates are shared through the jinja2 environment, so loading
+        them again for another adapter with the same configuration directory is cheap.
 
         Args:
             queue_lst_dict (dict): The queue dictionary.
-            directory (str, optional): The directory where the queue template files are located. Defaults to ".".
         """
-        for queue_dict in queue_lst_dict.values():
-            if "script" in queue_dict and queue_dict["script"] is not None:
-                with open(os.path.join(directory, queue_dict["script"])) as f:
-                    try:
-                        queue_dict["template"] = Template(f.read())
-                    except TemplateSyntaxError as error:
-                        raise TemplateSyntaxError(
-                            message="File: "
-                            + queue_dict["script"]
-                            + " - "
-                            + error.message,
-                            lineno=error.lineno,
-                        )
-
-
-def read_config(file_name: str = "queue.yaml") -> dict:
+        for queue, queue_dict in queue_lst_dict.items():
+            if queue_dict.get("script") is not None:
+                queue_dict["template"] = self._get_queue_template(queue=queue)
+
+    def _get_queue_template(self, queue: str) -> "Template":
+        """
+        Get the submission script template of a queue, the template is loaded from the script file once per adapter.
+        A template which is defined directly in the configuration with the "template" key is used as is.
+
+        Args:
+            queue (str): The queue name.
+
+        Returns:
+            jinja2.Template: The compiled template of the queue.
+        """
+        if queue not in self._template_dict:
+            queue_dict = self._config["queues"][queue]
+            if queue_dict.get("script") is not None:
+                self._template_dict[queue] = load_template(
+                    file_name=queue_dict["script"], directory=self._directory
+                )
+            elif queue_dict.get("template") is not None:
+                self._template_dict[queue] = queue_dict["template"]
+            else:
+                raise ValueError(
+                    "The queue " + queue + " does not define a script template."
+                )
+        return self._template_dict[queue]
+
+
+def read_config(file_name: str = "queue.yaml", validate: bool = False) -> dict:
     """
-    Read and parse a YAML configuration file.
+    Read and parse a YAML configuration file. The parsed configuration is cached for the process, keyed by the path,
+    the modification time and the size of the file, so reading an unchanged file again only requires a stat call. If
+    the environment variable PYSQA_CONFIG_CACHE defines a directory, the validated configuration is additionally
+    stored in this directory and shared with other processes. The file is parsed with the safe YAML loader, so python
+    specific tags like !!python/tuple are rejected.
 
     Args:
         file_name (str): The name of the YAML file to read.
+        validate (bool): Validate the configuration of a queuing system. Defaults to False.
 
     Returns:
-        dict: The parsed configuration as a dictionary.
+        dict: The parsed configuration as a dictionary, each call returns an independent copy.
+    """
+    path = os.path.abspath(file_name)
+    stat = os.stat(path)
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    with _config_cache_lock:
+        cache_entry = _config_cache.get((path, validate))
+    if cache_entry is not None and cache_entry[0] == file_key:
+        config = cache_entry[1]
+    else:
+        config = _load_config(path=path, file_key=file_key, validate=validate)
+        with _config_cache_lock:
+            _config_cache[(path, validate)] = (file_key, config)
+    if validate:
+        return ValidatedConfig(copy.deepcopy(config))
+    return copy.deepcopy(config)
+
+
+def clear_config_cache():
+    """
+    Remove all configurations from the process wide configuration cache, the on-disk cache is not modified.
+    """
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def _load_config(path: str, file_key: tuple[int, int], validate: bool) -> dict:
+    """
+    Load a configuration file from the on-disk cache or parse it with the libyaml loader when it is available.
+
+    Args:
+        path (str): The absolute path of the YAML file.
+        file_key (tuple[int, int]): The modification time in nanoseconds and the size of the file.
+        validate (bool): Validate the configuration of a queuing system.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    cache_directory = os.environ.get(config_cache_environment_variable)
+    cache_file = None
+    if cache_directory is not None:
+        from pysqa import __version__
+
+        cache_file = os.path.join(
+            os.path.abspath(os.path.expanduser(cache_directory)),
+            hashlib.sha256(
+                json.dumps([path, file_key, validate, __version__]).encode()
+            ).hexdigest()
+            + ".json",
+        )
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    import yaml
+
+    with open(path) as f:
+        config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    if validate:
+        config = validate_config(config)
+    if cache_file is not None:
+        _write_config_cache(cache_file=cache_file, config=config)
+    return config
+
+
+def _write_config_cache(cache_file: str, config: dict):
+    """
+    Store a configuration in the on-disk cache. The file is written atomically and configurations which cannot be
+    represented as JSON are not cached.
+
+    Args:
+        cache_file (str): The path of the cache file.
+        config (dict): The configuration.
     """
-    with open(file_name) as f:
-        return yaml.load(f, Loader=yaml.FullLoader)
+    temp_file = None
+    try:
+        cache_directory = os.path.dirname(cache_file)
+        os.makedirs(cache_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_directory, suffix=".tmp", delete=False
+        ) as f:
+            temp_file = f.name
+            json.dump(config, f)
+        os.replace(temp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        if temp_file is not None and os.path.exists(temp_file):
+            os.remove(temp_file)
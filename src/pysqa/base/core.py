@@ -1,15 +1,36 @@
+import functools
 import getpass
 import importlib
 import os
+import re
 import subprocess
-from typing import Callable, Optional, Union
-
-import pandas
-from jinja2 import Template
+from collections.abc import Generator, Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from pysqa.base.abstract import QueueAdapterAbstractClass
+from pysqa.base.status import (
+    StatusCache,
+    StatusSnapshot,
+    concat_queue_status,
+    filter_queue_status,
+    queue_status_to_dataframe,
+    terminal_status_tuple,
+)
+from pysqa.base.tasks import (
+    get_pack_size,
+    get_packed_task_command,
+    get_task_status_lst,
+    write_task_manifest,
+)
+from pysqa.base.wait import PollPolicy, iter_wait_for_jobs, wait_for_jobs
+from pysqa.base.workflow import submit_workflow
 from pysqa.wrapper.abstract import SchedulerCommands
 
+if TYPE_CHECKING:
+    import pandas
+    from jinja2 import Template
+
 queue_type_dict: dict[str, dict[str, Union[str, None]]] = {
     "SGE": {
         "class_name": "SunGridEngineCommands",
@@ -22,6 +43,7 @@ queue_type_dict: dict[str, dict[str, Union[str, None]]] = {
     "SLURM": {
         "class_name": "SlurmCommands",
         "module_name": "pysqa.wrapper.slurm",
+        "json_class_name": "SlurmJsonCommands",
     },
     "LSF": {
         "class_name": "LsfCommands",
@@ -45,13 +67,17 @@ queue_type_dict: dict[str, dict[str, Union[str, None]]] = {
     },
 }
 
+# A command plan is a generator which yields lists of keyword arguments for execute_command(), receives the list of
+# outputs of these commands and finally returns its result.
+CommandPlan = Generator[list[dict], list, Any]
+
 
 def execute_command(
     commands: Union[str, list[str]],
     working_directory: Optional[str] = None,
     split_output: bool = True,
     shell: bool = False,
-    error_filename: str = "pysqa.err",
+    error_filename: Optional[str] = "pysqa.err",
 ) -> Union[str, list[str], None]:
     """
     A wrapper around the subprocess.check_output function.
@@ -61,7 +87,8 @@ def execute_command(
         working_directory (str, optional): The directory where the command is executed. Defaults to None.
         split_output (bool, optional): Boolean flag to split newlines in the output. Defaults to True.
         shell (bool, optional): Additional switch to convert commands to a single string. Defaults to False.
-        error_filename (str, optional): In case the execution fails, the output is written to this file. Defaults to "pysqa.err".
+        error_filename (str, optional): In case the execution fails, the output is written to this file, None to
+                                        discard the output. Defaults to "pysqa.err".
 
     Returns:
         Union[str, List[str]]: Output of the shell command either as a string or as a list of strings
@@ -77,12 +104,13 @@ def execute_command(
             shell=not isinstance(commands, list),
         )
     except subprocess.CalledProcessError as e:
-        if working_directory is not None:
-            error_file = os.path.join(working_directory, error_filename)
-        else:
-            error_file = error_filename
-        with open(error_file, "w") as f:
-            print(e.stdout, file=f)
+        if error_filename is not None:
+            if working_directory is not None:
+                error_file = os.path.join(working_directory, error_filename)
+            else:
+                error_file = error_filename
+            with open(error_file, "w") as f:
+                print(e.stdout, file=f)
         out = None
     if out is not None and split_output:
         return out.split("\n")
@@ -90,18 +118,119 @@ def execute_command(
         return out
 
 
-def get_queue_commands(queue_type: str) -> Union[SchedulerCommands, None]:
+def split_process_id_list(
+    process_id_lst: list[int], max_length: int = 32768
+) -> list[list[int]]:
+    """
+    Split a list of process IDs into chunks, so the command line arguments of each chunk stay below the argument length
+    limit of the operating system.
+
+    Args:
+        process_id_lst (list[int]): List of process IDs.
+        max_length (int, optional): Maximum number of characters of the process IDs in one chunk. Defaults to 32768.
+
+    Returns:
+        list[list[int]]: List of chunks of process IDs.
+    """
+    chunk_lst: list[list[int]] = []
+    chunk: list[int] = []
+    chunk_length = 0
+    for process_id in process_id_lst:
+        process_id_length = len(str(process_id)) + 1
+        if len(chunk) > 0 and chunk_length + process_id_length > max_length:
+            chunk_lst.append(chunk)
+            chunk, chunk_length = [], 0
+        chunk.append(process_id)
+        chunk_length += process_id_length
+    if len(chunk) > 0:
+        chunk_lst.append(chunk)
+    return chunk_lst
+
+
+def run_command_plan(plan: CommandPlan, execute_command: Callable) -> Any:
+    """
+    Execute a command plan. The command plans separate the logic of the queue adapter from the execution of the
+    commands, so the same command plans are executed synchronously by the QueueAdapterCore and with asyncio subprocesses
+    by the AsyncQueueAdapter.
+
+    Args:
+        plan (CommandPlan): The command plan.
+        execute_command (Callable): Function to execute a single command, called with the keyword arguments yielded by
+                                    the command plan.
+
+    Returns:
+        object: The result of the command plan.
+    """
+    try:
+        command_lst = next(plan)
+        while True:
+            command_lst = plan.send(
+                [execute_command(**command_kwargs) for command_kwargs in command_lst]
+            )
+    except StopIteration as stop:
+        return stop.value
+
+
+def get_delete_output_per_job(
+    output: Optional[str],
+    process_id_lst: list[int],
+    cluster_queue_id_lst: Optional[list[int]] = None,
+) -> list[Union[str, None]]:
+    """
+    Assign the output of a delete command, which deleted multiple jobs, to the individual jobs. Each job is assigned the
+    first line of the output which contains its ID or the first line of the output if no line mentions the ID.
+
+    Args:
+        output (str/None): The output of the delete command, None if the command failed.
+        process_id_lst (list[int]): List of process IDs.
+        cluster_queue_id_lst (list[int], optional): The IDs used by the queuing system if they differ from the process
+                                                    IDs. Defaults to None.
+
+    Returns:
+        list: The output for each process ID.
+    """
+    if output is None:
+        return [None] * len(process_id_lst)
+    if cluster_queue_id_lst is None:
+        cluster_queue_id_lst = process_id_lst
+    line_lst = output.split("\n")
+    line_dict: dict[str, str] = {}
+    for line in line_lst:
+        for number in re.findall(r"\d+", line):
+            line_dict.setdefault(number, line)
+    return [
+        line_dict.get(str(queue_id), line_lst[0]) for queue_id in cluster_queue_id_lst
+    ]
+
+
+def get_queue_commands(
+    queue_type: str, status_format: str = "text"
+) -> Union[SchedulerCommands, None]:
     """
     Load queuing system commands class
 
     Args:
         queue_type (str): Type of the queuing system in capital letters
+        status_format (str): Output format of the queue status command, either "text" or "json". Defaults to "text".
 
     Returns:
         SchedulerCommands: queuing system commands class instance
     """
     if queue_type in queue_type_dict:
-        class_name = queue_type_dict[queue_type]["class_name"]
+        if status_format == "text":
+            class_name = queue_type_dict[queue_type]["class_name"]
+        elif (
+            status_format == "json" and "json_class_name" in queue_type_dict[queue_type]
+        ):
+            class_name = queue_type_dict[queue_type]["json_class_name"]
+        else:
+            raise ValueError(
+                "The status_format "
+                + status_format
+                + " is not supported for the queue_type "
+                + queue_type
+                + "."
+            )
         module_name = queue_type_dict[queue_type]["module_name"]
         if module_name is not None and class_name is not None:
             return getattr(importlib.import_module(module_name), class_name)()
@@ -124,20 +253,101 @@ class QueueAdapterCore(QueueAdapterAbstractClass):
     Args:
         queue_type (str): Type of the queuing system in capital letters
         execute_command (funct): Function to execute commands.
+        status_cache_ttl (float): Time to live of the cached queue status in seconds, zero disables the cache.
+        status_format (str): Output format of the queue status command, either "text" or "json".
+        accounting (bool): Resolve the final state of jobs which left the queue with the accounting of the queuing
+                           system.
     """
 
     def __init__(
         self,
         queue_type: str,
         execute_command: Callable = execute_command,
+        status_cache_ttl: float = 0.0,
+        status_format: str = "text",
+        accounting: bool = False,
     ):
-        self._commands = get_queue_commands(queue_type=queue_type)
+        self._commands = get_queue_commands(
+            queue_type=queue_type, status_format=status_format
+        )
         module_name = queue_type_dict[queue_type]["module_name"]
         if module_name is not None:
             self._submission_template = importlib.import_module(module_name).template
         else:
             self._submission_template = None
         self._execute_command_function = execute_command
+        self._status_cache = StatusCache(ttl=status_cache_ttl)
+        self._array_job_dict: dict[int, str] = {}
+        self._accounting = accounting
+        self._terminal_status_dict: dict[int, str] = {}
+
+    @property
+    def supports_dependencies(self) -> bool:
+        """
+        Check if the queuing system supports job dependencies, which are required to submit workflows.
+
+        Returns:
+            bool: True if job dependencies are supported.
+        """
+        return self._commands is not None and self._commands.supports_dependencies
+
+    @property
+    def supports_array_jobs(self) -> bool:
+        """
+        Check if the queuing system supports job arrays and the task manifests written by the queue adapter are
+        available on the file system of the queuing system.
+
+        Returns:
+            bool: True if job arrays are supported.
+        """
+        return self._commands is not None and self._commands.supports_array_jobs
+
+    @property
+    def supports_packed_jobs(self) -> bool:
+        """
+        Check if tasks can be packed into jobs, which requires the task manifests written by the queue adapter to be
+        available on the file system of the queuing system.
+
+        Returns:
+            bool: True if packed jobs are supported.
+        """
+        return self._commands is not None
+
+    @property
+    def status_cache_ttl(self) -> float:
+        """
+        Get the time to live of the cached queue status in seconds.
+
+        Returns:
+            float: The time to live in seconds.
+        """
+        return self._status_cache.ttl
+
+    @status_cache_ttl.setter
+    def status_cache_ttl(self, ttl: float):
+        """
+        Set the time to live of the cached queue status in seconds.
+
+        Args:
+            ttl (float): The time to live in seconds, zero disables the cache.
+        """
+        self._status_cache.ttl = ttl
+
+    @property
+    def status_cache_info(self) -> dict:
+        """
+        Get the hit and miss counters of the cached queue status.
+
+        Returns:
+            dict: Dictionary with the keys "hits", "misses" and "ttl".
+        """
+        return self._status_cache.info()
+
+    def clear_status_cache(self):
+        """
+        Invalidate the cached queue status, so the next status lookup queries the queuing system.
+        """
+        self._status_cache.clear()
 
     def submit_job(
         self,
@@ -149,7 +359,7 @@ class QueueAdapterCore(QueueAdapterAbstractClass):
         run_time_max: Optional[int] = None,
         dependency_list: Optional[list[int]] = None,
         command: str = "",
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         **kwargs,
     ) -> Union[int, None]:
         """
@@ -168,159 +378,1118 @@ class QueueAdapterCore(QueueAdapterAbstractClass):
         Returns:
             int: The job ID.
         """
-        if working_directory is not None and " " in working_directory:
-            raise ValueError(
-                "Whitespaces in the working_directory name are not supported!"
+        return self._run_command_plan(
+            plan=self.plan_submit_job(
+                queue=queue,
+                job_name=job_name,
+                working_directory=working_directory,
+                cores=cores,
+                memory_max=memory_max,
+                run_time_max=run_time_max,
+                dependency_list=dependency_list,
+                command=command,
+                submission_template=submission_template,
+                **kwargs,
             )
-        if submission_template is None:
-            submission_template = self._submission_template
-        working_directory, queue_script_path = self._write_queue_script(
+        )
+
+    def plan_submit_job(
+        self,
+        queue: Optional[str] = None,
+        job_name: str = "pysqa",
+        working_directory: Optional[str] = None,
+        cores: int = 1,
+        memory_max: Optional[Union[int, str]] = None,
+        run_time_max: Optional[int] = None,
+        dependency_list: Optional[list[int]] = None,
+        command: str = "",
+        submission_template: Optional[Union[str, "Template"]] = None,
+        **kwargs,
+    ) -> CommandPlan:
+        """
+        Command plan of submit_job(), the submission script is written when the command plan is started.
+
+        Args:
+            queue (str/None): The queue to submit the job to.
+            job_name (str/None): The name of the job.
+            working_directory (str/None): The working directory for the job.
+            cores (int/None): The number of cores required for the job.
+            memory_max (int/None): The maximum memory required for the job.
+            run_time_max (int/None): The maximum run time for the job.
+            dependency_list (list[str]/None): List of job dependencies.
+            command (str): The command to execute for the job.
+
+        Returns:
+            CommandPlan: Command plan which returns the job ID.
+        """
+        working_directory, commands = self.prepare_job_submission(
             queue=queue,
             job_name=job_name,
             working_directory=working_directory,
             cores=cores,
             memory_max=memory_max,
             run_time_max=run_time_max,
-            command=command,
             dependency_list=dependency_list,
+            command=command,
             submission_template=submission_template,
             **kwargs,
         )
-        out = self._execute_command(
-            commands=self._list_command_to_be_executed(
-                queue_script_path=queue_script_path
-            ),
-            working_directory=working_directory,
-            split_output=False,
-        )
+        (out,) = yield [
+            {
+                "commands": commands,
+                "working_directory": working_directory,
+                "split_output": False,
+            }
+        ]
+        self._status_cache.clear()
         if out is not None and self._commands is not None:
             return self._commands.get_job_id_from_output(out)
         else:
             return None
 
-    def enable_reservation(self, process_id: int):
+    def submit_jobs(
+        self, job_spec_lst: list[dict], max_workers: int = 8
+    ) -> list[Union[int, None, Exception]]:
         """
-        Enable reservation for a process.
+        Submit multiple jobs to the queue. The submission scripts are rendered, written and submitted in a thread pool,
+        so the queuing system commands of multiple jobs are executed in parallel.
 
         Args:
-            process_id (int): The process ID.
+            job_spec_lst (list[dict]): List of job specifications, each one a dictionary of keyword arguments for
+                                       submit_job().
+            max_workers (int): Maximum number of jobs which are submitted at the same time. Defaults to 8.
 
         Returns:
-            str: The result of the enable reservation command.
+            list: The job IDs in the order of the job specifications. If the submission of a job fails, the exception is
+                  returned at the position of the job instead of aborting the submission of the remaining jobs.
         """
-        if self._commands is not None:
-            out = self._execute_command(
-                commands=self._commands.enable_reservation_command + [str(process_id)],
-                split_output=True,
+        if len(job_spec_lst) == 0:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(job_spec_lst)))
+        ) as executor:
+            future_lst = [
+                executor.submit(self.submit_job, **job_spec)
+                for job_spec in job_spec_lst
+            ]
+        result_lst: list[Union[int, None, Exception]] = []
+        for future in future_lst:
+            try:
+                result_lst.append(future.result())
+            except Exception as error:
+                result_lst.append(error)
+        return result_lst
+
+    def submit_workflow(
+        self,
+        job_spec_dict: dict[Hashable, dict],
+        dependency_dict: Optional[dict[Hashable, list]] = None,
+        max_workers: int = 8,
+    ) -> dict[Hashable, Union[int, None, Exception]]:
+        """
+        Submit a workflow of jobs. The jobs are sorted into topological levels, the jobs of each level are submitted in
+        parallel and the job IDs of the upstream jobs are added to the dependency_list of the downstream jobs.
+
+        Args:
+            job_spec_dict (dict): Dictionary of nodes and their job specification, each one a dictionary of keyword
+                                  arguments for submit_job().
+            dependency_dict (dict/None): Dictionary of nodes and the list of nodes they depend on.
+            max_workers (int): Maximum number of jobs which are submitted at the same time. Defaults to 8.
+
+        Returns:
+            dict: Dictionary of nodes and their job IDs. For failed submissions the exception is returned instead of
+                  the job ID and the downstream jobs of a failed submission are not submitted.
+        """
+        return submit_workflow(
+            submit_jobs=functools.partial(self.submit_jobs, max_workers=max_workers),
+            job_spec_dict=job_spec_dict,
+            dependency_dict=dependency_dict,
+            supports_dependencies=self.supports_dependencies,
+        )
+
+    def submit_array_job(
+        self,
+        working_directory_lst: list[str],
+        command_lst: list[str],
+        queue: Optional[str] = None,
+        job_name: str = "pysqa",
+        working_directory: Optional[str] = None,
+        cores: int = 1,
+        memory_max: Optional[Union[int, str]] = None,
+        run_time_max: Optional[int] = None,
+        dependency_list: Optional[list[int]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
+        **kwargs,
+    ) -> Union[int, None]:
+        """
+        Submit a job array to the queue. The tasks are written to a task manifest in the working directory of the job
+        array and each array task executes the task with the matching index, so a parameter sweep requires a single
+        submission instead of one submission per task.
+
+        Args:
+            working_directory_lst (list[str]): The working directories of the tasks.
+            command_lst (list[str]): The commands of the tasks.
+            queue (str/None): The queue to submit the job array to.
+            job_name (str/None): The name of the job array.
+            working_directory (str/None): The working directory for the task manifest and the submission script.
+            cores (int/None): The number of cores required for each task.
+            memory_max (int/None): The maximum memory required for each task.
+            run_time_max (int/None): The maximum run time for each task.
+            dependency_list (list[str]/None): List of job dependencies.
+
+        Returns:
+            int: The job ID of the job array.
+        """
+        if len(working_directory_lst) != len(command_lst):
+            raise ValueError(
+                "The number of working directories "
+                + str(len(working_directory_lst))
+                + " does not match the number of commands "
+                + str(len(command_lst))
+                + "."
             )
-            if out is not None:
-                return out[0]
-        return None
+        if len(command_lst) == 0:
+            raise ValueError("A job array requires at least one task.")
+        if self._commands is None or not self.supports_array_jobs:
+            raise NotImplementedError(
+                "The "
+                + self.__class__.__name__
+                + " does not support job arrays, either the queuing system provides no job arrays or the task "
+                + "manifest is written to the local file system."
+            )
+        if working_directory is None:
+            working_directory = "."
+        working_directory = os.path.abspath(os.path.expanduser(working_directory))
+        manifest_path = write_task_manifest(
+            working_directory=working_directory,
+            task_lst=list(zip(working_directory_lst, command_lst)),
+        )
+        process_id = self.submit_job(
+            queue=queue,
+            job_name=job_name,
+            working_directory=working_directory,
+            cores=cores,
+            memory_max=memory_max,
+            run_time_max=run_time_max,
+            dependency_list=dependency_list,
+            command=self._commands.get_array_task_command(
+                manifest_path=manifest_path, array_size=len(command_lst)
+            ),
+            submission_template=submission_template,
+            array_size=len(command_lst),
+            **kwargs,
+        )
+        if process_id is not None:
+            self._array_job_dict[process_id] = working_directory
+        return process_id
 
-    def delete_job(self, process_id: int) -> Union[str, None]:
+    def submit_packed_jobs(
+        self,
+        working_directory_lst: list[str],
+        command_lst: list[str],
+        queue: Optional[str] = None,
+        job_name: str = "pysqa",
+        working_directory: Optional[str] = None,
+        cores: Optional[int] = None,
+        task_cores: int = 1,
+        task_run_time: Optional[int] = None,
+        memory_max: Optional[Union[int, str]] = None,
+        run_time_max: Optional[int] = None,
+        dependency_list: Optional[list[int]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> list[Union[int, None, Exception]]:
         """
-        Delete a job.
+        Submit many short tasks packed into a small number of jobs. Each job runs a pack of tasks, with cores //
+        task_cores tasks running at the same time, so the overhead of the queuing system is paid once per pack rather
+        than once per task. The tasks of each pack are written to a task manifest in the pack_<n> subdirectory of the
+        working directory, which records the exit code of each task, so the status of the tasks is available from
+        get_status_of_array_job() for the job ID of each pack.
 
         Args:
-            process_id (int): The process ID.
+            working_directory_lst (list[str]): The working directories of the tasks.
+            command_lst (list[str]): The commands of the tasks.
+            queue (str/None): The queue to submit the jobs to.
+            job_name (str): The name of the jobs.
+            working_directory (str/None): The working directory for the task manifests and the submission scripts.
+            cores (int/None): The number of cores of each job, defaults to the maximum number of cores of the queue.
+            task_cores (int): The number of cores of each task. Defaults to 1.
+            task_run_time (int/None): The expected run time of each task in seconds, used to fit multiple rounds of
+                                      tasks into the run time of a job.
+            memory_max (int/None): The maximum memory of each job.
+            run_time_max (int/None): The maximum run time of each job, defaults to the maximum run time of the queue.
+            dependency_list (list[str]/None): List of job dependencies.
+            max_workers (int): Maximum number of jobs which are submitted at the same time. Defaults to 8.
 
         Returns:
-            str: The result of the delete job command.
+            list: The job IDs of the packs in the order of the tasks, for failed submissions the exception is returned
+                  instead of the job ID.
         """
-        if self._commands is not None:
-            out = self._execute_command(
-                commands=self._commands.delete_job_command + [str(process_id)],
-                split_output=True,
+        if len(working_directory_lst) != len(command_lst):
+            raise ValueError(
+                "The number of working directories "
+                + str(len(working_directory_lst))
+                + " does not match the number of commands "
+                + str(len(command_lst))
+                + "."
             )
-            if out is not None:
-                return out[0]
-        return None
+        if len(command_lst) == 0:
+            raise ValueError("Packing tasks requires at least one task.")
+        if not self.supports_packed_jobs:
+            raise NotImplementedError(
+                "The "
+                + self.__class__.__name__
+                + " does not support packed jobs, as the task manifests are written to the local file system."
+            )
+        if working_directory is None:
+            working_directory = "."
+        working_directory = os.path.abspath(os.path.expanduser(working_directory))
+        cores, run_time_max = self._get_pack_resources(
+            queue=queue, cores=cores, run_time_max=run_time_max
+        )
+        pack_size = get_pack_size(
+            cores=cores,
+            task_cores=task_cores,
+            run_time_max=run_time_max,
+            task_run_time=task_run_time,
+        )
+        task_lst = list(zip(working_directory_lst, command_lst))
+        job_spec_lst = []
+        for pack_index, start in enumerate(range(0, len(task_lst), pack_size), start=1):
+            pack_directory = os.path.join(working_directory, "pack_" + str(pack_index))
+            pack_task_lst = task_lst[start : start + pack_size]
+            job_spec_lst.append(
+                {
+                    "queue": queue,
+                    "job_name": job_name,
+                    "working_directory": pack_directory,
+                    "cores": cores,
+                    "memory_max": memory_max,
+                    "run_time_max": run_time_max,
+                    "dependency_list": dependency_list,
+                    "command": get_packed_task_command(
+                        manifest_path=write_task_manifest(
+                            working_directory=pack_directory, task_lst=pack_task_lst
+                        ),
+                        task_count=len(pack_task_lst),
+                        parallel_task_count=cores // max(1, task_cores),
+                    ),
+                    "submission_template": submission_template,
+                    **kwargs,
+                }
+            )
+        process_id_lst = self.submit_jobs(
+            job_spec_lst=job_spec_lst, max_workers=max_workers
+        )
+        for process_id, job_spec in zip(process_id_lst, job_spec_lst):
+            if isinstance(process_id, int):
+                self._array_job_dict[process_id] = job_spec["working_directory"]
+        return process_id_lst
 
-    def get_queue_status(
-        self, user: Optional[str] = None
-    ) -> Union[pandas.DataFrame, None]:
+    def get_status_of_packed_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> list[str]:
         """
-        Get the status of the queue.
+        Get the status of the individual tasks of packed jobs, the status of all packs is requested with a single
+        status query.
 
         Args:
-            user (str): The user to filter the queue status for.
+            process_id_lst (list[int]): The job IDs of the packs returned by submit_packed_jobs().
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
 
         Returns:
-            pandas.DataFrame: The queue status.
+            list[str]: List of task statuses in the order of the tasks.
         """
-        if self._commands is not None:
-            out = self._execute_command(
-                commands=self._commands.get_queue_status_command, split_output=False
+        for process_id in process_id_lst:
+            if process_id not in self._array_job_dict:
+                raise ValueError(
+                    "The working directory of the packed job "
+                    + str(process_id)
+                    + " is unknown."
+                )
+        status_lst = []
+        for process_id, job_status in zip(
+            process_id_lst,
+            self.get_status_of_jobs(process_id_lst=process_id_lst, refresh=refresh),
+        ):
+            status_lst += get_task_status_lst(
+                working_directory=self._array_job_dict[process_id],
+                job_status=job_status,
             )
-            df = self._commands.convert_queue_status(queue_status_output=out)
-            if user is None:
-                return df
-            else:
-                return df[df["user"] == user]
-        else:
-            return None
+        return status_lst
 
-    def get_status_of_my_jobs(self) -> pandas.DataFrame:
+    def get_status_of_array_job(
+        self,
+        process_id: int,
+        working_directory: Optional[str] = None,
+        refresh: bool = False,
+    ) -> list[str]:
         """
-        Get the status of the user's jobs.
+        Get the status of the individual tasks of a job array. The status of a task is derived from the status of the
+        job array in the queue and the status files written by the task manifest.
+
+        Args:
+            process_id (int): The job ID of the job array.
+            working_directory (str/None): The working directory of the job array, only required for job arrays which
+                                          were not submitted by this queue adapter.
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
 
         Returns:
-            pandas.DataFrame: The status of the user's jobs.
+            list[str]: List of task statuses in the order of the tasks.
         """
-        return self.get_queue_status(user=self._get_user())
+        if working_directory is None:
+            if process_id not in self._array_job_dict:
+                raise ValueError(
+                    "The working directory of the job array "
+                    + str(process_id)
+                    + " is unknown."
+                )
+            working_directory = self._array_job_dict[process_id]
+        return get_task_status_lst(
+            working_directory=working_directory,
+            job_status=self.get_status_of_job(process_id=process_id, refresh=refresh),
+        )
 
-    def get_status_of_job(self, process_id: int) -> Union[str, None]:
+    def enable_reservation(self, process_id: int):
         """
-        Get the status of a job.
+        Enable reservation for a process.
 
         Args:
             process_id (int): The process ID.
 
         Returns:
-            str: The status of the job.
+            str: The result of the enable reservation command.
+        """
+        return self._run_command_plan(
+            plan=self.plan_enable_reservation(process_id=process_id)
+        )
+
+    def plan_enable_reservation(self, process_id: int) -> CommandPlan:
+        """
+        Command plan of enable_reservation().
+
+        Args:
+            process_id (int): The process ID.
+
+        Returns:
+            CommandPlan: Command plan which returns the result of the enable reservation command.
         """
-        df = self.get_queue_status()
-        if df is not None:
-            df_selected = df[df["jobid"] == process_id]["status"]
-            if len(df_selected) != 0:
-                return df_selected.values[0]
+        if self._commands is None:
+            return None
+        (out,) = yield [
+            {
+                "commands": self._commands.enable_reservation_command
+                + [str(process_id)],
+                "split_output": True,
+            }
+        ]
+        if out is not None:
+            return out[0]
         return None
 
-    def get_status_of_jobs(self, process_id_lst: list[int]) -> list[str]:
+    def delete_job(self, process_id: int) -> Union[str, None]:
         """
-        Get the status of multiple jobs.
+        Delete a job.
 
         Args:
-            process_id_lst (list[int]): List of process IDs.
+            process_id (int): The process ID.
 
         Returns:
-            list[str]: List of job statuses.
+            str: The result of the delete job command.
         """
-        df = self.get_queue_status()
-        results_lst = []
-        if df is not None:
-            for process_id in process_id_lst:
-                df_selected = df[df["jobid"] == process_id]["status"]
-                if len(df_selected) != 0:
-                    results_lst.append(df_selected.values[0])
-                else:
-                    results_lst.append("finished")
-        return results_lst
+        return self._run_command_plan(plan=self.plan_delete_job(process_id=process_id))
 
-    def _list_command_to_be_executed(self, queue_script_path: str) -> list:
+    def plan_delete_job(self, process_id: int) -> CommandPlan:
         """
-        Get the list of commands to be executed.
+        Command plan of delete_job().
 
         Args:
-            queue_script_path (str): The path to the queue script.
+            process_id (int): The process ID.
 
         Returns:
-            list: The list of commands to be executed.
+            CommandPlan: Command plan which returns the result of the delete job command.
         """
-        if self._commands is not None:
-            return self._commands.submit_job_command + [queue_script_path]
-        else:
+        if self._commands is None:
+            return None
+        (out,) = yield [
+            {
+                "commands": self._commands.delete_job_command + [str(process_id)],
+                "split_output": True,
+            }
+        ]
+        self._status_cache.clear()
+        if out is not None:
+            return out[0]
+        return None
+
+    def delete_jobs(
+        self, process_id_lst: list[int], max_workers: int = 8
+    ) -> list[Union[str, None]]:
+        """
+        Delete multiple jobs. The process IDs are split into chunks below the argument length limit and each chunk is
+        deleted with a single call of the delete command, the chunks are deleted in parallel.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            max_workers (int): Maximum number of delete commands which are executed at the same time. Defaults to 8.
+
+        Returns:
+            list: The output of the delete command for each process ID, None if the delete command failed.
+        """
+        chunk_lst = self._split_delete_jobs(
+            process_id_lst=list(dict.fromkeys(process_id_lst))
+        )
+        if len(chunk_lst) == 0:
             return []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(chunk_lst)))
+        ) as executor:
+            output_lst = list(executor.map(self._delete_job_chunk, chunk_lst))
+        self._status_cache.clear()
+        result_dict = {}
+        for chunk, output in zip(chunk_lst, output_lst):
+            result_dict.update(dict(zip(chunk, output)))
+        return [result_dict[process_id] for process_id in process_id_lst]
+
+    def get_queue_status(
+        self, user: Optional[str] = None
+    ) -> Union["pandas.DataFrame", None]:
+        """
+        Get the status of the queue.
+
+        Args:
+            user (str): The user to filter the queue status for.
+
+        Returns:
+            pandas.DataFrame: The queue status.
+        """
+        return queue_status_to_dataframe(
+            queue_status=self.get_queue_status_dict(user=user)
+        )
+
+    def get_queue_status_dict(
+        self, user: Optional[str] = None
+    ) -> Union[dict[str, list], None]:
+        """
+        Get the status of the queue as dictionary of columns, without converting it to a pandas DataFrame.
+
+        Args:
+            user (str): The user to filter the queue status for.
+
+        Returns:
+            dict[str, list]: The queue status with one list per column.
+        """
+        return self._run_command_plan(plan=self.plan_queue_status_dict(user=user))
+
+    def plan_queue_status_dict(self, user: Optional[str] = None) -> CommandPlan:
+        """
+        Command plan of get_queue_status_dict().
+
+        Args:
+            user (str): The user to filter the queue status for.
+
+        Returns:
+            CommandPlan: Command plan which returns the queue status with one list per column.
+        """
+        queue_status = yield from self._plan_query_queue_status(user=user)
+        if user is None:
+            return queue_status
+        else:
+            return filter_queue_status(
+                queue_status=queue_status, column="user", value=user
+            )
+
+    def get_status_of_my_jobs(self, refresh: bool = False) -> "pandas.DataFrame":
+        """
+        Get the status of the user's jobs.
+
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            pandas.DataFrame: The status of the user's jobs.
+        """
+        return self._run_command_plan(plan=self.plan_status_of_my_jobs(refresh=refresh))
+
+    def plan_status_of_my_jobs(self, refresh: bool = False) -> CommandPlan:
+        """
+        Command plan of get_status_of_my_jobs().
+
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            CommandPlan: Command plan which returns the status of the user's jobs as pandas.DataFrame.
+        """
+        if self._status_cache.ttl > 0:
+            snapshot = yield from self.plan_status_snapshot(refresh=refresh)
+            if snapshot is not None:
+                df = snapshot.df
+                return df[df["user"] == self._get_user()]
+            else:
+                return None
+        else:
+            queue_status = yield from self.plan_queue_status_dict(user=self._get_user())
+            return queue_status_to_dataframe(queue_status=queue_status)
+
+    def get_status_of_job(
+        self, process_id: int, refresh: bool = False
+    ) -> Union[str, None]:
+        """
+        Get the status of a job.
+
+        Args:
+            process_id (int): The process ID.
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            str: The status of the job.
+        """
+        return self._run_command_plan(
+            plan=self.plan_status_of_job(process_id=process_id, refresh=refresh)
+        )
+
+    def plan_status_of_job(self, process_id: int, refresh: bool = False) -> CommandPlan:
+        """
+        Command plan of get_status_of_job().
+
+        Args:
+            process_id (int): The process ID.
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            CommandPlan: Command plan which returns the status of the job.
+        """
+        if process_id in self._terminal_status_dict:
+            return self._terminal_status_dict[process_id]
+        snapshot = yield from self._plan_status_snapshot_of_jobs(
+            process_id_lst=[process_id], refresh=refresh
+        )
+        if snapshot is not None:
+            status = snapshot.lookup(process_id_lst=[process_id], column="status")[0]
+            if status is None:
+                status_dict = yield from self._plan_query_accounting_status(
+                    process_id_lst=[process_id]
+                )
+                status = status_dict.get(process_id)
+            return status
+        return None
+
+    def get_status_of_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> list[Optional[str]]:
+        """
+        Get the status of multiple jobs.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            list[str]: List of job statuses.
+        """
+        return self._run_command_plan(
+            plan=self.plan_status_of_jobs(
+                process_id_lst=process_id_lst, refresh=refresh
+            )
+        )
+
+    def plan_status_of_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> CommandPlan:
+        """
+        Command plan of get_status_of_jobs().
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            CommandPlan: Command plan which returns the list of job statuses.
+        """
+        status_dict = {
+            process_id: self._terminal_status_dict[process_id]
+            for process_id in process_id_lst
+            if process_id in self._terminal_status_dict
+        }
+        query_lst = [
+            process_id
+            for process_id in dict.fromkeys(process_id_lst)
+            if process_id not in status_dict
+        ]
+        if len(query_lst) > 0:
+            snapshot = yield from self._plan_status_snapshot_of_jobs(
+                process_id_lst=query_lst, refresh=refresh
+            )
+            if snapshot is None:
+                return []
+            status_dict.update(
+                zip(query_lst, snapshot.lookup(process_id_lst=query_lst))
+            )
+            accounting_status_dict = yield from self._plan_query_accounting_status(
+                process_id_lst=[
+                    process_id
+                    for process_id in query_lst
+                    if status_dict[process_id] is None
+                ]
+            )
+            status_dict.update(accounting_status_dict)
+        return [
+            status_dict.get(process_id) or "finished" for process_id in process_id_lst
+        ]
+
+    def wait_for_jobs(
+        self,
+        process_id_lst: list[int],
+        timeout: Optional[float] = None,
+        poll_policy: Optional[PollPolicy] = None,
+    ) -> dict[int, str]:
+        """
+        Wait until all jobs reached a terminal status. The status of all jobs is requested with a single query per poll
+        and the poll interval adapts to the changes of the job status.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            timeout (float/None): Maximum time to wait in seconds, None to wait without limit. Defaults to None.
+            poll_policy (PollPolicy/None): Policy for the poll interval. Defaults to PollPolicy().
+
+        Returns:
+            dict[int, str]: Dictionary of the process IDs and their terminal status.
+        """
+        return wait_for_jobs(
+            status_function=self.get_status_of_jobs,
+            process_id_lst=process_id_lst,
+            timeout=timeout,
+            poll_policy=poll_policy,
+        )
+
+    def iter_wait_for_jobs(
+        self,
+        process_id_lst: list[int],
+        timeout: Optional[float] = None,
+        poll_policy: Optional[PollPolicy] = None,
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Wait for jobs and yield each job as soon as it reached a terminal status.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            timeout (float/None): Maximum time to wait in seconds, None to wait without limit. Defaults to None.
+            poll_policy (PollPolicy/None): Policy for the poll interval. Defaults to PollPolicy().
+
+        Returns:
+            Iterator[tuple[int, str]]: The process ID and the terminal status of each job.
+        """
+        return iter_wait_for_jobs(
+            status_function=self.get_status_of_jobs,
+            process_id_lst=process_id_lst,
+            timeout=timeout,
+            poll_policy=poll_policy,
+        )
+
+    def get_status_snapshot(self, refresh: bool = False) -> Union[StatusSnapshot, None]:
+        """
+        Get a snapshot of the queue status indexed by the job ID. The snapshot is shared by all status lookups and the
+        queuing system is only queried when the cached snapshot expired.
+
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            StatusSnapshot: The snapshot of the queue status.
+        """
+        return self._status_cache.get(
+            function=self._create_status_snapshot, refresh=refresh
+        )
+
+    def plan_status_snapshot(self, refresh: bool = False) -> CommandPlan:
+        """
+        Command plan of get_status_snapshot(). In contrast to get_status_snapshot() concurrent callers are not
+        serialized while the queuing system is queried, as the command plan is executed in multiple steps.
+
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            CommandPlan: Command plan which returns the snapshot of the queue status.
+        """
+        if not refresh:
+            snapshot = self._status_cache.peek()
+            if snapshot is not None:
+                return snapshot
+        queue_status = yield from self._plan_query_queue_status()
+        if queue_status is None:
+            return None
+        snapshot = self._new_status_snapshot(queue_status=queue_status)
+        self._status_cache.store(snapshot)
+        return snapshot
+
+    def _split_delete_jobs(self, process_id_lst: list[int]) -> list[list[int]]:
+        """
+        Split the process IDs into chunks which are deleted with a single call of the delete command.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            list[list[int]]: List of chunks of process IDs.
+        """
+        return split_process_id_list(process_id_lst=process_id_lst)
+
+    def _delete_job_chunk(self, process_id_lst: list[int]) -> list[Union[str, None]]:
+        """
+        Delete a chunk of jobs with a single call of the delete command.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            list: The output of the delete command for each process ID.
+        """
+        if self._commands is None:
+            return [None] * len(process_id_lst)
+        out = self._execute_command(
+            commands=self._commands.delete_job_command
+            + [str(process_id) for process_id in process_id_lst],
+            split_output=False,
+        )
+        return get_delete_output_per_job(output=out, process_id_lst=process_id_lst)
+
+    def _plan_status_snapshot_of_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> CommandPlan:
+        """
+        Command plan for a snapshot of the queue status which contains at least the given jobs. When the status cache is
+        enabled the shared snapshot of the whole queue is used, otherwise the queuing system is only queried for the
+        given jobs.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            CommandPlan: Command plan which returns the snapshot of the queue status.
+        """
+        if self._status_cache.ttl > 0:
+            return (yield from self.plan_status_snapshot(refresh=refresh))
+        queue_status = yield from self._plan_query_queue_status(
+            process_id_lst=process_id_lst
+        )
+        if queue_status is not None:
+            return self._new_status_snapshot(queue_status=queue_status)
+        else:
+            return None
+
+    def _plan_query_accounting_status(self, process_id_lst: list[int]) -> CommandPlan:
+        """
+        Command plan which queries the accounting of the queuing system for jobs which are no longer in the queue. The
+        process IDs are resolved with as few accounting commands as the queuing system supports and the terminal states
+        are cached permanently, as they do not change anymore.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            CommandPlan: Command plan which returns the dictionary of the process IDs found in the accounting and their
+                         status.
+        """
+        if not self._accounting or len(process_id_lst) == 0:
+            return {}
+        out_lst = yield [
+            {"commands": commands, "split_output": False}
+            for commands in self._get_accounting_command_lst(
+                process_id_lst=process_id_lst
+            )
+        ]
+        return self._cache_terminal_status(
+            status_dict=self._convert_accounting_output_lst(out_lst=out_lst)
+        )
+
+    def _get_accounting_command_lst(self, process_id_lst: list[int]) -> list[list[str]]:
+        """
+        Get the accounting commands for a list of process IDs, long lists of process IDs are split into multiple
+        commands to respect the argument length limit.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            list[list[str]]: List of accounting commands.
+        """
+        if self._commands is None:
+            return []
+        return [
+            commands
+            for chunk in split_process_id_list(
+                process_id_lst=list(dict.fromkeys(process_id_lst))
+            )
+            for commands in self._commands.get_accounting_commands(process_id_lst=chunk)
+        ]
+
+    def _convert_accounting_output_lst(
+        self, out_lst: list[Optional[str]]
+    ) -> dict[int, str]:
+        """
+        Convert the output of the accounting commands to the status of the individual jobs.
+
+        Args:
+            out_lst (list[str]): List of outputs of the accounting commands, None for failed commands.
+
+        Returns:
+            dict[int, str]: Dictionary of the process IDs and their status.
+        """
+        status_dict: dict[int, str] = {}
+        if self._commands is None:
+            return status_dict
+        for out in out_lst:
+            if out is not None:
+                status_dict.update(
+                    self._commands.convert_accounting_status(accounting_output=out)
+                )
+        return status_dict
+
+    def _cache_terminal_status(self, status_dict: dict[int, str]) -> dict[int, str]:
+        """
+        Cache the terminal states of the jobs permanently, as they do not change anymore.
+
+        Args:
+            status_dict (dict[int, str]): Dictionary of the process IDs and their status.
+
+        Returns:
+            dict[int, str]: The unchanged dictionary of the process IDs and their status.
+        """
+        self._terminal_status_dict.update(
+            {
+                process_id: status
+                for process_id, status in status_dict.items()
+                if status in terminal_status_tuple
+            }
+        )
+        return status_dict
+
+    def _plan_query_queue_status(
+        self,
+        user: Optional[str] = None,
+        process_id_lst: Optional[list[int]] = None,
+    ) -> CommandPlan:
+        """
+        Command plan which queries the queuing system for the queue status using the narrowest status command the
+        queuing system supports. The result can contain additional jobs, when a filter is not supported by the queuing
+        system. Some queuing systems reject a filtered query if one of the jobs is no longer known, so a failed filtered
+        query is repeated without the process ID filter. If the queue status cannot be queried None is returned, so a
+        failure of the queuing system is not mistaken for jobs which left the queue.
+
+        Args:
+            user (str, optional): Restrict the query to the jobs of this user. Defaults to None.
+            process_id_lst (list[int], optional): Restrict the query to these process IDs. Defaults to None.
+
+        Returns:
+            CommandPlan: Command plan which returns the queue status as dictionary of columns.
+        """
+        if self._commands is None:
+            return None
+        command_lst = self._get_queue_status_command_lst(
+            user=user, process_id_lst=process_id_lst
+        )
+        command_unfiltered_lst = self._get_queue_status_command_lst(user=user)
+        if command_lst != command_unfiltered_lst:
+            out_lst = yield [
+                {"commands": commands, "split_output": False, "error_filename": None}
+                for commands in command_lst
+            ]
+            if None not in out_lst:
+                return self._convert_queue_status_output_lst(out_lst=out_lst)
+        # The filtered query was rejected, which happens when one of the jobs is no longer known to the queuing system,
+        # or no filter is supported, so the queue status is queried without the process ID filter.
+        out_lst = yield [
+            {"commands": commands, "split_output": False}
+            for commands in command_unfiltered_lst
+        ]
+        if None in out_lst:
+            return None
+        return self._convert_queue_status_output_lst(out_lst=out_lst)
+
+    def _get_queue_status_command_lst(
+        self,
+        user: Optional[str] = None,
+        process_id_lst: Optional[list[int]] = None,
+    ) -> list[list[str]]:
+        """
+        Get the queue status commands restricted to a user and a list of process IDs. Long lists of process IDs are
+        split into multiple commands to respect the argument length limit.
+
+        Args:
+            user (str, optional): Restrict the query to the jobs of this user. Defaults to None.
+            process_id_lst (list[int], optional): Restrict the query to these process IDs. Defaults to None.
+
+        Returns:
+            list[list[str]]: List of queue status commands.
+        """
+        if self._commands is None:
+            return []
+        commands = self._commands.get_queue_status_command
+        if user is not None:
+            user_arguments = self._commands.get_user_filter_arguments(user=user)
+            if user_arguments is not None:
+                commands = commands + user_arguments
+        if (
+            process_id_lst is not None
+            and len(process_id_lst) > 0
+            and self._commands.get_job_filter_arguments(
+                process_id_lst=process_id_lst[:1]
+            )
+            is not None
+        ):
+            return [
+                commands
+                + (self._commands.get_job_filter_arguments(process_id_lst=chunk) or [])
+                for chunk in split_process_id_list(
+                    process_id_lst=list(dict.fromkeys(process_id_lst))
+                )
+            ]
+        else:
+            return [commands]
+
+    def _convert_queue_status_output_lst(
+        self, out_lst: list[str]
+    ) -> Union[dict[str, list], None]:
+        """
+        Convert the output of one or more queue status commands to a single dictionary of columns.
+
+        Args:
+            out_lst (list[str]): List of outputs of the queue status commands.
+
+        Returns:
+            dict[str, list]: The queue status as dictionary of columns.
+        """
+        if self._commands is None:
+            return None
+        return concat_queue_status(
+            queue_status_lst=[
+                self._commands.convert_queue_status_to_dict(queue_status_output=out)
+                for out in out_lst
+            ]
+        )
+
+    def _create_status_snapshot(self) -> Union[StatusSnapshot, None]:
+        """
+        Query the queuing system and create a new snapshot of the queue status.
+
+        Returns:
+            StatusSnapshot: The snapshot of the queue status.
+        """
+        queue_status = self.get_queue_status_dict()
+        if queue_status is not None:
+            return self._new_status_snapshot(queue_status=queue_status)
+        else:
+            return None
+
+    def _new_status_snapshot(self, queue_status: dict[str, list]) -> StatusSnapshot:
+        """
+        Create a snapshot from the queue status returned by the queuing system.
+
+        Args:
+            queue_status (dict[str, list]): The queue status as dictionary of columns.
+
+        Returns:
+            StatusSnapshot: The snapshot of the queue status.
+        """
+        return StatusSnapshot(queue_status=queue_status)
+
+    def prepare_job_submission(
+        self,
+        queue: Optional[str] = None,
+        job_name: str = "pysqa",
+        working_directory: Optional[str] = None,
+        cores: int = 1,
+        memory_max: Optional[Union[int, str]] = None,
+        run_time_max: Optional[int] = None,
+        dependency_list: Optional[list[int]] = None,
+        command: str = "",
+        submission_template: Optional[Union[str, "Template"]] = None,
+        **kwargs,
+    ) -> tuple[str, list[str]]:
+        """
+        Write the queue script and return the command to submit it, this is the first step of plan_submit_job().
+
+        Args:
+            queue (str/None): The queue to submit the job to.
+            job_name (str/None): The name of the job.
+            working_directory (str/None): The working directory for the job.
+            cores (int/None): The number of cores required for the job.
+            memory_max (int/None): The maximum memory required for the job.
+            run_time_max (int/None): The maximum run time for the job.
+            dependency_list (list[str]/None): List of job dependencies.
+            command (str): The command to execute for the job.
+
+        Returns:
+            Tuple[str, list[str]]: The working directory and the submission command.
+        """
+        if working_directory is not None and " " in working_directory:
+            raise ValueError(
+                "Whitespaces in the working_directory name are not supported!"
+            )
+        if submission_template is None:
+            submission_template = self._submission_template
+        working_directory, queue_script_path = self._write_queue_script(
+            queue=queue,
+            job_name=job_name,
+            working_directory=working_directory,
+            cores=cores,
+            memory_max=memory_max,
+            run_time_max=run_time_max,
+            command=command,
+            dependency_list=dependency_list,
+            submission_template=submission_template,
+            **kwargs,
+        )
+        return working_directory, self._list_command_to_be_executed(
+            queue_script_path=queue_script_path
+        )
+
+    def _get_pack_resources(
+        self, queue: Optional[str], cores: Optional[int], run_time_max: Optional[int]
+    ) -> tuple[int, Optional[int]]:
+        """
+        Get the number of cores and the run time of the jobs of packed tasks.
+
+        Args:
+            queue (str/None): The queue name.
+            cores (int/None): The requested number of cores.
+            run_time_max (int/None): The requested maximum run time.
+
+        Returns:
+            tuple[int, int/None]: The number of cores and the maximum run time.
+        """
+        return (cores if cores is not None else 1), run_time_max
+
+    def _list_command_to_be_executed(self, queue_script_path: str) -> list:
+        """
+        Get the list of commands to be executed.
+
+        Args:
+            queue_script_path (str): The path to the queue script.
+
+        Returns:
+            list: The list of commands to be executed.
+        """
+        if self._commands is not None:
+            return self._commands.submit_job_command + [queue_script_path]
+        else:
+            return []
+
+    def _run_command_plan(self, plan: CommandPlan) -> Any:
+        """
+        Execute a command plan with the execute_command function of the queue adapter.
+
+        Args:
+            plan (CommandPlan): The command plan.
+
+        Returns:
+            object: The result of the command plan.
+        """
+        return run_command_plan(plan=plan, execute_command=self._execute_command)
 
     def _execute_command(
         self,
@@ -328,7 +1497,7 @@ class QueueAdapterCore(QueueAdapterAbstractClass):
         working_directory: Optional[str] = None,
         split_output: bool = True,
         shell: bool = False,
-        error_filename: str = "pysqa.err",
+        error_filename: Optional[str] = "pysqa.err",
     ) -> str:
         """
         Execute a command or a list of commands.
@@ -338,7 +1507,8 @@ class QueueAdapterCore(QueueAdapterAbstractClass):
             working_directory (Optional[str], optional): The working directory. Defaults to None.
             split_output (bool, optional): Whether to split the output into lines. Defaults to True.
             shell (bool, optional): Whether to use the shell to execute the command. Defaults to False.
-            error_filename (str, optional): The name of the error file. Defaults to "pysqa.err".
+            error_filename (str, optional): The name of the error file, None to discard the error output. Defaults to
+                                            "pysqa.err".
 
         Returns:
             str: The output of the command(s).
@@ -354,7 +1524,7 @@ class QueueAdapterCore(QueueAdapterAbstractClass):
     def _write_queue_script(
         self,
         queue: Optional[str] = None,
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         job_name: str = "pysqa",
         working_directory: Optional[str] = None,
         cores: int = 1,
@@ -405,7 +1575,7 @@ class QueueAdapterCore(QueueAdapterAbstractClass):
     def _job_submission_template(
         self,
         queue: Optional[str] = None,
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         job_name: str = "pysqa",
         working_directory: str = ".",
         cores: int = 1,
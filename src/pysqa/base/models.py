@@ -43,6 +43,12 @@ class ConfigModel(BaseModel):
     ssh_continous_connection: bool = False
     ssh_delete_file_on_remote: bool = True
     python_executable: Optional[str] = None
+    status_cache_ttl: Optional[float] = None
+    status_format: Optional[str] = None
+    accounting: bool = False
+    cluster_max_workers: Optional[int] = None
+    cluster_timeout: Optional[float] = None
+    cluster_environment_ttl: Optional[float] = None
     queues: dict[str, QueueModel]
 
 
@@ -1,10 +1,27 @@
-from typing import Callable, Optional, Union
-
-import pandas
-from jinja2 import Template
+import shlex
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from pysqa.base.config import QueueAdapterWithConfig
-from pysqa.base.core import execute_command
+from pysqa.base.core import (
+    CommandPlan,
+    execute_command,
+    get_delete_output_per_job,
+    split_process_id_list,
+)
+from pysqa.base.status import StatusSnapshot, concat_queue_status
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+# Environment variables which are set by the shell itself and are therefore not part of the cluster environment.
+environment_exclude_tuple = ("_", "OLDPWD", "PWD", "SHLVL")
+
+# Prefixes of the bookkeeping variables of Lmod, which record the loaded modules rather than configure the cluster.
+environment_exclude_prefix_tuple = ("_ModuleTable", "__LMOD_REF_COUNT_")
 
 
 class ModularQueueAdapter(QueueAdapterWithConfig):
@@ -18,6 +35,11 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
 
     Attributes:
         _queue_to_cluster_dict (dict): A dictionary mapping queues to clusters.
+        _cluster_error_dict (dict): A dictionary mapping clusters to the error of the last queue status query.
+        _cluster_environment_dict (dict): A dictionary mapping clusters to the time of capture and the command prefix
+                                          which sets the environment of the cluster.
+        _cluster_capture_lock_dict (dict): A dictionary mapping clusters to the lock which guards the capture of their
+                                           environment.
 
     Raises:
         ValueError: If a cluster is not found in the list of clusters.
@@ -44,6 +66,23 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
                     + " was not found in the list of clusters "
                     + str(list(self._config["cluster"]))
                 )
+        self._cluster_max_workers = self._config.get("cluster_max_workers", 8)
+        self._cluster_timeout = self._config.get("cluster_timeout", None)
+        self._cluster_error_dict: dict[str, str] = {}
+        self._cluster_environment_ttl = self._config.get("cluster_environment_ttl", 0.0)
+        self._cluster_environment_lock = threading.Lock()
+        self._cluster_environment_dict: dict[str, tuple[float, Optional[list]]] = {}
+        self._cluster_capture_lock_dict: dict[str, threading.Lock] = {}
+
+    @property
+    def cluster_errors(self) -> dict[str, str]:
+        """
+        Get the errors of the clusters which were missing in the last queue status query.
+
+        Returns:
+            dict[str, str]: Dictionary of the cluster names and the error message, empty if all clusters responded.
+        """
+        return dict(self._cluster_error_dict)
 
     def submit_job(
         self,
@@ -55,7 +94,7 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
         run_time_max: Optional[int] = None,
         dependency_list: Optional[list[int]] = None,
         command: str = "",
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         **kwargs,
     ) -> Union[int, None]:
         """
@@ -87,7 +126,7 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
             **kwargs,
         )
         cluster_module = self._queue_to_cluster_dict[queue]
-        commands = self._switch_cluster_command(
+        commands = self._cluster_command_prefix(
             cluster_module=cluster_module
         ) + self._list_command_to_be_executed(queue_script_path=queue_script_path)
         out = self._execute_command(
@@ -96,6 +135,7 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
             split_output=False,
             shell=True,
         )
+        self._status_cache.clear()
         if out is not None and self._commands is not None:
             cluster_queue_id = self._commands.get_job_id_from_output(out)
             cluster_queue_id *= 10
@@ -118,7 +158,7 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
         cluster_module, cluster_queue_id = self._resolve_queue_id(
             process_id=process_id, cluster_dict=self._config["cluster"]
         )
-        cluster_commands = self._switch_cluster_command(cluster_module=cluster_module)
+        cluster_commands = self._cluster_command_prefix(cluster_module=cluster_module)
         if self._commands is not None:
             commands = (
                 cluster_commands
@@ -146,7 +186,7 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
         cluster_module, cluster_queue_id = self._resolve_queue_id(
             process_id=process_id, cluster_dict=self._config["cluster"]
         )
-        cluster_commands = self._switch_cluster_command(cluster_module=cluster_module)
+        cluster_commands = self._cluster_command_prefix(cluster_module=cluster_module)
         if self._commands is not None:
             commands = (
                 cluster_commands
@@ -156,42 +196,367 @@ class ModularQueueAdapter(QueueAdapterWithConfig):
             out = self._execute_command(
                 commands=commands, split_output=True, shell=True
             )
+            self._status_cache.clear()
             if out is not None:
                 return out[0]
         return None
 
-    def get_queue_status(
-        self, user: Optional[str] = None
-    ) -> Union[pandas.DataFrame, None]:
+    def _split_delete_jobs(self, process_id_lst: list[int]) -> list[list[int]]:
+        """
+        Group the process IDs by cluster and split the groups into chunks which are deleted with a single call of the
+        delete command.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            list[list[int]]: List of chunks of process IDs, each chunk belongs to a single cluster.
+        """
+        cluster_dict: dict[str, list[int]] = {}
+        for process_id in process_id_lst:
+            cluster_module, _ = self._resolve_queue_id(
+                process_id=process_id, cluster_dict=self._config["cluster"]
+            )
+            cluster_dict.setdefault(cluster_module, []).append(process_id)
+        return [
+            chunk
+            for cluster_process_id_lst in cluster_dict.values()
+            for chunk in split_process_id_list(process_id_lst=cluster_process_id_lst)
+        ]
+
+    def _delete_job_chunk(self, process_id_lst: list[int]) -> list[Union[str, None]]:
+        """
+        Delete a chunk of jobs of a single cluster with a single call of the delete command.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            list: The output of the delete command for each process ID.
+        """
+        if self._commands is None:
+            return [None] * len(process_id_lst)
+        cluster_module, _ = self._resolve_queue_id(
+            process_id=process_id_lst[0], cluster_dict=self._config["cluster"]
+        )
+        cluster_queue_id_lst = [
+            self._resolve_queue_id(
+                process_id=process_id, cluster_dict=self._config["cluster"]
+            )[1]
+            for process_id in process_id_lst
+        ]
+        out = self._execute_command(
+            commands=self._cluster_command_prefix(cluster_module=cluster_module)
+            + self._commands.delete_job_command
+            + [str(cluster_queue_id) for cluster_queue_id in cluster_queue_id_lst],
+            split_output=False,
+            shell=True,
+        )
+        return get_delete_output_per_job(
+            output=out,
+            process_id_lst=process_id_lst,
+            cluster_queue_id_lst=cluster_queue_id_lst,
+        )
+
+    def _plan_query_accounting_status(self, process_id_lst: list[int]) -> CommandPlan:
         """
-        Get the queue status.
+        Query the accounting of each cluster for the jobs of this cluster which are no longer in the queue.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            CommandPlan: Command plan which returns the dictionary of the process IDs found in the accounting and their
+                         status.
+        """
+        if not self._accounting or len(process_id_lst) == 0:
+            return {}
+        cluster_dict: dict[str, dict[int, int]] = {}
+        for process_id in process_id_lst:
+            cluster_module, cluster_queue_id = self._resolve_queue_id(
+                process_id=process_id, cluster_dict=self._config["cluster"]
+            )
+            cluster_dict.setdefault(cluster_module, {})[cluster_queue_id] = process_id
+        status_dict = {}
+        for cluster_module, queue_id_dict in cluster_dict.items():
+            out_lst = yield [
+                {
+                    "commands": self._cluster_command_prefix(
+                        cluster_module=cluster_module
+                    )
+                    + commands,
+                    "split_output": False,
+                    "shell": True,
+                }
+                for commands in self._get_accounting_command_lst(
+                    process_id_lst=list(queue_id_dict.keys())
+                )
+            ]
+            cluster_status_dict = self._convert_accounting_output_lst(out_lst=out_lst)
+            status_dict.update(
+                {
+                    process_id: cluster_status_dict[cluster_queue_id]
+                    for cluster_queue_id, process_id in queue_id_dict.items()
+                    if cluster_queue_id in cluster_status_dict
+                }
+            )
+        return self._cache_terminal_status(status_dict=status_dict)
+
+    def _plan_query_queue_status(
+        self,
+        user: Optional[str] = None,
+        process_id_lst: Optional[list[int]] = None,
+    ) -> CommandPlan:
+        """
+        Query the queue status of all clusters. The clusters are queried in parallel and the results are merged in the
+        order of the clusters. A cluster which fails or does not respond within the cluster_timeout is skipped with a
+        warning, so the queue status of the remaining clusters is still returned, and the error is available from the
+        cluster_errors property. If none of the clusters responded None is returned. The user filter is applied by the queuing system, while the process IDs are ignored
+        as they encode the cluster in addition to the cluster queue ID. The clusters are queried by a thread pool, so
+        the command plan does not yield any commands.
 
         Args:
             user (str, optional): The user name. Defaults to None.
+            process_id_lst (list[int], optional): The process IDs. Defaults to None.
 
         Returns:
-            pandas.DataFrame: The queue status.
+            CommandPlan: Command plan which returns the queue status as dictionary of columns.
 
         """
+        yield from ()
         if self._commands is None:
             return None
-        df_lst = []
-        for cluster_module in self._config["cluster"]:
-            cluster_commands = self._switch_cluster_command(
-                cluster_module=cluster_module
+        status_commands = self._commands.get_queue_status_command
+        if user is not None:
+            user_arguments = self._commands.get_user_filter_arguments(user=user)
+            if user_arguments is not None:
+                status_commands = status_commands + user_arguments
+        cluster_lst = self._config["cluster"]
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self._cluster_max_workers, len(cluster_lst)))
+        )
+        future_dict = {
+            cluster_module: executor.submit(
+                self._query_cluster_queue_status,
+                cluster_module=cluster_module,
+                status_commands=status_commands,
             )
-            out = self._execute_command(
-                commands=cluster_commands + self._commands.get_queue_status_command,
+            for cluster_module in cluster_lst
+        }
+        _, not_done = wait(future_dict.values(), timeout=self._cluster_timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+        queue_status_lst = []
+        cluster_error_dict = {}
+        for cluster_module, future in future_dict.items():
+            if future in not_done:
+                cluster_error_dict[cluster_module] = (
+                    "The queue status query did not finish within "
+                    + str(self._cluster_timeout)
+                    + " seconds."
+                )
+            elif future.exception() is not None:
+                cluster_error_dict[cluster_module] = str(future.exception())
+            else:
+                queue_status_lst.append(future.result())
+        self._cluster_error_dict = cluster_error_dict
+        for cluster_module, error in cluster_error_dict.items():
+            warnings.warn(
+                message="The queue status of the cluster "
+                + cluster_module
+                + " is missing: "
+                + error,
+                stacklevel=2,
+            )
+        if len(queue_status_lst) == 0 and len(cluster_error_dict) > 0:
+            return None
+        return concat_queue_status(queue_status_lst=queue_status_lst)
+
+    def plan_status_of_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> CommandPlan:
+        """
+        Command plan of get_status_of_jobs(). The status of jobs on clusters which did not respond to the last queue
+        status query is unknown, so it is reported as None rather than "finished", unless the terminal status of the
+        job is already known.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            refresh (bool): Query the queuing system even if a cached queue status is available. Defaults to False.
+
+        Returns:
+            CommandPlan: Command plan which returns the list of job statuses.
+        """
+        status_lst = yield from super().plan_status_of_jobs(
+            process_id_lst=process_id_lst, refresh=refresh
+        )
+        if len(self._cluster_error_dict) == 0:
+            return status_lst
+        return [
+            (
+                None
+                if process_id not in self._terminal_status_dict
+                and self._resolve_queue_id(
+                    process_id=process_id, cluster_dict=self._config["cluster"]
+                )[0]
+                in self._cluster_error_dict
+                else status
+            )
+            for process_id, status in zip(process_id_lst, status_lst)
+        ]
+
+    def _new_status_snapshot(self, queue_status: dict[str, list]) -> StatusSnapshot:
+        """
+        Create a snapshot from the merged queue status of the clusters. The snapshot is incomplete if a cluster did not
+        respond, so it is not cached.
+
+        Args:
+            queue_status (dict[str, list]): The queue status as dictionary of columns.
+
+        Returns:
+            StatusSnapshot: The snapshot of the queue status.
+        """
+        return StatusSnapshot(
+            queue_status=queue_status, complete=len(self._cluster_error_dict) == 0
+        )
+
+    def _query_cluster_queue_status(
+        self, cluster_module: str, status_commands: list[str]
+    ) -> Union[dict[str, list], None]:
+        """
+        Query the queue status of a single cluster.
+
+        Args:
+            cluster_module (str): The cluster module.
+            status_commands (list[str]): The queue status command including the user filter.
+
+        Returns:
+            dict[str, list]: The queue status of the cluster as dictionary of columns.
+
+        Raises:
+            RuntimeError: If the queue status command fails.
+        """
+        if self._commands is None:
+            return None
+        out = self._execute_command(
+            commands=self._cluster_command_prefix(cluster_module=cluster_module)
+            + status_commands,
+            split_output=False,
+            shell=True,
+        )
+        if out is None:
+            raise RuntimeError(
+                "The queue status command failed on the cluster " + cluster_module
+            )
+        return self._commands.convert_queue_status_to_dict(queue_status_output=out)
+
+    def clear_cluster_environment(self):
+        """
+        Invalidate the cached environments of the clusters, so the next command captures them again.
+        """
+        with self._cluster_environment_lock:
+            self._cluster_environment_dict.clear()
+
+    def _cluster_command_prefix(self, cluster_module: str) -> list[str]:
+        """
+        Get the command prefix to execute a command on a given cluster. By default the cluster module is swapped
+        before every command. If the cluster_environment_ttl is set, the environment variables which are modified by
+        the cluster module are captured once and cached for the time to live, so the scheduler commands are executed
+        directly with the cached environment using env. The capture is guarded by a lock per cluster, so concurrent
+        queries of the same cluster capture the environment only once. If the environment cannot be captured the
+        cluster module is swapped instead.
+
+        Args:
+            cluster_module (str): The cluster module.
+
+        Returns:
+            list[str]: The command prefix.
+        """
+        if self._cluster_environment_ttl <= 0:
+            return self._switch_cluster_command(cluster_module=cluster_module)
+        with self._cluster_environment_lock:
+            capture_lock = self._cluster_capture_lock_dict.setdefault(
+                cluster_module, threading.Lock()
+            )
+        with capture_lock:
+            with self._cluster_environment_lock:
+                entry = self._cluster_environment_dict.get(cluster_module)
+            if (
+                entry is None
+                or time.monotonic() - entry[0] >= self._cluster_environment_ttl
+            ):
+                entry = (
+                    time.monotonic(),
+                    self._capture_cluster_environment(cluster_module=cluster_module),
+                )
+                with self._cluster_environment_lock:
+                    self._cluster_environment_dict[cluster_module] = entry
+        if entry[1] is None:
+            return self._switch_cluster_command(cluster_module=cluster_module)
+        return entry[1]
+
+    def _capture_cluster_environment(self, cluster_module: str) -> Optional[list[str]]:
+        """
+        Capture the environment variables which are modified by swapping the cluster module and convert them to an env
+        command prefix.
+
+        Args:
+            cluster_module (str): The cluster module.
+
+        Returns:
+            list[str]: The env command prefix or None if the environment could not be captured.
+        """
+        base_environment = self._parse_environment(
+            output=self._execute_command(
+                commands=["env", "-0"], split_output=False, shell=True
+            )
+        )
+        cluster_environment = self._parse_environment(
+            output=self._execute_command(
+                commands=self._switch_cluster_command(cluster_module=cluster_module)
+                + ["env", "-0"],
                 split_output=False,
                 shell=True,
             )
-            df = self._commands.convert_queue_status(queue_status_output=out)
-            df_lst.append(df)
-        df = pandas.concat(df_lst, axis=0, sort=False).reset_index(drop=True)
-        if user is None:
-            return df
-        else:
-            return df[df["user"] == user]
+        )
+        if base_environment is None or cluster_environment is None:
+            return None
+        commands = ["env"]
+        for key in sorted(base_environment.keys()):
+            if key not in cluster_environment:
+                commands += ["-u", key]
+        for key, value in sorted(cluster_environment.items()):
+            if base_environment.get(key) != value:
+                commands.append(shlex.quote(key + "=" + value))
+        return commands
+
+    @staticmethod
+    def _parse_environment(output: Optional[str]) -> Optional[dict[str, str]]:
+        """
+        Parse the NUL separated output of env -0. Shell functions, variables set by the shell, the bookkeeping
+        variables of Lmod and values containing newlines are skipped.
+
+        Args:
+            output (str): The output of env -0.
+
+        Returns:
+            dict[str, str]: Dictionary of the environment variables or None if the output does not contain the PATH.
+        """
+        if output is None:
+            return None
+        environment_dict = {}
+        for entry in output.split("\0"):
+            key, separator, value = entry.partition("=")
+            if (
+                separator == "="
+                and key.isidentifier()
+                and key not in environment_exclude_tuple
+                and not key.startswith(environment_exclude_prefix_tuple)
+                and "\n" not in value
+            ):
+                environment_dict[key] = value
+        if "PATH" not in environment_dict:
+            return None
+        return environment_dict
 
     @staticmethod
     def _resolve_queue_id(process_id: int, cluster_dict: dict):
@@ -0,0 +1,255 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pandas
+
+
+registry_column_lst = [
+    "cluster",
+    "jobid",
+    "job_name",
+    "working_directory",
+    "queue",
+    "cores",
+    "memory_max",
+    "run_time_max",
+    "submit_time",
+    "status",
+    "status_time",
+]
+
+registry_schema = """\
+CREATE TABLE IF NOT EXISTS jobs (
+    cluster TEXT NOT NULL,
+    jobid INTEGER NOT NULL,
+    job_name TEXT,
+    working_directory TEXT,
+    queue TEXT,
+    cores INTEGER,
+    memory_max TEXT,
+    run_time_max INTEGER,
+    submit_time REAL,
+    status TEXT,
+    status_time REAL,
+    PRIMARY KEY (cluster, jobid)
+);
+CREATE INDEX IF NOT EXISTS jobs_queue_status ON jobs (cluster, queue, status);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_working_directory ON jobs (working_directory);
+"""
+
+
+class JobRegistry:
+    """
+    Persistent registry of the submitted jobs and their last known status, stored in a SQLite database. The registry
+    answers queries like "all running jobs in queue X" or "all jobs in directory Y" without querying the queuing system
+    and it survives restarts of the python process.
+
+    Args:
+        path (str): Path of the SQLite database file, the file is created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self._path = os.path.abspath(os.path.expanduser(path))
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(registry_schema)
+
+    @property
+    def path(self) -> str:
+        """
+        Get the path of the SQLite database file.
+
+        Returns:
+            str: The path of the database file.
+        """
+        return self._path
+
+    def add_job(
+        self,
+        cluster: str,
+        process_id: int,
+        job_name: Optional[str] = None,
+        working_directory: Optional[str] = None,
+        queue: Optional[str] = None,
+        cores: Optional[int] = None,
+        memory_max: Optional[str] = None,
+        run_time_max: Optional[int] = None,
+        status: str = "pending",
+    ):
+        """
+        Add a submitted job to the registry.
+
+        Args:
+            cluster (str): The name of the cluster or queue adapter the job was submitted to.
+            process_id (int): The job ID.
+            job_name (str/None): The name of the job.
+            working_directory (str/None): The working directory of the job.
+            queue (str/None): The queue the job was submitted to.
+            cores (int/None): The number of cores.
+            memory_max (str/None): The maximum memory.
+            run_time_max (int/None): The maximum run time in seconds.
+            status (str): The initial status of the job. Defaults to "pending".
+        """
+        self.add_jobs(
+            cluster=cluster,
+            job_lst=[
+                {
+                    "jobid": process_id,
+                    "job_name": job_name,
+                    "working_directory": working_directory,
+                    "queue": queue,
+                    "cores": cores,
+                    "memory_max": memory_max,
+                    "run_time_max": run_time_max,
+                    "status": status,
+                }
+            ],
+        )
+
+    def add_jobs(self, cluster: str, job_lst: list[dict]):
+        """
+        Add multiple submitted jobs to the registry in a single transaction.
+
+        Args:
+            cluster (str): The name of the cluster or queue adapter the jobs were submitted to.
+            job_lst (list[dict]): List of jobs, each one a dictionary with the key "jobid" and optionally the keys
+                                  "job_name", "working_directory", "queue", "cores", "memory_max", "run_time_max" and
+                                  "status".
+        """
+        submit_time = time.time()
+        row_lst = []
+        for job in job_lst:
+            working_directory = job.get("working_directory")
+            if working_directory is not None:
+                working_directory = os.path.abspath(
+                    os.path.expanduser(working_directory)
+                )
+            memory_max = job.get("memory_max")
+            row_lst.append(
+                (
+                    cluster,
+                    int(job["jobid"]),
+                    job.get("job_name"),
+                    working_directory,
+                    job.get("queue"),
+                    job.get("cores"),
+                    str(memory_max) if memory_max is not None else None,
+                    job.get("run_time_max"),
+                    submit_time,
+                    job.get("status", "pending"),
+                    submit_time,
+                )
+            )
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row_lst,
+            )
+
+    def update_status(self, cluster: str, status_dict: dict[int, str]):
+        """
+        Update the last known status of multiple jobs in a single transaction. Jobs which are not in the registry are
+        ignored.
+
+        Args:
+            cluster (str): The name of the cluster or queue adapter.
+            status_dict (dict[int, str]): Dictionary of job IDs and their status.
+        """
+        status_time = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "UPDATE jobs SET status = ?, status_time = ? WHERE cluster = ? AND jobid = ?",
+                [
+                    (status, status_time, cluster, int(process_id))
+                    for process_id, status in status_dict.items()
+                    if status is not None
+                ],
+            )
+
+    def remove_jobs(self, cluster: str, process_id_lst: list[int]):
+        """
+        Remove jobs from the registry.
+
+        Args:
+            cluster (str): The name of the cluster or queue adapter.
+            process_id_lst (list[int]): List of job IDs.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM jobs WHERE cluster = ? AND jobid = ?",
+                [(cluster, int(process_id)) for process_id in process_id_lst],
+            )
+
+    def get_job(self, cluster: str, process_id: int) -> Optional[dict]:
+        """
+        Get the registry entry of a single job.
+
+        Args:
+            cluster (str): The name of the cluster or queue adapter.
+            process_id (int): The job ID.
+
+        Returns:
+            dict: The registry entry or None if the job is not in the registry.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM jobs WHERE cluster = ? AND jobid = ?",
+                (cluster, int(process_id)),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(registry_column_lst, row))
+
+    def get_jobs(
+        self,
+        cluster: Optional[str] = None,
+        queue: Optional[str] = None,
+        status: Optional[str] = None,
+        working_directory: Optional[str] = None,
+    ) -> "pandas.DataFrame":
+        """
+        Get the registry entries matching all of the given filters.
+
+        Args:
+            cluster (str/None): The name of the cluster or queue adapter.
+            queue (str/None): The queue.
+            status (str/None): The last known status, for example "running".
+            working_directory (str/None): The working directory.
+
+        Returns:
+            pandas.DataFrame: The matching registry entries ordered by submit time.
+        """
+        import pandas
+
+        if working_directory is not None:
+            working_directory = os.path.abspath(os.path.expanduser(working_directory))
+        condition_lst, parameter_lst = [], []
+        for column, value in (
+            ("cluster", cluster),
+            ("queue", queue),
+            ("status", status),
+            ("working_directory", working_directory),
+        ):
+            if value is not None:
+                condition_lst.append(column + " = ?")
+                parameter_lst.append(value)
+        query = "SELECT * FROM jobs"
+        if len(condition_lst) > 0:
+            query += " WHERE " + " AND ".join(condition_lst)
+        query += " ORDER BY submit_time, jobid"
+        with self._lock:
+            row_lst = self._connection.execute(query, parameter_lst).fetchall()
+        return pandas.DataFrame(row_lst, columns=registry_column_lst)
+
+    def close(self):
+        """
+        Close the connection to the SQLite database.
+        """
+        with self._lock:
+            self._connection.close()
@@ -2,17 +2,18 @@ import getpass
 import json
 import os
 import warnings
-from typing import Callable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
-import pandas
 import paramiko
-from jinja2 import Template
 from paramiko.client import SSHClient
 from paramiko.transport import Transport
 from tqdm import tqdm
 
 from pysqa.base.config import QueueAdapterWithConfig
-from pysqa.base.core import execute_command
+from pysqa.base.core import CommandPlan, execute_command
+
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 
 class RemoteQueueAdapter(QueueAdapterWithConfig):
@@ -60,7 +61,7 @@ class RemoteQueueAdapter(QueueAdapterWithConfig):
         delete_job(process_id: int) -> str:
             Deletes a job from the remote queue.
 
-        get_queue_status(user: Optional[str] = None) -> pandas.DataFrame:
+        _plan_query_queue_status(user: Optional[str] = None, process_id_lst: Optional[list[int]] = None) -> CommandPlan:
             Retrieves the queue status.
 
         get_job_from_remote(working_directory: str):
@@ -131,6 +132,28 @@ class RemoteQueueAdapter(QueueAdapterWithConfig):
         self._python_executable = config.get("python_executable", "python")
         self._remote_flag = True
 
+    @property
+    def supports_array_jobs(self) -> bool:
+        """
+        Job arrays are not supported, as the task manifest and the exit codes of the tasks are written to the local
+        file system rather than to the remote host.
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    @property
+    def supports_packed_jobs(self) -> bool:
+        """
+        Packed jobs are not supported, as the task manifests and the exit codes of the tasks are written to the local
+        file system rather than to the remote host.
+
+        Returns:
+            bool: False
+        """
+        return False
+
     def convert_path_to_remote(self, path: str) -> str:
         """
         Converts a local path to a remote path.
@@ -154,7 +177,7 @@ class RemoteQueueAdapter(QueueAdapterWithConfig):
         run_time_max: Optional[int] = None,
         dependency_list: Optional[list[int]] = None,
         command: str = "",
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         **kwargs,
     ) -> int:
         """
@@ -180,6 +203,7 @@ class RemoteQueueAdapter(QueueAdapterWithConfig):
         if working_directory is not None:
             self._transfer_data_to_remote(working_directory=working_directory)
         output = self._execute_remote_command(command=command)
+        self._status_cache.clear()
         return int(output.split()[-1])
 
     def enable_reservation(self, process_id: int) -> str:
@@ -206,29 +230,50 @@ class RemoteQueueAdapter(QueueAdapterWithConfig):
         Returns:
             str: The output of the delete command.
         """
-        return self._execute_remote_command(
+        output = self._execute_remote_command(
             command=self._delete_command(job_id=process_id)
         )
+        self._status_cache.clear()
+        return output
 
-    def get_queue_status(self, user: Optional[str] = None) -> pandas.DataFrame:
+    def _delete_job_chunk(self, process_id_lst: list[int]) -> list[Union[str, None]]:
         """
-        Retrieves the queue status.
+        Deletes a chunk of jobs from the remote queue with a single SSH command.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+
+        Returns:
+            list: The output of the delete command for each process ID.
+        """
+        output = self._execute_remote_command(
+            command=self._delete_jobs_command(job_id_lst=process_id_lst)
+        )
+        if len(process_id_lst) == 1:
+            return [output]
+        return json.loads(output)
+
+    def _plan_query_queue_status(
+        self,
+        user: Optional[str] = None,
+        process_id_lst: Optional[list[int]] = None,
+    ) -> CommandPlan:
+        """
+        Retrieves the queue status from the remote host, the filters are applied locally. The remote pysqa instance
+        returns the queue status as JSON dictionary of columns, which is used without converting it to a pandas
+        DataFrame. The command is executed over the SSH connection, so the command plan does not yield any commands.
 
         Args:
             user (str, optional): The username.
+            process_id_lst (list[int], optional): The process IDs.
 
         Returns:
-            pandas.DataFrame: The queue status.
+            CommandPlan: Command plan which returns the queue status as dictionary of columns.
         """
-        df = pandas.DataFrame(
-            json.loads(
-                self._execute_remote_command(command=self._get_queue_status_command())
-            )
+        yield from ()
+        return json.loads(
+            self._execute_remote_command(command=self._get_queue_status_command())
         )
-        if user is None:
-            return df
-        else:
-            return df[df["user"] == user]
 
     def get_job_from_remote(self, working_directory: str):
         """
@@ -544,6 +589,22 @@ class RemoteQueueAdapter(QueueAdapterWithConfig):
         """
         return self._remote_command() + "--delete --id " + str(job_id)
 
+    def _delete_jobs_command(self, job_id_lst: list[int]) -> str:
+        """
+        Generates the command to delete multiple jobs on the remote host.
+
+        Args:
+            job_id_lst (list[int]): The IDs of the jobs to delete.
+
+        Returns:
+            str: The delete command.
+        """
+        return (
+            self._remote_command()
+            + "--delete"
+            + "".join([" --id " + str(job_id) for job_id in job_id_lst])
+        )
+
     def _reservation_command(self, job_id: int) -> str:
         """
         Generates the command to reserve a job on the remote host.
@@ -0,0 +1,170 @@
+import statistics
+from typing import Optional, Union
+
+# Routing modes for the submission of jobs in a configuration with multiple clusters, "active" submits to the cluster
+# selected with switch_cluster() and "least_loaded" to the cluster with the shortest expected time to start.
+cluster_routing_tuple = ("active", "least_loaded")
+
+# Maximum number of recently started jobs which are used to estimate the waiting time of a cluster.
+wait_time_sample_size = 100
+
+
+class ClusterJobID(int):
+    """
+    Job ID which records the cluster the job was submitted to. It behaves like the integer job ID of the queuing
+    system, so it can be used wherever a job ID is expected, while the QueueAdapter uses the cluster to send later
+    status and delete requests to the right cluster.
+
+    Args:
+        value (int): The job ID of the queuing system.
+        cluster (str): The name of the cluster the job was submitted to.
+    """
+
+    cluster: str
+
+    def __new__(cls, value: int, cluster: str):
+        job_id = super().__new__(cls, value)
+        job_id.cluster = cluster
+        return job_id
+
+    def __reduce__(self) -> tuple[type, tuple[int, str]]:
+        return self.__class__, (int(self), self.cluster)
+
+
+class ClusterLoad:
+    """
+    Load of a cluster derived from its queue status, which is used to estimate the time until a newly submitted job
+    starts. The queue status lists jobs, not nodes, so the load contains no signal for the number of idle cores and a
+    cluster with pending jobs might still have free resources. The waiting time requires the submit and start time,
+    which are only reported by the JSON status format of Slurm, for the text status format it is None.
+
+    Args:
+        pending (int): Number of pending jobs.
+        running (int): Number of running jobs.
+        wait_time (float/None): Median waiting time of the recently started jobs in seconds, None if the queuing system
+                                does not report the submit and start time.
+    """
+
+    def __init__(
+        self, pending: int = 0, running: int = 0, wait_time: Optional[float] = None
+    ):
+        self.pending = pending
+        self.running = running
+        self.wait_time = wait_time
+
+    @classmethod
+    def from_queue_status(
+        cls, queue_status: Optional[dict[str, list]]
+    ) -> "ClusterLoad":
+        """
+        Derive the load of a cluster from its queue status.
+
+        Args:
+            queue_status (dict/None): The queue status as dictionary of columns.
+
+        Returns:
+            ClusterLoad: The load of the cluster.
+        """
+        if queue_status is None:
+            return cls()
+        status_lst = queue_status.get("status", [])
+        start_lst = [
+            (start_time, start_time - submit_time)
+            for status, submit_time, start_time in zip(
+                status_lst,
+                queue_status.get("submit_time", [None] * len(status_lst)),
+                queue_status.get("start_time", [None] * len(status_lst)),
+            )
+            if status == "running"
+            and submit_time is not None
+            and start_time is not None
+        ]
+        if len(start_lst) > 0:
+            wait_time: Optional[float] = statistics.median(
+                max(wait, 0)
+                for _, wait in sorted(start_lst, reverse=True)[:wait_time_sample_size]
+            )
+        else:
+            wait_time = None
+        return cls(
+            pending=status_lst.count("pending"),
+            running=status_lst.count("running"),
+            wait_time=wait_time,
+        )
+
+    @property
+    def expected_start_time(self) -> Optional[float]:
+        """
+        Get the expected time until a newly submitted job starts. A job on a cluster without pending jobs is expected
+        to start immediately, otherwise the recent waiting time is used.
+
+        Returns:
+            float/None: The expected time in seconds, None if it cannot be estimated.
+        """
+        if self.pending == 0:
+            return 0.0
+        return self.wait_time
+
+    def to_dict(self) -> dict:
+        """
+        Get the load of the cluster as dictionary.
+
+        Returns:
+            dict: Dictionary with the number of pending and running jobs, the waiting time and the expected start time.
+        """
+        return {
+            "pending": self.pending,
+            "running": self.running,
+            "wait_time": self.wait_time,
+            "expected_start_time": self.expected_start_time,
+        }
+
+
+def fits_queue_limits(
+    requested: tuple[
+        Union[float, int, None], Union[float, int, None], Union[float, int, str, None]
+    ],
+    checked: tuple[
+        Union[float, int, None], Union[float, int, None], Union[float, int, str, None]
+    ],
+) -> bool:
+    """
+    Check if the requested resources fit into the limits of a queue. The limits are applied by check_queue_parameters(),
+    which moves a value outside of the limits to the closest limit, so the resources fit if no requested value was
+    changed.
+
+    Args:
+        requested (tuple): The requested cores, run_time_max and memory_max.
+        checked (tuple): The cores, run_time_max and memory_max returned by check_queue_parameters().
+
+    Returns:
+        bool: True if the requested resources fit into the limits of the queue.
+    """
+    return all(
+        value is None or value == checked_value
+        for value, checked_value in zip(requested, checked)
+    )
+
+
+def sort_clusters_by_load(load_dict: dict[str, ClusterLoad]) -> list[str]:
+    """
+    Sort the clusters by the expected time until a newly submitted job starts. Clusters without an estimate are sorted
+    after the clusters with an estimate, ties are resolved by the number of pending jobs and finally by the order of
+    the clusters.
+
+    Args:
+        load_dict (dict[str, ClusterLoad]): The load of each cluster.
+
+    Returns:
+        list[str]: The names of the clusters, starting with the least loaded cluster.
+    """
+    cluster_lst = list(load_dict.keys())
+    return sorted(
+        cluster_lst,
+        key=lambda cluster: (
+            load_dict[cluster].expected_start_time is None,
+            load_dict[cluster].expected_start_time or 0.0,
+            load_dict[cluster].pending,
+            cluster_lst.index(cluster),
+        ),
+    )
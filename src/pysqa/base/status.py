@@ -0,0 +1,359 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    import pandas
+
+
+# Job status values which do not change anymore, a job which left the queue is reported as "finished" unless the
+# accounting of the queuing system reports how the job ended.
+terminal_status_tuple = (
+    "finished",
+    "error",
+    "failed",
+    "cancelled",
+    "timeout",
+    "preempted",
+    "out_of_memory",
+    "node_fail",
+)
+
+# Columns of the columnar queue status which contain the time in seconds since the epoch, they are converted to
+# timezone aware timestamps when the queue status is converted to a pandas DataFrame.
+datetime_column_tuple = ("submit_time", "start_time")
+
+
+def queue_status_to_dataframe(
+    queue_status: Optional[dict[str, list]],
+) -> Optional["pandas.DataFrame"]:
+    """
+    Convert the columnar queue status to a pandas DataFrame, this is the only place where pandas is imported for the
+    queue status.
+
+    Args:
+        queue_status (dict/None): The queue status as dictionary of columns, each column is a list with one entry per
+                                  job.
+
+    Returns:
+        pandas.DataFrame: The queue status or None if no queue status is available.
+    """
+    if queue_status is None:
+        return None
+    import pandas
+
+    df = pandas.DataFrame(queue_status)
+    if "jobid" in df.columns:
+        df["jobid"] = df["jobid"].astype("int64")
+    for column in datetime_column_tuple:
+        if column in df.columns:
+            df[column] = pandas.to_datetime(df[column], unit="s", utc=True)
+    return df
+
+
+def concat_queue_status(
+    queue_status_lst: list[Optional[dict[str, list]]],
+) -> Optional[dict[str, list]]:
+    """
+    Concatenate multiple columnar queue status, columns which are missing in one of them are filled with None.
+
+    Args:
+        queue_status_lst (list): List of queue status as dictionaries of columns, None entries are skipped.
+
+    Returns:
+        dict: The combined queue status or None if no queue status is available.
+    """
+    available_lst: list[dict[str, list]] = [
+        queue_status for queue_status in queue_status_lst if queue_status is not None
+    ]
+    if len(available_lst) == 0:
+        return None
+    elif len(available_lst) == 1:
+        return available_lst[0]
+    column_lst = list(
+        dict.fromkeys(
+            column for queue_status in available_lst for column in queue_status
+        )
+    )
+    result_dict: dict[str, list] = {column: [] for column in column_lst}
+    for queue_status in available_lst:
+        length = len(next(iter(queue_status.values()), []))
+        for column in column_lst:
+            result_dict[column].extend(queue_status.get(column, [None] * length))
+    return result_dict
+
+
+def filter_queue_status(
+    queue_status: Optional[dict[str, list]], column: str, value: Any
+) -> Optional[dict[str, list]]:
+    """
+    Select the jobs of the columnar queue status which have the given value in the given column.
+
+    Args:
+        queue_status (dict/None): The queue status as dictionary of columns.
+        column (str): The column to filter, for example "user".
+        value (object): The value to select.
+
+    Returns:
+        dict: The queue status of the selected jobs or None if no queue status is available.
+    """
+    if queue_status is None:
+        return None
+    position_lst = [
+        position
+        for position, entry in enumerate(queue_status.get(column, []))
+        if entry == value
+    ]
+    return {
+        key: [values[position] for position in position_lst]
+        for key, values in queue_status.items()
+    }
+
+
+class StatusCache:
+    """
+    Time-to-live cache for the queue status snapshot, which is shared by all status lookups of a queue adapter.
+
+    Args:
+        ttl (float): Time to live of a cached snapshot in seconds. A value of zero disables the cache.
+    """
+
+    def __init__(self, ttl: float = 0.0):
+        self._ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._value: Any = None
+        self._timestamp = 0.0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def ttl(self) -> float:
+        """
+        Get the time to live of a cached snapshot in seconds.
+
+        Returns:
+            float: The time to live in seconds.
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl: float):
+        """
+        Set the time to live of a cached snapshot in seconds, this invalidates the cached snapshot.
+
+        Args:
+            ttl (float): The time to live in seconds.
+        """
+        with self._lock:
+            self._ttl = float(ttl)
+            self._value = None
+
+    def get(self, function: Callable[[], Any], refresh: bool = False) -> Any:
+        """
+        Get the cached snapshot or call the function to create a new one.
+
+        The lock is held while the function is executed, so concurrent callers wait for a single query rather than
+        querying the queuing system in parallel.
+
+        Args:
+            function (Callable): Function without arguments which returns a new snapshot.
+            refresh (bool): Ignore the cached snapshot and call the function. Defaults to False.
+
+        Returns:
+            object: The snapshot.
+        """
+        with self._lock:
+            if (
+                not refresh
+                and self._value is not None
+                and time.monotonic() - self._timestamp < self._ttl
+            ):
+                self._hits += 1
+                return self._value
+            self._misses += 1
+            value = function()
+            if self._ttl > 0 and self._is_cacheable(value=value):
+                self._value = value
+                self._timestamp = time.monotonic()
+            else:
+                self._value = None
+            return value
+
+    def peek(self) -> Any:
+        """
+        Get the cached snapshot without creating a new one, this is used by callers which create the snapshot
+        asynchronously.
+
+        Returns:
+            object: The snapshot or None if no valid snapshot is cached.
+        """
+        with self._lock:
+            if (
+                self._value is not None
+                and time.monotonic() - self._timestamp < self._ttl
+            ):
+                self._hits += 1
+                return self._value
+            self._misses += 1
+            return None
+
+    def store(self, value: Any):
+        """
+        Store a new snapshot in the cache.
+
+        Args:
+            value (object): The snapshot.
+        """
+        with self._lock:
+            if self._ttl > 0 and self._is_cacheable(value=value):
+                self._value = value
+                self._timestamp = time.monotonic()
+
+    @staticmethod
+    def _is_cacheable(value: Any) -> bool:
+        """
+        Check if a snapshot can be cached, None and incomplete snapshots are not cached.
+
+        Args:
+            value (object): The snapshot.
+
+        Returns:
+            bool: True if the snapshot can be cached.
+        """
+        return value is not None and getattr(value, "complete", True)
+
+    def clear(self):
+        """
+        Invalidate the cached snapshot.
+        """
+        with self._lock:
+            self._value = None
+
+    def info(self) -> dict:
+        """
+        Get the cache statistics.
+
+        Returns:
+            dict: Dictionary with the number of cache hits and misses as well as the time to live.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "ttl": self._ttl}
+
+
+class StatusSnapshot:
+    """
+    Snapshot of the queue status with a hash index on the job id, so the status, the job name or the working
+    directory of a job can be looked up without filtering the whole queue status. The snapshot is either created from
+    the columnar queue status returned by the queuing system wrappers or from a pandas DataFrame, the DataFrame is only
+    built when it is requested. For queuing systems which list the elements of a job array with their own job ID, the
+    optional column "array_jobid" maps the ID of the job array to one of its elements, preferably a running one, so the
+    job array is reported as in the queue as long as any of its elements is.
+
+    Args:
+        queue_status (dict/None): The queue status as dictionary of columns with at least the columns "jobid" and
+                                  "status".
+        df (pandas.DataFrame/None): The queue status with at least the columns "jobid" and "status".
+        complete (bool): The queue status contains all jobs, False if a part of the queuing system did not respond.
+                         Incomplete snapshots are not cached. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        queue_status: Optional[dict[str, list]] = None,
+        df: Optional["pandas.DataFrame"] = None,
+        complete: bool = True,
+    ):
+        if queue_status is None and df is None:
+            raise ValueError("Either the queue_status or the df has to be defined.")
+        self.complete = complete
+        self._df = df
+        self._column_dict: dict[str, list] = (
+            dict(queue_status) if queue_status is not None else {}
+        )
+        self._index: dict[int, int] = {}
+        for position, process_id in enumerate(self._get_column(column="jobid") or []):
+            self._index.setdefault(process_id, position)
+        array_jobid_lst = self._get_column(column="array_jobid")
+        if array_jobid_lst is not None:
+            status_lst = self._get_column(column="status") or [None] * len(self)
+            array_index: dict[int, int] = {}
+            for position, (array_jobid, status) in enumerate(
+                zip(array_jobid_lst, status_lst)
+            ):
+                if (
+                    array_jobid is not None
+                    and array_jobid not in self._index
+                    and (array_jobid not in array_index or status == "running")
+                ):
+                    array_index[array_jobid] = position
+            self._index.update(array_index)
+
+    @property
+    def df(self) -> "pandas.DataFrame":
+        """
+        Get the queue status as pandas DataFrame.
+
+        Returns:
+            pandas.DataFrame: The queue status.
+        """
+        if self._df is None:
+            self._df = queue_status_to_dataframe(queue_status=self._column_dict)
+        return self._df
+
+    @property
+    def queue_status(self) -> dict[str, list]:
+        """
+        Get the queue status as dictionary of columns.
+
+        Returns:
+            dict: The queue status.
+        """
+        if self._df is not None:
+            for column in self._df.columns:
+                self._get_column(column=column)
+        return dict(self._column_dict)
+
+    def __len__(self) -> int:
+        return len(self._get_column(column="jobid") or [])
+
+    def __contains__(self, process_id: int) -> bool:
+        return process_id in self._index
+
+    def lookup(
+        self,
+        process_id_lst: list[int],
+        column: str = "status",
+        default: Optional[Any] = None,
+    ) -> list:
+        """
+        Look up a column of the queue status for a list of process IDs.
+
+        Args:
+            process_id_lst (list[int]): List of process IDs.
+            column (str): The column to look up, for example "status", "jobname" or "working_directory".
+            default (object): Value returned for process IDs which are not in the queue. Defaults to None.
+
+        Returns:
+            list: The values of the column in the order of the process IDs.
+        """
+        values = self._get_column(column=column)
+        if values is None:
+            return [default] * len(process_id_lst)
+        positions = [self._index.get(process_id) for process_id in process_id_lst]
+        return [default if p is None else values[p] for p in positions]
+
+    def _get_column(self, column: str) -> Optional[list]:
+        """
+        Get a column of the queue status as list, the conversion from the DataFrame is only executed once per column.
+
+        Args:
+            column (str): The name of the column.
+
+        Returns:
+            list: The values of the column or None if the column does not exist.
+        """
+        if column not in self._column_dict:
+            if self._df is None or column not in self._df.columns:
+                return None
+            self._column_dict[column] = self._df[column].tolist()
+        return self._column_dict[column]
@@ -0,0 +1,185 @@
+import json
+import os
+from typing import Optional
+
+from pysqa.base.status import terminal_status_tuple
+
+task_manifest_filename = "pysqa_tasks.sh"
+task_list_filename = "pysqa_tasks.json"
+task_status_directory = "pysqa_tasks"
+
+manifest_header = """\
+#!/bin/bash
+# Task manifest written by pysqa, the task index is the first argument.
+"""
+
+manifest_footer = """\
+status_directory={status_directory}
+status_file="$status_directory/$1.exit"
+mkdir -p "$status_directory"
+touch "$status_directory/$1.running"
+( "task_$1" ) &
+task_pid=$!
+trap 'kill -TERM $task_pid 2>/dev/null; echo 143 > "$status_file"; exit 143' TERM INT
+wait $task_pid
+return_code=$?
+echo $return_code > "$status_file"
+exit $return_code
+"""
+
+
+def write_task_manifest(working_directory: str, task_lst: list[tuple[str, str]]) -> str:
+    """
+    Write a task manifest, which is a bash script executing the task with the index given as first argument. The tasks
+    are numbered starting from one. For each task the manifest records when it started and its exit code in the
+    pysqa_tasks status directory.
+
+    Args:
+        working_directory (str): Directory to write the manifest to.
+        task_lst (list[tuple[str, str]]): List of tasks, each one a tuple of the working directory and the command.
+
+    Returns:
+        str: The absolute path of the task manifest.
+    """
+    working_directory = os.path.abspath(os.path.expanduser(working_directory))
+    os.makedirs(working_directory, exist_ok=True)
+    task_dict_lst = []
+    manifest = manifest_header
+    for task_index, (task_path, task_line) in enumerate(task_lst, start=1):
+        task_working_directory = os.path.abspath(os.path.expanduser(task_path))
+        if " " in task_working_directory:
+            raise ValueError(
+                "Whitespaces in the working_directory name are not supported!"
+            )
+        os.makedirs(task_working_directory, exist_ok=True)
+        task_command = "".join(task_line) if isinstance(task_line, list) else task_line
+        manifest += (
+            "task_"
+            + str(task_index)
+            + "() {\ncd "
+            + task_working_directory
+            + " || return 1\n"
+            + task_command
+            + "\n}\n"
+        )
+        task_dict_lst.append(
+            {"working_directory": task_working_directory, "command": task_command}
+        )
+    manifest += manifest_footer.format(
+        status_directory=os.path.join(working_directory, task_status_directory)
+    )
+    with open(os.path.join(working_directory, task_list_filename), "w") as f:
+        json.dump(task_dict_lst, f)
+    manifest_path = os.path.join(working_directory, task_manifest_filename)
+    with open(manifest_path, "w") as f:
+        f.write(manifest)
+    return manifest_path
+
+
+def get_pack_size(
+    cores: int,
+    task_cores: int = 1,
+    run_time_max: Optional[int] = None,
+    task_run_time: Optional[int] = None,
+) -> int:
+    """
+    Get the number of tasks which are packed into a single job. The job runs cores // task_cores tasks at the same
+    time and, if the run time of the tasks is known, as many rounds of tasks as fit into the run time of the job.
+
+    Args:
+        cores (int): The number of cores of the job.
+        task_cores (int): The number of cores of each task. Defaults to 1.
+        run_time_max (int/None): The maximum run time of the job in seconds. Defaults to None.
+        task_run_time (int/None): The expected run time of each task in seconds. Defaults to None.
+
+    Returns:
+        int: The number of tasks per job.
+    """
+    parallel_task_count = max(1, cores // max(1, task_cores))
+    if run_time_max is not None and task_run_time is not None and task_run_time > 0:
+        return parallel_task_count * max(1, run_time_max // task_run_time)
+    return parallel_task_count
+
+
+def get_packed_task_command(
+    manifest_path: str, task_count: int, parallel_task_count: int
+) -> str:
+    """
+    Get the command which runs all tasks of a task manifest inside a single job, with up to parallel_task_count tasks
+    running at the same time.
+
+    Args:
+        manifest_path (str): The path of the task manifest.
+        task_count (int): The number of tasks in the task manifest.
+        parallel_task_count (int): The number of tasks which run at the same time.
+
+    Returns:
+        str: The command to be executed in the submission script.
+    """
+    return (
+        "seq 1 "
+        + str(task_count)
+        + " | xargs -P "
+        + str(max(1, parallel_task_count))
+        + " -n 1 bash "
+        + manifest_path
+    )
+
+
+def read_task_list(working_directory: str) -> list[dict]:
+    """
+    Read the list of tasks written by write_task_manifest().
+
+    Args:
+        working_directory (str): Directory of the task manifest.
+
+    Returns:
+        list[dict]: List of tasks, each one a dictionary with the keys "working_directory" and "command".
+    """
+    with open(
+        os.path.join(
+            os.path.abspath(os.path.expanduser(working_directory)), task_list_filename
+        )
+    ) as f:
+        return json.load(f)
+
+
+def get_task_status_lst(
+    working_directory: str,
+    job_status: Optional[str],
+    task_index_lst: Optional[list[int]] = None,
+) -> list[str]:
+    """
+    Get the status of the tasks of a task manifest. Tasks with an exit code are "finished" or "error". As long as the
+    job is in the queue, tasks which started are "running" and tasks which did not start yet are "pending". Once the
+    job left the queue, every task without an exit code is "error", including tasks which were killed while running.
+
+    Args:
+        working_directory (str): Directory of the task manifest.
+        job_status (str/None): Status of the job which executes the tasks, None if the job is not in the queue.
+        task_index_lst (list[int], optional): Indices of the tasks starting from one. Defaults to all tasks.
+
+    Returns:
+        list[str]: The status of the tasks.
+    """
+    working_directory = os.path.abspath(os.path.expanduser(working_directory))
+    if task_index_lst is None:
+        task_index_lst = list(
+            range(1, len(read_task_list(working_directory=working_directory)) + 1)
+        )
+    status_path = os.path.join(working_directory, task_status_directory)
+    job_in_queue = job_status is not None and job_status not in terminal_status_tuple
+    status_lst = []
+    for task_index in task_index_lst:
+        exit_file = os.path.join(status_path, str(task_index) + ".exit")
+        if os.path.exists(exit_file):
+            with open(exit_file) as f:
+                return_code = f.read().strip()
+            status_lst.append("finished" if return_code == "0" else "error")
+        elif not job_in_queue:
+            status_lst.append("error")
+        elif os.path.exists(os.path.join(status_path, str(task_index) + ".running")):
+            status_lst.append("running")
+        else:
+            status_lst.append("pending")
+    return status_lst
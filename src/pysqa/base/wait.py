@@ -0,0 +1,179 @@
+import time
+from collections.abc import Iterator
+from typing import Callable, Optional
+
+from pysqa.base.status import terminal_status_tuple
+
+
+class PollPolicy:
+    """
+    Adaptive poll interval for waiting on jobs. The interval shrinks when the status of the jobs changed since the last
+    poll and grows when nothing changed. In addition the interval is limited by a fraction of the time the jobs have
+    been waiting, so short jobs are detected quickly while long running jobs are polled less frequently.
+
+    Args:
+        interval_min (float): Minimum poll interval in seconds. Defaults to 1.0.
+        interval_max (float): Maximum poll interval in seconds. Defaults to 60.0.
+        backoff_factor (float): Factor to increase the interval when the status of the jobs did not change. Defaults
+                                to 1.5.
+        age_factor (float): Maximum interval as fraction of the time the jobs have been waiting. Defaults to 0.1.
+    """
+
+    def __init__(
+        self,
+        interval_min: float = 1.0,
+        interval_max: float = 60.0,
+        backoff_factor: float = 1.5,
+        age_factor: float = 0.1,
+    ):
+        if interval_min <= 0 or interval_max < interval_min:
+            raise ValueError(
+                "The poll interval requires 0 < interval_min <= interval_max, but got interval_min="
+                + str(interval_min)
+                + " and interval_max="
+                + str(interval_max)
+                + "."
+            )
+        if backoff_factor < 1:
+            raise ValueError(
+                "The backoff_factor has to be at least 1, but got "
+                + str(backoff_factor)
+                + "."
+            )
+        self.interval_min = interval_min
+        self.interval_max = interval_max
+        self.backoff_factor = backoff_factor
+        self.age_factor = age_factor
+
+    def next_interval(
+        self, interval: Optional[float], elapsed: float, changed_fraction: float
+    ) -> float:
+        """
+        Calculate the time to wait until the next poll.
+
+        Args:
+            interval (float/None): The previous poll interval in seconds, None for the first poll.
+            elapsed (float): The time since the start of the waiting in seconds.
+            changed_fraction (float): Fraction of the jobs which changed their status since the last poll.
+
+        Returns:
+            float: The poll interval in seconds.
+        """
+        if interval is None:
+            interval = self.interval_min
+        elif changed_fraction > 0:
+            interval /= 1 + (self.backoff_factor - 1) * changed_fraction
+        else:
+            interval *= self.backoff_factor
+        interval_limit = min(
+            self.interval_max, max(self.interval_min, self.age_factor * elapsed)
+        )
+        return min(max(interval, self.interval_min), interval_limit)
+
+
+def iter_wait_for_jobs(
+    status_function: Callable[[list[int]], list[Optional[str]]],
+    process_id_lst: list[int],
+    timeout: Optional[float] = None,
+    poll_policy: Optional[PollPolicy] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[tuple[int, str]]:
+    """
+    Wait for jobs and yield each job as soon as it reached a terminal status. All jobs which are still waited on share a
+    single call of the status function per poll.
+
+    Args:
+        status_function (Callable): Function which returns the status for a list of process IDs.
+        process_id_lst (list[int]): List of process IDs.
+        timeout (float/None): Maximum time to wait in seconds, None to wait without limit. Defaults to None.
+        poll_policy (PollPolicy/None): Policy for the poll interval. Defaults to PollPolicy().
+        sleep (Callable): Function to wait for a given number of seconds. Defaults to time.sleep.
+        clock (Callable): Monotonic clock in seconds. Defaults to time.monotonic.
+
+    Yields:
+        tuple[int, str]: The process ID and the terminal status of the job.
+
+    Raises:
+        TimeoutError: If not all jobs reached a terminal status within the timeout.
+    """
+    if poll_policy is None:
+        poll_policy = PollPolicy()
+    start = clock()
+    waiting_lst = list(dict.fromkeys(process_id_lst))
+    previous_status_dict: dict[int, Optional[str]] = {}
+    interval = None
+    while len(waiting_lst) > 0:
+        status_lst = status_function(waiting_lst)
+        if len(status_lst) == len(waiting_lst):
+            status_dict = dict(zip(waiting_lst, status_lst))
+            changed = sum(
+                previous_status_dict.get(process_id) != status
+                for process_id, status in status_dict.items()
+            )
+            changed_fraction = changed / len(waiting_lst)
+            for process_id, status in status_dict.items():
+                if status in terminal_status_tuple:
+                    yield process_id, status
+            waiting_lst = [
+                process_id
+                for process_id in waiting_lst
+                if status_dict[process_id] not in terminal_status_tuple
+            ]
+            previous_status_dict = status_dict
+        else:
+            changed_fraction = 0.0
+        if len(waiting_lst) == 0:
+            break
+        elapsed = clock() - start
+        interval = poll_policy.next_interval(
+            interval=interval, elapsed=elapsed, changed_fraction=changed_fraction
+        )
+        if timeout is not None:
+            if elapsed >= timeout:
+                raise TimeoutError(
+                    "The jobs "
+                    + str(waiting_lst)
+                    + " did not finish within "
+                    + str(timeout)
+                    + " seconds."
+                )
+            interval = min(interval, timeout - elapsed)
+        sleep(interval)
+
+
+def wait_for_jobs(
+    status_function: Callable[[list[int]], list[Optional[str]]],
+    process_id_lst: list[int],
+    timeout: Optional[float] = None,
+    poll_policy: Optional[PollPolicy] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> dict[int, str]:
+    """
+    Wait until all jobs reached a terminal status.
+
+    Args:
+        status_function (Callable): Function which returns the status for a list of process IDs.
+        process_id_lst (list[int]): List of process IDs.
+        timeout (float/None): Maximum time to wait in seconds, None to wait without limit. Defaults to None.
+        poll_policy (PollPolicy/None): Policy for the poll interval. Defaults to PollPolicy().
+        sleep (Callable): Function to wait for a given number of seconds. Defaults to time.sleep.
+        clock (Callable): Monotonic clock in seconds. Defaults to time.monotonic.
+
+    Returns:
+        dict[int, str]: Dictionary of the process IDs and their terminal status.
+
+    Raises:
+        TimeoutError: If not all jobs reached a terminal status within the timeout.
+    """
+    return dict(
+        iter_wait_for_jobs(
+            status_function=status_function,
+            process_id_lst=process_id_lst,
+            timeout=timeout,
+            poll_policy=poll_policy,
+            sleep=sleep,
+            clock=clock,
+        )
+    )
@@ -0,0 +1,125 @@
+from collections.abc import Hashable
+from typing import Callable, Optional, Union
+
+
+def get_topological_levels(
+    node_lst: list[Hashable], dependency_dict: Optional[dict[Hashable, list]] = None
+) -> list[list[Hashable]]:
+    """
+    Sort the nodes of a directed acyclic graph into levels, each node only depends on nodes of previous levels. The
+    nodes of a level keep the order of the node list.
+
+    Args:
+        node_lst (list): The nodes of the graph.
+        dependency_dict (dict/None): Dictionary of nodes and the list of nodes they depend on.
+
+    Returns:
+        list[list]: The nodes of each level, starting with the nodes without dependencies.
+
+    Raises:
+        ValueError: If a dependency is not a node of the graph or if the graph contains a cycle.
+    """
+    if dependency_dict is None:
+        dependency_dict = {}
+    for node, upstream_lst in dependency_dict.items():
+        for upstream in [node] + list(upstream_lst):
+            if upstream not in node_lst:
+                raise ValueError(
+                    "The node " + str(upstream) + " is not defined in the workflow."
+                )
+    level_dict: dict[Hashable, int] = {}
+    remaining_lst = list(node_lst)
+    while len(remaining_lst) > 0:
+        ready_lst = [
+            node
+            for node in remaining_lst
+            if all(upstream in level_dict for upstream in dependency_dict.get(node, []))
+        ]
+        if len(ready_lst) == 0:
+            raise ValueError(
+                "The workflow contains a cycle between the nodes "
+                + str(remaining_lst)
+                + "."
+            )
+        for node in ready_lst:
+            level_dict[node] = 1 + max(
+                [level_dict[upstream] for upstream in dependency_dict.get(node, [])],
+                default=-1,
+            )
+        remaining_lst = [node for node in remaining_lst if node not in level_dict]
+    level_lst: list[list[Hashable]] = [
+        [] for _ in range(max(level_dict.values(), default=-1) + 1)
+    ]
+    for node in node_lst:
+        level_lst[level_dict[node]].append(node)
+    return level_lst
+
+
+def submit_workflow(
+    submit_jobs: Callable[[list[dict]], list[Union[int, None, Exception]]],
+    job_spec_dict: dict[Hashable, dict],
+    dependency_dict: Optional[dict[Hashable, list]] = None,
+    supports_dependencies: bool = True,
+) -> dict[Hashable, Union[int, None, Exception]]:
+    """
+    Submit a workflow of jobs. The jobs of each topological level are submitted together with a single call of the
+    submit_jobs() function and the job IDs of the upstream jobs are added to the dependency_list of the downstream jobs,
+    so the queuing system starts a job only after its upstream jobs finished successfully.
+
+    Args:
+        submit_jobs (Callable): Function which submits a list of job specifications and returns the job IDs, or the
+                                exception for failed submissions, in the same order.
+        job_spec_dict (dict): Dictionary of nodes and their job specification, each one a dictionary of keyword
+                              arguments for submit_job().
+        dependency_dict (dict/None): Dictionary of nodes and the list of nodes they depend on.
+        supports_dependencies (bool): The queuing system supports job dependencies. Defaults to True.
+
+    Returns:
+        dict: Dictionary of nodes and their job IDs. For failed submissions the exception is returned instead of the
+              job ID and the downstream jobs of a failed submission are not submitted.
+
+    Raises:
+        NotImplementedError: If the workflow contains dependencies which the queuing system does not support.
+    """
+    if dependency_dict is None:
+        dependency_dict = {}
+    level_lst = get_topological_levels(
+        node_lst=list(job_spec_dict.keys()), dependency_dict=dependency_dict
+    )
+    if not supports_dependencies and any(
+        len(upstream_lst) > 0 for upstream_lst in dependency_dict.values()
+    ):
+        raise NotImplementedError(
+            "The queuing system does not support job dependencies, so the workflow can not be submitted."
+        )
+    job_id_dict: dict[Hashable, Union[int, None, Exception]] = {}
+    for level in level_lst:
+        submit_lst = []
+        for node in level:
+            upstream_lst = dependency_dict.get(node, [])
+            failed_lst = [
+                upstream
+                for upstream in upstream_lst
+                if not isinstance(job_id_dict[upstream], int)
+            ]
+            if len(failed_lst) > 0:
+                job_id_dict[node] = RuntimeError(
+                    "The upstream jobs " + str(failed_lst) + " were not submitted."
+                )
+            else:
+                submit_lst.append(node)
+        if len(submit_lst) == 0:
+            continue
+        job_spec_lst = []
+        for node in submit_lst:
+            job_spec = dict(job_spec_dict[node])
+            upstream_id_lst = [
+                job_id_dict[upstream] for upstream in dependency_dict.get(node, [])
+            ]
+            if len(upstream_id_lst) > 0:
+                job_spec["dependency_list"] = (
+                    list(job_spec.get("dependency_list") or []) + upstream_id_lst
+                )
+            job_spec_lst.append(job_spec)
+        job_id_dict.update(zip(submit_lst, submit_jobs(job_spec_lst)))
+    return {node: job_id_dict[node] for node in job_spec_dict}
@@ -1,13 +1,31 @@
+import functools
+import itertools
 import os
-from typing import Callable, Optional, Union
-
-import pandas
-from jinja2 import Template
+import threading
+import time
+from collections.abc import Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from pysqa.base.abstract import QueueAdapterAbstractClass
 from pysqa.base.config import QueueAdapterWithConfig, Queues, read_config
 from pysqa.base.core import QueueAdapterCore, execute_command
 from pysqa.base.modular import ModularQueueAdapter
+from pysqa.base.registry import JobRegistry
+from pysqa.base.routing import (
+    ClusterJobID,
+    ClusterLoad,
+    cluster_routing_tuple,
+    fits_queue_limits,
+    sort_clusters_by_load,
+)
+from pysqa.base.status import StatusSnapshot
+from pysqa.base.wait import PollPolicy, iter_wait_for_jobs, wait_for_jobs
+from pysqa.base.workflow import submit_workflow
+
+if TYPE_CHECKING:
+    import pandas
+    from jinja2 import Template
 
 
 class QueueAdapter(QueueAdapterAbstractClass):
@@ -43,6 +61,9 @@ class QueueAdapter(QueueAdapterAbstractClass):
         directory: Optional[str] = None,
         queue_type: Optional[str] = None,
         execute_command: Callable = execute_command,
+        status_cache_ttl: Optional[float] = None,
+        job_registry: Optional[str] = None,
+        cluster_routing: Optional[str] = None,
     ):
         """
         Initialize the QueueAdapter.
@@ -50,47 +71,72 @@ class QueueAdapter(QueueAdapterAbstractClass):
         Args:
             directory (str): Directory containing the queue.yaml files and corresponding templates.
             execute_command (Callable): Function to execute commands.
+            status_cache_ttl (float/None): Time to live of the cached queue status in seconds, overwrites the
+                                           status_cache_ttl defined in the queue.yaml file.
+            job_registry (str/None): Path of a SQLite database to record the submitted jobs and their last known
+                                     status.
+            cluster_routing (str/None): Selection of the cluster for submit_job() in a clusters.yaml configuration,
+                                        either "active" or "least_loaded", overwrites the cluster_routing defined in
+                                        the clusters.yaml file.
         """
+        self._directory = directory
+        self._execute_command = execute_command
+        self._status_cache_ttl = status_cache_ttl
+        self._queue_dict: dict[str, QueueAdapterCore] = {}
+        self._multi_cluster = False
+        self._cluster_routing = "active"
+        self._cluster_load_ttl = 60.0
+        self._cluster_load_lock = threading.Lock()
+        self._cluster_load_dict: dict[str, tuple[float, ClusterLoad]] = {}
         if directory is not None:
             queue_yaml = os.path.join(directory, "queue.yaml")
             clusters_yaml = os.path.join(directory, "clusters.yaml")
             if os.path.exists(queue_yaml):
-                self._queue_dict = {
-                    "default": set_queue_adapter(
-                        config=read_config(file_name=queue_yaml),
-                        directory=directory,
-                        execute_command=execute_command,
-                    )
-                }
+                self._cluster_config_dict = {"default": queue_yaml}
                 primary_queue = "default"
             elif os.path.exists(clusters_yaml):
                 config = read_config(file_name=clusters_yaml)
-                self._queue_dict = {
-                    k: set_queue_adapter(
-                        config=read_config(file_name=os.path.join(directory, v)),
-                        directory=directory,
-                        execute_command=execute_command,
-                    )
-                    for k, v in config["cluster"].items()
+                self._cluster_config_dict = {
+                    k: os.path.join(directory, v) for k, v in config["cluster"].items()
                 }
                 primary_queue = config["cluster_primary"]
+                self._multi_cluster = True
+                self._cluster_routing = config.get("cluster_routing", "active")
+                self._cluster_load_ttl = config.get("cluster_load_ttl", 60.0)
             else:
                 raise ValueError(
                     "Neither a queue.yaml file nor a clusters.yaml file were found in "
                     + directory
                 )
-            self._adapter = self._queue_dict[primary_queue]
+            self._adapter = self._get_cluster_adapter(cluster_name=primary_queue)
+            self._active_cluster = primary_queue
         elif queue_type is not None:
-            self._queue_dict = {}
+            self._cluster_config_dict = {}
+            self._active_cluster = queue_type.upper()
             self._adapter = QueueAdapterCore(
                 queue_type=queue_type.upper(),
                 execute_command=execute_command,
             )
+            if status_cache_ttl is not None:
+                self._adapter.status_cache_ttl = status_cache_ttl
         else:
             raise ValueError(
                 "QueueAdapter requires either a 'directory' containing a "
                 "queue.yaml/clusters.yaml file or a 'queue_type' to be specified."
             )
+        if cluster_routing is not None:
+            self._cluster_routing = cluster_routing
+        if self._cluster_routing not in cluster_routing_tuple:
+            raise ValueError(
+                "The cluster_routing "
+                + self._cluster_routing
+                + " is not found in the list of supported routing modes "
+                + str(list(cluster_routing_tuple))
+            )
+        if job_registry is not None:
+            self._job_registry: Optional[JobRegistry] = JobRegistry(path=job_registry)
+        else:
+            self._job_registry = None
 
     def list_clusters(self) -> list[str]:
         """
@@ -99,16 +145,459 @@ class QueueAdapter(QueueAdapterAbstractClass):
         Returns:
             List of computing clusters
         """
-        return list(self._queue_dict.keys())
+        return list(self._cluster_config_dict.keys())
 
     def switch_cluster(self, cluster_name: str):
         """
-        Switch to a different computing cluster
+        Switch to a different computing cluster, the queue adapter of the cluster is created on the first switch.
+
+        Args:
+            cluster_name (str): name of the computing cluster
+        """
+        self._adapter = self._get_cluster_adapter(cluster_name=cluster_name)
+        self._active_cluster = cluster_name
+
+    def _get_cluster_adapter(self, cluster_name: str) -> QueueAdapterCore:
+        """
+        Get the queue adapter of a computing cluster. The configuration of the cluster is only read and validated when
+        the queue adapter is requested for the first time, so clusters which are not used do not add to the
+        initialization of the QueueAdapter.
+
+        Args:
+            cluster_name (str): name of the computing cluster
+
+        Returns:
+            QueueAdapterCore: The queue adapter of the computing cluster.
+
+        Raises:
+            KeyError: If the cluster is not defined in the configuration directory.
+        """
+        if cluster_name not in self._queue_dict:
+            if self._directory is None or cluster_name not in self._cluster_config_dict:
+                raise KeyError(
+                    "The cluster "
+                    + cluster_name
+                    + " is not defined, the available clusters are "
+                    + str(self.list_clusters())
+                    + "."
+                )
+            adapter = set_queue_adapter(
+                config=read_config(
+                    file_name=self._cluster_config_dict[cluster_name], validate=True
+                ),
+                directory=self._directory,
+                execute_command=self._execute_command,
+            )
+            if self._status_cache_ttl is not None:
+                adapter.status_cache_ttl = self._status_cache_ttl
+            self._queue_dict[cluster_name] = adapter
+        return self._queue_dict[cluster_name]
+
+    def get_adapter(self, cluster_name: Optional[str] = None) -> QueueAdapterCore:
+        """
+        Get the queue adapter of a computing cluster.
+
+        Args:
+            cluster_name (str/None): name of the computing cluster, the active cluster if None.
+
+        Returns:
+            QueueAdapterCore: The queue adapter of the computing cluster.
+        """
+        if cluster_name is None or cluster_name == self._active_cluster:
+            return self._adapter
+        return self._get_cluster_adapter(cluster_name=cluster_name)
+
+    def get_job_cluster(self, process_id: int) -> str:
+        """
+        Get the cluster a job was submitted to. Job IDs without a cluster belong to the active cluster.
+
+        Args:
+            process_id (int): The process id.
+
+        Returns:
+            str: The name of the cluster.
+        """
+        if (
+            isinstance(process_id, ClusterJobID)
+            and process_id.cluster in self._cluster_config_dict
+        ):
+            return process_id.cluster
+        return self._active_cluster
+
+    def _get_job_adapter(self, process_id: int) -> QueueAdapterCore:
+        """
+        Get the queue adapter of the cluster a job was submitted to.
+
+        Args:
+            process_id (int): The process id.
+
+        Returns:
+            QueueAdapterCore: The queue adapter of the cluster.
+        """
+        return self.get_adapter(
+            cluster_name=self.get_job_cluster(process_id=process_id)
+        )
+
+    def group_jobs_by_cluster(self, process_id_lst: list[int]) -> dict[str, list[int]]:
+        """
+        Group job IDs by the cluster they were submitted to.
+
+        Args:
+            process_id_lst (list[int]): The process ids.
+
+        Returns:
+            dict[str, list[int]]: The process ids of each cluster.
+        """
+        cluster_dict: dict[str, list[int]] = {}
+        for process_id in process_id_lst:
+            cluster_dict.setdefault(
+                self.get_job_cluster(process_id=process_id), []
+            ).append(process_id)
+        return cluster_dict
+
+    def _tag_job_id(
+        self, process_id: Union[int, None, Exception], cluster: str
+    ) -> Union[int, None, Exception]:
+        """
+        Record the cluster in the job ID for configurations with multiple clusters.
+
+        Args:
+            process_id (int/None/Exception): The job ID returned by the queue adapter of the cluster.
+            cluster (str): The name of the cluster.
+
+        Returns:
+            int/None/Exception: The ClusterJobID or the unchanged process_id for a single cluster or failed submissions.
+        """
+        if self._multi_cluster and isinstance(process_id, int):
+            return ClusterJobID(process_id, cluster=cluster)
+        return process_id
+
+    def get_cluster_load(self, cluster_name: str, refresh: bool = False) -> ClusterLoad:
+        """
+        Get the load of a cluster derived from its queue status. The load is cached for cluster_load_ttl seconds, which
+        is defined in the clusters.yaml file and defaults to 60 seconds.
 
         Args:
             cluster_name (str): name of the computing cluster
+            refresh (bool): Query the queuing system even if a cached load is available.
+
+        Returns:
+            ClusterLoad: The load of the cluster.
+        """
+        with self._cluster_load_lock:
+            entry = self._cluster_load_dict.get(cluster_name)
+        if (
+            refresh
+            or entry is None
+            or time.monotonic() - entry[0] >= self._cluster_load_ttl
+        ):
+            load = ClusterLoad.from_queue_status(
+                queue_status=self._get_cluster_adapter(
+                    cluster_name=cluster_name
+                ).get_queue_status_dict()
+            )
+            entry = (time.monotonic(), load)
+            with self._cluster_load_lock:
+                self._cluster_load_dict[cluster_name] = entry
+        return entry[1]
+
+    def select_cluster(
+        self,
+        queue: Optional[str] = None,
+        cores: Optional[int] = None,
+        run_time_max: Optional[int] = None,
+        memory_max: Optional[Union[int, str]] = None,
+    ) -> str:
         """
-        self._adapter = self._queue_dict[cluster_name]
+        Select the cluster with the shortest expected time to start among the clusters which provide the queue and
+        whose queue limits fit the requested resources. The loads of the clusters are queried in parallel, a cluster
+        whose queue status cannot be queried is only selected if no other cluster is eligible. The load is derived from
+        the queue status only, the number of idle cores is not queried. With the text status format the queue status
+        contains no submit and start times, so a cluster without pending jobs is preferred and otherwise the cluster
+        with the fewest pending jobs is selected.
+
+        Args:
+            queue (str/None): Name of the queue, the primary queue of each cluster if None.
+            cores (int/None): Number of hardware threads requested.
+            run_time_max (int/None): Maximum runtime in seconds.
+            memory_max (int/None): Amount of memory requested per node in GB.
+
+        Returns:
+            str: The name of the selected cluster.
+        """
+        eligible_lst = self._get_eligible_clusters(
+            queue=queue,
+            cores=cores,
+            run_time_max=run_time_max,
+            memory_max=memory_max,
+        )
+        if len(eligible_lst) == 0:
+            raise ValueError(
+                "None of the clusters "
+                + str(self.list_clusters())
+                + " provides the queue "
+                + str(queue)
+                + " with the requested resources."
+            )
+        return self._get_least_loaded_cluster(eligible_lst=eligible_lst)
+
+    def _get_eligible_clusters(
+        self,
+        queue: Optional[str] = None,
+        cores: Optional[int] = None,
+        run_time_max: Optional[int] = None,
+        memory_max: Optional[Union[int, str]] = None,
+    ) -> list[str]:
+        """
+        Get the clusters which provide the queue and whose queue limits fit the requested resources.
+
+        Args:
+            queue (str/None): Name of the queue, the primary queue of each cluster if None.
+            cores (int/None): Number of hardware threads requested.
+            run_time_max (int/None): Maximum runtime in seconds.
+            memory_max (int/None): Amount of memory requested per node in GB.
+
+        Returns:
+            list[str]: The names of the eligible clusters.
+        """
+        eligible_lst = []
+        for cluster_name in self._cluster_config_dict:
+            adapter = self._get_cluster_adapter(cluster_name=cluster_name)
+            if not isinstance(adapter, QueueAdapterWithConfig):
+                continue
+            cluster_queue = (
+                queue if queue is not None else adapter.config.get("queue_primary")
+            )
+            if cluster_queue not in adapter.queue_list:
+                continue
+            requested = (cores, run_time_max, memory_max)
+            checked = adapter.check_queue_parameters(
+                queue=cluster_queue,
+                cores=cores,
+                run_time_max=run_time_max,
+                memory_max=memory_max,
+            )
+            if fits_queue_limits(requested=requested, checked=checked):
+                eligible_lst.append(cluster_name)
+        return eligible_lst
+
+    def _get_least_loaded_cluster(self, eligible_lst: list[str]) -> str:
+        """
+        Get the cluster with the shortest expected time to start, the loads of the clusters are queried in parallel.
+
+        Args:
+            eligible_lst (list[str]): The names of the eligible clusters.
+
+        Returns:
+            str: The name of the least loaded cluster.
+        """
+        if len(eligible_lst) == 1:
+            return eligible_lst[0]
+        with ThreadPoolExecutor(max_workers=len(eligible_lst)) as executor:
+            future_dict = {
+                cluster_name: executor.submit(
+                    self.get_cluster_load, cluster_name=cluster_name
+                )
+                for cluster_name in eligible_lst
+            }
+        load_dict = {
+            cluster_name: future.result()
+            for cluster_name, future in future_dict.items()
+            if future.exception() is None
+        }
+        if len(load_dict) == 0:
+            return eligible_lst[0]
+        return sort_clusters_by_load(load_dict=load_dict)[0]
+
+    def get_submission_cluster(
+        self,
+        queue: Optional[str] = None,
+        cores: Optional[int] = None,
+        run_time_max: Optional[int] = None,
+        memory_max: Optional[Union[int, str]] = None,
+        dependency_list: Optional[list[int]] = None,
+    ) -> str:
+        """
+        Get the cluster a job is submitted to. A job which depends on other jobs is submitted to the cluster of these
+        jobs, as the queuing system can only resolve dependencies on its own jobs. Otherwise the job is submitted to the
+        least loaded cluster for the "least_loaded" cluster_routing and to the active cluster for the "active"
+        cluster_routing.
+
+        Args:
+            queue (str/None): Name of the queue, the primary queue of each cluster if None.
+            cores (int/None): Number of hardware threads requested.
+            run_time_max (int/None): Maximum runtime in seconds.
+            memory_max (int/None): Amount of memory requested per node in GB.
+            dependency_list (list[int]/None): Job ids of the jobs the job depends on.
+
+        Returns:
+            str: The name of the cluster.
+
+        Raises:
+            ValueError: If the jobs the job depends on were submitted to different clusters.
+        """
+        if dependency_list is not None and len(dependency_list) > 0:
+            cluster_lst = list(
+                dict.fromkeys(
+                    self.get_job_cluster(process_id=process_id)
+                    for process_id in dependency_list
+                )
+            )
+            if len(cluster_lst) > 1:
+                raise ValueError(
+                    "The jobs "
+                    + str([int(process_id) for process_id in dependency_list])
+                    + " the job depends on were submitted to different clusters "
+                    + str(cluster_lst)
+                    + "."
+                )
+            return cluster_lst[0]
+        if self._multi_cluster and self._cluster_routing == "least_loaded":
+            return self.select_cluster(
+                queue=queue,
+                cores=cores,
+                run_time_max=run_time_max,
+                memory_max=memory_max,
+            )
+        return self._active_cluster
+
+    def record_submitted_jobs(
+        self,
+        job_spec_lst: list[dict],
+        process_id_lst: list[Union[int, None, Exception]],
+        cluster: str,
+    ) -> list[Union[int, None, Exception]]:
+        """
+        Record the cluster in the job IDs of the submitted jobs and add the jobs to the job registry.
+
+        Args:
+            job_spec_lst (list[dict]): List of job specifications, each one a dictionary of keyword arguments for
+                                       submit_job().
+            process_id_lst (list): The job ids returned by the queue adapter of the cluster in the order of the job
+                                   specifications.
+            cluster (str): The cluster the jobs were submitted to.
+
+        Returns:
+            list: The ClusterJobIDs for a clusters.yaml configuration, otherwise the unchanged job ids.
+        """
+        process_id_lst = [
+            self._tag_job_id(process_id=process_id, cluster=cluster)
+            for process_id in process_id_lst
+        ]
+        self._register_jobs(
+            job_spec_lst=job_spec_lst, process_id_lst=process_id_lst, cluster=cluster
+        )
+        return process_id_lst
+
+    def record_submitted_job(
+        self, job_spec: dict, process_id: Optional[int], cluster: str
+    ) -> Optional[int]:
+        """
+        Record the cluster in the job ID of a single submitted job and add the job to the job registry.
+
+        Args:
+            job_spec (dict): The job specification, a dictionary of keyword arguments for submit_job().
+            process_id (int/None): The job id returned by the queue adapter of the cluster, None if the submission
+                                   failed.
+            cluster (str): The cluster the job was submitted to.
+
+        Returns:
+            int/None: The ClusterJobID for a clusters.yaml configuration, otherwise the unchanged job id.
+        """
+        if self._multi_cluster and process_id is not None:
+            process_id = ClusterJobID(process_id, cluster=cluster)
+        self._register_jobs(
+            job_spec_lst=[job_spec], process_id_lst=[process_id], cluster=cluster
+        )
+        return process_id
+
+    def record_status_of_jobs(self, cluster: str, status_dict: dict):
+        """
+        Update the last known status of jobs in the job registry, jobs which left the queue are recorded as finished.
+
+        Args:
+            cluster (str): The cluster the jobs were submitted to.
+            status_dict (dict): The status of each job id.
+        """
+        if self._job_registry is not None:
+            self._job_registry.update_status(
+                cluster=cluster,
+                status_dict={
+                    process_id: "finished" if status is None else status
+                    for process_id, status in status_dict.items()
+                },
+            )
+
+    def assemble_status_of_jobs(
+        self, process_id_lst: list[int], cluster_status_dict: dict[str, list]
+    ) -> list[Optional[str]]:
+        """
+        Merge the status lists queried per cluster into the status list of get_status_of_jobs() and record the status
+        in the job registry.
+
+        Args:
+            process_id_lst (list[int]): The process ids.
+            cluster_status_dict (dict[str, list]): The status list of each cluster in the order of
+                                                   group_jobs_by_cluster().
+
+        Returns:
+             List[str]: The status of the jobs in the order of the process ids.
+        """
+        cluster_dict = self.group_jobs_by_cluster(process_id_lst=process_id_lst)
+        status_dict: dict[int, Optional[str]] = {}
+        for cluster, cluster_process_id_lst in cluster_dict.items():
+            cluster_status_lst = cluster_status_dict[cluster]
+            if len(cluster_status_lst) != len(cluster_process_id_lst):
+                if len(cluster_dict) == 1:
+                    return cluster_status_lst
+                cluster_status_lst = [None] * len(cluster_process_id_lst)
+            else:
+                self.record_status_of_jobs(
+                    cluster=cluster,
+                    status_dict=dict(zip(cluster_process_id_lst, cluster_status_lst)),
+                )
+            status_dict.update(zip(cluster_process_id_lst, cluster_status_lst))
+        return [status_dict[process_id] for process_id in process_id_lst]
+
+    @property
+    def active_cluster(self) -> str:
+        """
+        Get the name of the active computing cluster.
+
+        Returns:
+            str: The name of the active computing cluster.
+        """
+        return self._active_cluster
+
+    @property
+    def job_registry(self) -> Optional[JobRegistry]:
+        """
+        Get the registry of the submitted jobs.
+
+        Returns:
+            JobRegistry: The job registry or None if no job registry was defined.
+        """
+        return self._job_registry
+
+    @property
+    def supports_array_jobs(self) -> bool:
+        """
+        Check if the active cluster supports submit_array_job(), which is not the case for remote clusters.
+
+        Returns:
+            bool: True if job arrays are supported.
+        """
+        return self._adapter.supports_array_jobs
+
+    @property
+    def supports_packed_jobs(self) -> bool:
+        """
+        Check if the active cluster supports submit_packed_jobs(), which is not the case for remote clusters.
+
+        Returns:
+            bool: True if packed jobs are supported.
+        """
+        return self._adapter.supports_packed_jobs
 
     @property
     def config(self) -> Union[dict, None]:
@@ -163,7 +652,7 @@ class QueueAdapter(QueueAdapterAbstractClass):
             return None
 
     @property
-    def queue_view(self) -> Union[pandas.DataFrame, None]:
+    def queue_view(self) -> Union["pandas.DataFrame", None]:
         """
         Get the Pandas DataFrame representation of the available queues.
 
@@ -198,9 +687,9 @@ class QueueAdapter(QueueAdapterAbstractClass):
         run_time_max: Optional[int] = None,
         dependency_list: Optional[list[int]] = None,
         command: Optional[str] = None,
-        submission_template: Optional[Union[str, Template]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
         **kwargs,
-    ) -> int:
+    ) -> Optional[int]:
         """
         Submits command to the given queue.
 
@@ -218,20 +707,306 @@ class QueueAdapter(QueueAdapterAbstractClass):
                       corresponding template.
 
         Returns:
-            int: Job id received from the queuing system for the job which was submitted
+            int/None: Job id received from the queuing system for the job which was submitted, for a clusters.yaml
+                      configuration a ClusterJobID which records the cluster the job was submitted to. None if the
+                      submission failed.
+        """
+        cluster = self.get_submission_cluster(
+            queue=queue,
+            cores=cores,
+            run_time_max=run_time_max,
+            memory_max=memory_max,
+            dependency_list=dependency_list,
+        )
+        job_spec: dict = {
+            "queue": queue,
+            "job_name": job_name,
+            "working_directory": working_directory,
+            "cores": cores,
+            "memory_max": memory_max,
+            "run_time_max": run_time_max,
+        }
+        job_kwargs = dict(
+            job_spec,
+            dependency_list=dependency_list,
+            command=command,
+            submission_template=submission_template,
+            **kwargs,
+        )
+        process_id = self.get_adapter(cluster_name=cluster).submit_job(**job_kwargs)
+        return self.record_submitted_job(
+            job_spec=job_spec, process_id=process_id, cluster=cluster
+        )
+
+    def submit_jobs(
+        self, job_spec_lst: list[dict], max_workers: int = 8
+    ) -> list[Union[int, None, Exception]]:
+        """
+        Submits multiple jobs, the submission scripts are rendered, written and submitted in parallel. For the
+        "least_loaded" cluster_routing the cluster is selected for each job specification, jobs with a dependency_list
+        are submitted to the cluster of the jobs they depend on.
+
+        Args:
+            job_spec_lst (list[dict]): List of job specifications, each one a dictionary with the keyword arguments of
+                                       submit_job(), like queue, job_name, working_directory, cores and command.
+            max_workers (int): Maximum number of jobs which are submitted at the same time.
+
+        Returns:
+            list: Job ids in the order of the job specifications, for failed submissions the exception is returned
+                  instead of the job id.
+        """
+        process_id_lst: list[Union[int, None, Exception]] = []
+        cluster_index_dict: dict[str, list[int]] = {}
+        for index, job_spec in enumerate(job_spec_lst):
+            try:
+                cluster = self.get_submission_cluster(
+                    queue=job_spec.get("queue"),
+                    cores=job_spec.get("cores"),
+                    run_time_max=job_spec.get("run_time_max"),
+                    memory_max=job_spec.get("memory_max"),
+                    dependency_list=job_spec.get("dependency_list"),
+                )
+            except ValueError as e:
+                process_id_lst.append(e)
+            else:
+                process_id_lst.append(None)
+                cluster_index_dict.setdefault(cluster, []).append(index)
+        for cluster, index_lst in cluster_index_dict.items():
+            cluster_process_id_lst = self._submit_jobs_to_cluster(
+                job_spec_lst=[job_spec_lst[index] for index in index_lst],
+                cluster=cluster,
+                max_workers=max_workers,
+            )
+            for index, process_id in zip(index_lst, cluster_process_id_lst):
+                process_id_lst[index] = process_id
+        return process_id_lst
+
+    def _submit_jobs_to_cluster(
+        self, job_spec_lst: list[dict], cluster: str, max_workers: int = 8
+    ) -> list[Union[int, None, Exception]]:
+        """
+        Submit multiple jobs to a given cluster and record them.
+
+        Args:
+            job_spec_lst (list[dict]): List of job specifications, each one a dictionary with the keyword arguments of
+                                       submit_job().
+            cluster (str): The cluster to submit the jobs to.
+            max_workers (int): Maximum number of jobs which are submitted at the same time.
+
+        Returns:
+            list: Job ids in the order of the job specifications, for failed submissions the exception is returned
+                  instead of the job id.
+        """
+        return self.record_submitted_jobs(
+            job_spec_lst=job_spec_lst,
+            process_id_lst=self.get_adapter(cluster_name=cluster).submit_jobs(
+                job_spec_lst=job_spec_lst, max_workers=max_workers
+            ),
+            cluster=cluster,
+        )
+
+    def submit_workflow(
+        self,
+        job_spec_dict: dict[Hashable, dict],
+        dependency_dict: Optional[dict[Hashable, list]] = None,
+        max_workers: int = 8,
+    ) -> dict[Hashable, Union[int, None, Exception]]:
+        """
+        Submits a workflow of jobs, the jobs of each topological level are submitted in parallel and the job ids of the
+        upstream jobs are added to the dependency_list of the downstream jobs. As the queuing system can only resolve
+        dependencies on its own jobs, the whole workflow is submitted to a single cluster. For the "least_loaded"
+        cluster_routing this is the least loaded cluster which fits all job specifications.
+
+        Args:
+            job_spec_dict (dict): Dictionary of nodes and their job specification, each one a dictionary with the
+                                  keyword arguments of submit_job().
+            dependency_dict (dict/None): Dictionary of nodes and the list of nodes they depend on.
+            max_workers (int): Maximum number of jobs which are submitted at the same time.
+
+        Returns:
+            dict: Job ids of the nodes, for failed submissions the exception is returned instead of the job id and the
+                  downstream jobs of a failed submission are not submitted.
+        """
+        if self._multi_cluster and self._cluster_routing == "least_loaded":
+            eligible_lst = list(self._cluster_config_dict.keys())
+            for job_spec in job_spec_dict.values():
+                job_eligible_lst = self._get_eligible_clusters(
+                    queue=job_spec.get("queue"),
+                    cores=job_spec.get("cores"),
+                    run_time_max=job_spec.get("run_time_max"),
+                    memory_max=job_spec.get("memory_max"),
+                )
+                eligible_lst = [
+                    cluster for cluster in eligible_lst if cluster in job_eligible_lst
+                ]
+            if len(eligible_lst) == 0:
+                raise ValueError(
+                    "None of the clusters "
+                    + str(self.list_clusters())
+                    + " fits all job specifications of the workflow."
+                )
+            cluster = self._get_least_loaded_cluster(eligible_lst=eligible_lst)
+        else:
+            cluster = self._active_cluster
+        return submit_workflow(
+            submit_jobs=functools.partial(
+                self._submit_jobs_to_cluster, cluster=cluster, max_workers=max_workers
+            ),
+            job_spec_dict=job_spec_dict,
+            dependency_dict=dependency_dict,
+            supports_dependencies=self.get_adapter(
+                cluster_name=cluster
+            ).supports_dependencies,
+        )
+
+    def submit_array_job(
+        self,
+        working_directory_lst: list[str],
+        command_lst: list[str],
+        queue: Optional[str] = None,
+        job_name: Optional[str] = None,
+        working_directory: Optional[str] = None,
+        cores: Optional[int] = None,
+        memory_max: Optional[Union[int, str]] = None,
+        run_time_max: Optional[int] = None,
+        dependency_list: Optional[list[int]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
+        **kwargs,
+    ) -> Optional[int]:
+        """
+        Submits a job array, each task of the job array runs one command in its own working directory. For the
+        "least_loaded" cluster_routing the whole job array is submitted to the selected cluster.
+
+        Args:
+            working_directory_lst (list[str]): Directories to run the tasks in
+            command_lst (list[str]): Shell commands to run in the tasks
+            queue (str/None):  Name of the queue to submit to, must be one of the names configured for this adapter
+                               (optional)
+            job_name (str/None):  Name of the job array for the underlying queuing system (optional)
+            working_directory (str/None):  Directory for the task manifest and the submission script (optional)
+            cores (int/None):  Number of hardware threads requested per task (optional)
+            memory_max (int/None):  Amount of memory requested per task in GB (optional)
+            run_time_max (int/None):  Maximum runtime per task in seconds (optional)
+            dependency_list(list[str]/None: Job ids of jobs to be completed before starting (optional)
+            **kwargs: allows writing additional parameters to the job submission script if they are available in the
+                      corresponding template.
+
+        Returns:
+            int/None: Job id received from the queuing system for the job array which was submitted, None if the
+                      submission failed.
         """
-        return self._adapter.submit_job(
+        cluster = self.get_submission_cluster(
+            queue=queue,
+            cores=cores,
+            run_time_max=run_time_max,
+            memory_max=memory_max,
+            dependency_list=dependency_list,
+        )
+        job_spec: dict = {
+            "queue": queue,
+            "job_name": job_name,
+            "working_directory": working_directory,
+            "cores": cores,
+            "memory_max": memory_max,
+            "run_time_max": run_time_max,
+        }
+        job_kwargs = dict(
+            job_spec,
+            dependency_list=dependency_list,
+            submission_template=submission_template,
+            **kwargs,
+        )
+        process_id = self.get_adapter(cluster_name=cluster).submit_array_job(
+            working_directory_lst=working_directory_lst,
+            command_lst=command_lst,
+            **job_kwargs,
+        )
+        return self.record_submitted_job(
+            job_spec=job_spec, process_id=process_id, cluster=cluster
+        )
+
+    def submit_packed_jobs(
+        self,
+        working_directory_lst: list[str],
+        command_lst: list[str],
+        queue: Optional[str] = None,
+        job_name: str = "pysqa",
+        working_directory: Optional[str] = None,
+        cores: Optional[int] = None,
+        task_cores: int = 1,
+        task_run_time: Optional[int] = None,
+        memory_max: Optional[Union[int, str]] = None,
+        run_time_max: Optional[int] = None,
+        dependency_list: Optional[list[int]] = None,
+        submission_template: Optional[Union[str, "Template"]] = None,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> list[Union[int, None, Exception]]:
+        """
+        Submits many short tasks packed into a small number of jobs, each job runs cores // task_cores tasks at the
+        same time. By default the jobs request the maximum number of cores and the maximum run time of the queue. For
+        the "least_loaded" cluster_routing all packs are submitted to the selected cluster.
+
+        Args:
+            working_directory_lst (list[str]): Directories to run the tasks in
+            command_lst (list[str]): Shell commands to run in the tasks
+            queue (str/None):  Name of the queue to submit to, must be one of the names configured for this adapter
+                               (optional)
+            job_name (str):  Name of the jobs for the underlying queuing system
+            working_directory (str/None):  Directory for the task manifests and the submission scripts (optional)
+            cores (int/None):  Number of hardware threads requested per job (optional)
+            task_cores (int):  Number of hardware threads used by each task
+            task_run_time (int/None):  Expected runtime per task in seconds, used to run multiple rounds of tasks in
+                                       each job (optional)
+            memory_max (int/None):  Amount of memory requested per job in GB (optional)
+            run_time_max (int/None):  Maximum runtime per job in seconds (optional)
+            dependency_list(list[str]/None: Job ids of jobs to be completed before starting (optional)
+            max_workers (int): Maximum number of jobs which are submitted at the same time.
+            **kwargs: allows writing additional parameters to the job submission script if they are available in the
+                      corresponding template.
+
+        Returns:
+            list: Job ids of the packs in the order of the tasks, for failed submissions the exception is returned
+                  instead of the job id.
+        """
+        cluster = self.get_submission_cluster(
+            queue=queue,
+            cores=cores,
+            run_time_max=run_time_max,
+            memory_max=memory_max,
+            dependency_list=dependency_list,
+        )
+        process_id_lst = self.get_adapter(cluster_name=cluster).submit_packed_jobs(
+            working_directory_lst=working_directory_lst,
+            command_lst=command_lst,
             queue=queue,
             job_name=job_name,
             working_directory=working_directory,
             cores=cores,
+            task_cores=task_cores,
+            task_run_time=task_run_time,
             memory_max=memory_max,
             run_time_max=run_time_max,
             dependency_list=dependency_list,
-            command=command,
             submission_template=submission_template,
+            max_workers=max_workers,
             **kwargs,
         )
+        return self.record_submitted_jobs(
+            job_spec_lst=[
+                {
+                    "queue": queue,
+                    "job_name": job_name,
+                    "working_directory": working_directory,
+                    "cores": cores,
+                    "memory_max": memory_max,
+                    "run_time_max": run_time_max,
+                }
+            ]
+            * len(process_id_lst),
+            process_id_lst=process_id_lst,
+            cluster=cluster,
+        )
 
     def enable_reservation(self, process_id: int) -> str:
         """
@@ -243,7 +1018,9 @@ class QueueAdapter(QueueAdapterAbstractClass):
         Returns:
             str: The result of enabling reservation.
         """
-        return self._adapter.enable_reservation(process_id=process_id)
+        return self._get_job_adapter(process_id=process_id).enable_reservation(
+            process_id=process_id
+        )
 
     def get_job_from_remote(self, working_directory: str):
         """
@@ -307,7 +1084,7 @@ class QueueAdapter(QueueAdapterAbstractClass):
                 "queue_type-only adapter."
             )
 
-    def delete_job(self, process_id: int) -> str:
+    def delete_job(self, process_id: int) -> Optional[str]:
         """
         Delete a job.
 
@@ -315,11 +1092,41 @@ class QueueAdapter(QueueAdapterAbstractClass):
             process_id (int): The process id.
 
         Returns:
-            str: The result of deleting the job.
+            str: The result of deleting the job or None if the delete command failed.
+        """
+        return self._get_job_adapter(process_id=process_id).delete_job(
+            process_id=process_id
+        )
+
+    def delete_jobs(
+        self, process_id_lst: list[int], max_workers: int = 8
+    ) -> list[Union[str, None]]:
+        """
+        Delete multiple jobs, the delete command is called once per chunk of job ids rather than once per job. Each
+        job is deleted on the cluster it was submitted to.
+
+        Args:
+            process_id_lst (list[int]): The process ids.
+            max_workers (int): Maximum number of delete commands which are executed at the same time.
+
+        Returns:
+            list: The result of deleting each job, None if the delete command failed.
         """
-        return self._adapter.delete_job(process_id=process_id)
+        result_dict: dict[int, Union[str, None]] = {}
+        for cluster, cluster_process_id_lst in self.group_jobs_by_cluster(
+            process_id_lst=process_id_lst
+        ).items():
+            result_dict.update(
+                zip(
+                    cluster_process_id_lst,
+                    self.get_adapter(cluster_name=cluster).delete_jobs(
+                        process_id_lst=cluster_process_id_lst, max_workers=max_workers
+                    ),
+                )
+            )
+        return [result_dict[process_id] for process_id in process_id_lst]
 
-    def get_queue_status(self, user: Optional[str] = None) -> pandas.DataFrame:
+    def get_queue_status(self, user: Optional[str] = None) -> "pandas.DataFrame":
         """
         Get the status of the queue.
 
@@ -331,38 +1138,210 @@ class QueueAdapter(QueueAdapterAbstractClass):
         """
         return self._adapter.get_queue_status(user=user)
 
-    def get_status_of_my_jobs(self) -> pandas.DataFrame:
+    def get_queue_status_dict(
+        self, user: Optional[str] = None
+    ) -> Union[dict[str, list], None]:
+        """
+        Get the status of the queue as dictionary of columns, without importing pandas.
+
+        Args:
+            user (str/None): The user.
+
+        Returns:
+            dict[str, list]: The status of the queue with one list per column.
+        """
+        return self._adapter.get_queue_status_dict(user=user)
+
+    def get_status_of_my_jobs(self, refresh: bool = False) -> "pandas.DataFrame":
         """
         Get the status of the user's jobs.
 
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
         Returns:
            pandas.DataFrame: The status of the user's jobs.
         """
-        return self._adapter.get_status_of_my_jobs()
+        df = self._adapter.get_status_of_my_jobs(refresh=refresh)
+        if self._job_registry is not None and df is not None:
+            self.record_status_of_jobs(
+                cluster=self._active_cluster,
+                status_dict=dict(zip(df["jobid"].tolist(), df["status"].tolist())),
+            )
+        return df
 
-    def get_status_of_job(self, process_id: int) -> str:
+    def get_status_of_job(
+        self, process_id: int, refresh: bool = False
+    ) -> Union[str, None]:
         """
         Get the status of a job.
 
         Args:
             process_id: The process id.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
 
         Returns:
-             str: The status of the job. Possible values are ['running', 'pending', 'error'].
+             str: The status of the job. Possible values are ['running', 'pending', 'error'], None if the job is not in
+                  the queue.
         """
-        return self._adapter.get_status_of_job(process_id=process_id)
+        status = self._get_job_adapter(process_id=process_id).get_status_of_job(
+            process_id=process_id, refresh=refresh
+        )
+        self.record_status_of_jobs(
+            cluster=self.get_job_cluster(process_id=process_id),
+            status_dict={process_id: status},
+        )
+        return status
 
-    def get_status_of_jobs(self, process_id_lst: list[int]) -> list[str]:
+    def get_status_of_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> list[Optional[str]]:
         """
         Get the status of multiple jobs.
 
         Args:
             process_id_lst: The list of process ids.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
 
         Returns:
              List[str]: The status of the jobs. Possible values are ['running', 'pending', 'error', ...].
         """
-        return self._adapter.get_status_of_jobs(process_id_lst=process_id_lst)
+        cluster_dict = self.group_jobs_by_cluster(process_id_lst=process_id_lst)
+        return self.assemble_status_of_jobs(
+            process_id_lst=process_id_lst,
+            cluster_status_dict={
+                cluster: self.get_adapter(cluster_name=cluster).get_status_of_jobs(
+                    process_id_lst=cluster_process_id_lst, refresh=refresh
+                )
+                for cluster, cluster_process_id_lst in cluster_dict.items()
+            },
+        )
+
+    def get_status_of_array_job(
+        self,
+        process_id: int,
+        working_directory: Optional[str] = None,
+        refresh: bool = False,
+    ) -> list[str]:
+        """
+        Get the status of the individual tasks of a job array.
+
+        Args:
+            process_id (int): The job id of the job array.
+            working_directory (str/None): The directory of the task manifest, only required for job arrays which were
+                                          not submitted by this adapter.
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+             List[str]: The status of the tasks. Possible values are ['running', 'pending', 'finished', 'error'].
+        """
+        return self._get_job_adapter(process_id=process_id).get_status_of_array_job(
+            process_id=process_id, working_directory=working_directory, refresh=refresh
+        )
+
+    def get_status_of_packed_jobs(
+        self, process_id_lst: list[int], refresh: bool = False
+    ) -> list[str]:
+        """
+        Get the status of the individual tasks of packed jobs, the status of the packs is requested with a single query
+        per cluster.
+
+        Args:
+            process_id_lst (list[int]): The job ids of the packs returned by submit_packed_jobs().
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+             List[str]: The status of the tasks. Possible values are ['running', 'pending', 'finished', 'error'].
+        """
+        status_lst: list[str] = []
+        for _, cluster_process_id_iter in itertools.groupby(
+            process_id_lst,
+            key=lambda process_id: self.get_job_cluster(process_id=process_id),
+        ):
+            cluster_process_id_lst = list(cluster_process_id_iter)
+            status_lst += self._get_job_adapter(
+                process_id=cluster_process_id_lst[0]
+            ).get_status_of_packed_jobs(
+                process_id_lst=cluster_process_id_lst, refresh=refresh
+            )
+        return status_lst
+
+    def wait_for_jobs(
+        self,
+        process_id_lst: list[int],
+        timeout: Optional[float] = None,
+        poll_policy: Optional[PollPolicy] = None,
+    ) -> dict[int, str]:
+        """
+        Wait until all jobs reached a terminal status, the status of all jobs is requested with a single query per poll.
+
+        Args:
+            process_id_lst (list[int]): The process ids.
+            timeout (float/None): Maximum time to wait in seconds, None to wait without limit.
+            poll_policy (PollPolicy/None): Policy for the adaptive poll interval.
+
+        Returns:
+            dict[int, str]: The terminal status of each job. Possible values are ['finished', 'error'].
+        """
+        return wait_for_jobs(
+            status_function=self.get_status_of_jobs,
+            process_id_lst=process_id_lst,
+            timeout=timeout,
+            poll_policy=poll_policy,
+        )
+
+    def iter_wait_for_jobs(
+        self,
+        process_id_lst: list[int],
+        timeout: Optional[float] = None,
+        poll_policy: Optional[PollPolicy] = None,
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Wait for jobs and yield each job as soon as it reached a terminal status.
+
+        Args:
+            process_id_lst (list[int]): The process ids.
+            timeout (float/None): Maximum time to wait in seconds, None to wait without limit.
+            poll_policy (PollPolicy/None): Policy for the adaptive poll interval.
+
+        Returns:
+            Iterator[tuple[int, str]]: The process id and the terminal status of each job.
+        """
+        return iter_wait_for_jobs(
+            status_function=self.get_status_of_jobs,
+            process_id_lst=process_id_lst,
+            timeout=timeout,
+            poll_policy=poll_policy,
+        )
+
+    def get_status_snapshot(self, refresh: bool = False) -> Optional[StatusSnapshot]:
+        """
+        Get a snapshot of the queue status indexed by the job ID, which allows fast lookups of the status, job name and
+        working directory of many jobs.
+
+        Args:
+            refresh (bool): Query the queuing system even if a cached queue status is available.
+
+        Returns:
+            StatusSnapshot: The snapshot of the queue status.
+        """
+        return self._adapter.get_status_snapshot(refresh=refresh)
+
+    @property
+    def status_cache_info(self) -> dict:
+        """
+        Get the hit and miss counters of the cached queue status of the active cluster.
+
+        Returns:
+            dict: Dictionary with the keys "hits", "misses" and "ttl".
+        """
+        return self._adapter.status_cache_info
+
+    def clear_status_cache(self):
+        """
+        Invalidate the cached queue status of the active cluster.
+        """
+        self._adapter.clear_status_cache()
 
     def check_queue_parameters(
         self,
@@ -398,6 +1377,41 @@ class QueueAdapter(QueueAdapterAbstractClass):
         else:
             return cores, run_time_max, memory_max
 
+    def _register_jobs(
+        self,
+        job_spec_lst: list[dict],
+        process_id_lst: list[Union[int, None, Exception]],
+        cluster: Optional[str] = None,
+    ):
+        """
+        Record the submitted jobs in the job registry, failed submissions are skipped. Jobs submitted without a queue
+        or a job name are recorded with the primary queue of the cluster and the default job name "pysqa".
+
+        Args:
+            job_spec_lst (list[dict]): List of job specifications, each one a dictionary of keyword arguments for
+                                       submit_job().
+            process_id_lst (list): The job ids returned by the submission in the order of the job specifications.
+            cluster (str/None): The cluster the jobs were submitted to, the active cluster if None.
+        """
+        if self._job_registry is not None:
+            if cluster is None:
+                cluster = self._active_cluster
+            adapter = self.get_adapter(cluster_name=cluster)
+            if isinstance(adapter, QueueAdapterWithConfig):
+                queue_primary = adapter.config.get("queue_primary")
+            else:
+                queue_primary = None
+            job_lst = []
+            for job_spec, process_id in zip(job_spec_lst, process_id_lst):
+                if isinstance(process_id, int):
+                    job = dict(job_spec, jobid=process_id)
+                    if job.get("queue") is None:
+                        job["queue"] = queue_primary
+                    if job.get("job_name") is None:
+                        job["job_name"] = "pysqa"
+                    job_lst.append(job)
+            self._job_registry.add_jobs(cluster=cluster, job_lst=job_lst)
+
 
 def set_queue_adapter(
     config: dict, directory: str, execute_command: Callable = execute_command
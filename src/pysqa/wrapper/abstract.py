@@ -1,9 +1,56 @@
+import functools
 import os
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-import pandas
-from jinja2 import Template
+from pysqa.base.status import queue_status_to_dataframe
+
+if TYPE_CHECKING:
+    import pandas
+    from jinja2 import Template
+
+# Maximum number of compiled submission templates which are kept in memory, shared by all wrappers.
+template_cache_size = 128
+
+
+@functools.lru_cache(maxsize=template_cache_size)
+def compile_template(source: str) -> "Template":
+    """
+    Compile a submission template. The compiled templates are cached by their source, so rendering many job scripts
+    from the same template compiles it only once.
+
+    Args:
+        source (str): The source of the jinja2 template.
+
+    Returns:
+        jinja2.Template: The compiled template.
+    """
+    from jinja2 import Template
+
+    return Template(source)
+
+
+def template_cache_info() -> dict:
+    """
+    Get the statistics of the cache of compiled submission templates.
+
+    Returns:
+        dict: Dictionary with the number of cache hits and misses, the maximum size and the current size of the cache.
+    """
+    cache_info = compile_template.cache_info()
+    return {
+        "hits": cache_info.hits,
+        "misses": cache_info.misses,
+        "maxsize": cache_info.maxsize,
+        "currsize": cache_info.currsize,
+    }
+
+
+def clear_template_cache():
+    """
+    Remove all compiled submission templates from the cache and reset the statistics.
+    """
+    compile_template.cache_clear()
 
 
 class SchedulerCommands(ABC):
@@ -50,10 +97,108 @@ class SchedulerCommands(ABC):
         """
         pass
 
+    def get_user_filter_arguments(self, user: str) -> Optional[list[str]]:
+        """
+        Returns the arguments to restrict the queue status command to the jobs of a single user.
+
+        Args:
+            user (str): The user name.
+
+        Returns:
+            list[str]: The additional arguments or None if the queuing system does not support this filter.
+        """
+        return None
+
+    def get_job_filter_arguments(
+        self, process_id_lst: list[int]
+    ) -> Optional[list[str]]:
+        """
+        Returns the arguments to restrict the queue status command to a list of job IDs.
+
+        Args:
+            process_id_lst (list[int]): List of job IDs.
+
+        Returns:
+            list[str]: The additional arguments or None if the queuing system does not support this filter.
+        """
+        return None
+
+    def get_accounting_commands(self, process_id_lst: list[int]) -> list[list[str]]:
+        """
+        Returns the commands to query the accounting of the queuing system for jobs which already left the queue.
+
+        Args:
+            process_id_lst (list[int]): List of job IDs.
+
+        Returns:
+            list[list[str]]: List of accounting commands, an empty list if the queuing system has no accounting.
+        """
+        return []
+
+    @staticmethod
+    def convert_accounting_status(accounting_output: str) -> dict[int, str]:
+        """
+        Converts the output of an accounting command to the status of the individual jobs. Jobs which ended are
+        reported as "finished", "failed", "cancelled", "timeout", "preempted", "out_of_memory" or "node_fail".
+
+        Args:
+            accounting_output (str): The output of the accounting command.
+
+        Returns:
+            dict[int, str]: Dictionary of job IDs and their status.
+        """
+        raise NotImplementedError()
+
+    @property
+    def supports_dependencies(self) -> bool:
+        """
+        Returns whether the submission template renders the dependency_list, so a job only starts after the jobs it
+        depends on finished successfully.
+
+        Returns:
+            bool: True if job dependencies are supported.
+        """
+        return False
+
+    @property
+    def supports_array_jobs(self) -> bool:
+        """
+        Returns whether the submission template renders the array_size, so the tasks of a task manifest can be
+        submitted as job array.
+
+        Returns:
+            bool: True if job arrays are supported.
+        """
+        return False
+
+    @property
+    def array_task_id_variable(self) -> str:
+        """
+        Returns the name of the environment variable which contains the index of the array task.
+
+        Returns:
+            str: The name of the environment variable.
+        """
+        raise NotImplementedError()
+
+    def get_array_task_command(self, manifest_path: str, array_size: int) -> str:
+        """
+        Returns the command executed by the job array, which runs the task of the task manifest matching the index of
+        the array task.
+
+        Args:
+            manifest_path (str): The path of the task manifest.
+            array_size (int): The number of tasks in the job array.
+
+        Returns:
+            str: The command to be executed in the submission script.
+        """
+        return "bash " + manifest_path + " $" + self.array_task_id_variable
+
     @staticmethod
     def render_submission_template(
         command: str,
-        submission_template: Union[str, Template],
+        submission_template: Union[str, "Template"],
         job_name: str = "pysqa",
         working_directory: str = os.path.abspath("."),
         cores: int = 1,
@@ -78,8 +223,8 @@ class SchedulerCommands(ABC):
         Returns:
             str: The rendered job submission template.
         """
-        if not isinstance(submission_template, Template):
-            submission_template = Template(submission_template)
+        if isinstance(submission_template, str):
+            submission_template = compile_template(source=submission_template)
         return submission_template.render(
             command=command,
             job_name=job_name,
@@ -120,8 +265,8 @@ class SchedulerCommands(ABC):
         """
         raise NotImplementedError()
 
-    @staticmethod
-    def convert_queue_status(queue_status_output: str) -> pandas.DataFrame:
+    @classmethod
+    def convert_queue_status(cls, queue_status_output: str) -> "pandas.DataFrame":
         """
         Converts the output of the queue status command to a pandas DataFrame.
 
@@ -131,4 +276,23 @@ class SchedulerCommands(ABC):
         Returns:
             pandas.DataFrame: The queue status as a DataFrame.
         """
+        return queue_status_to_dataframe(
+            queue_status=cls.convert_queue_status_to_dict(
+                queue_status_output=queue_status_output
+            )
+        )
+
+    @staticmethod
+    def convert_queue_status_to_dict(queue_status_output: str) -> dict[str, list]:
+        """
+        Converts the output of the queue status command to a dictionary of columns, each column is a list with one
+        entry per job. This is the pure python representation which is used for the status lookups and the command line
+        interface, the pandas DataFrame is only built by convert_queue_status().
+
+        Args:
+            queue_status_output (str): The output of the queue status command.
+
+        Returns:
+            dict[str, list]: The queue status as dictionary of columns.
+        """
         raise NotImplementedError()
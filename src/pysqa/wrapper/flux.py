@@ -1,12 +1,11 @@
 import os
-from typing import Optional, Union
-
-import pandas
-from flux.job import JobID
-from jinja2 import Template
+from typing import TYPE_CHECKING, Optional, Union
 
 from pysqa.wrapper.abstract import SchedulerCommands
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 template = """\
 #!/bin/bash
 # flux: --job-name={{job_name}}
@@ -26,6 +25,27 @@ template = """\
 {{command}}
 """
 
+result_dict = {
+    "COMPLETED": "finished",
+    "FAILED": "failed",
+    "CANCELED": "cancelled",
+    "TIMEOUT": "timeout",
+}
+
+# Abbreviated job states of the flux jobs output, other states are reported unchanged. Jobs in the CLEANUP state (C)
+# still hold their resources, so they are reported as running.
+queue_state_dict = {
+    "R": "running",
+    "S": "pending",
+    "P": "pending",
+    "D": "pending",
+    "C": "running",
+    "CA": "cancelled",
+    "CD": "finished",
+    "F": "failed",
+    "TO": "timeout",
+}
+
 
 class FluxCommands(SchedulerCommands):
     @property
@@ -43,43 +63,82 @@ class FluxCommands(SchedulerCommands):
         """Returns the command to get the queue status."""
         return ["flux", "jobs", "-a", "--no-header"]
 
+    @property
+    def supports_dependencies(self) -> bool:
+        """Returns whether the flux template renders the job dependencies."""
+        return True
+
+    @property
+    def supports_array_jobs(self) -> bool:
+        """Returns whether job arrays are supported, the tasks are submitted inside the batch job."""
+        return True
+
+    def get_array_task_command(self, manifest_path: str, array_size: int) -> str:
+        """Returns the command which runs the tasks as carbon copies of a single job inside the batch job."""
+        return (
+            "flux submit --quiet --wait --cc=1-"
+            + str(array_size)
+            + " bash "
+            + manifest_path
+            + " {cc}"
+        )
+
+    def get_user_filter_arguments(self, user: str) -> list[str]:
+        """Returns the arguments to restrict the queue status to the jobs of a user."""
+        return ["--user", user]
+
+    def get_job_filter_arguments(self, process_id_lst: list[int]) -> list[str]:
+        """Returns the arguments to restrict the queue status to a list of job IDs."""
+        return [str(process_id) for process_id in process_id_lst]
+
+    def get_accounting_commands(self, process_id_lst: list[int]) -> list[list[str]]:
+        """Returns the command to get the result of a list of inactive jobs, the result is empty for active jobs."""
+        return [
+            ["flux", "jobs", "-a", "--no-header", "-o", "{id} {result}"]
+            + [str(process_id) for process_id in process_id_lst]
+        ]
+
     @staticmethod
     def get_job_id_from_output(queue_submit_output: str) -> int:
         """Extracts the job ID from the output of the queue submit command."""
+        from flux.job import JobID
+
         return int(
             JobID(queue_submit_output.splitlines()[-1].rstrip().lstrip().split()[-1])
         )
 
     @staticmethod
-    def convert_queue_status(queue_status_output: str) -> pandas.DataFrame:
-        """Converts the queue status output into a pandas DataFrame."""
+    def convert_accounting_status(accounting_output: str) -> dict[int, str]:
+        """Converts the result of the inactive jobs into the status of the individual jobs."""
+        from flux.job import JobID
+
+        status_dict = {}
+        for line in accounting_output.splitlines():
+            job_id, _, state = line.strip().partition(" ")
+            state = state.strip()
+            if len(job_id) > 0 and len(state) > 0:
+                status_dict[int(JobID(job_id))] = result_dict.get(state, state.lower())
+        return status_dict
+
+    @staticmethod
+    def convert_queue_status_to_dict(queue_status_output: str) -> dict[str, list]:
+        """Converts the queue status output into a dictionary of columns."""
+        from flux.job import JobID
+
         line_split_lst = [line.split() for line in queue_status_output.splitlines()]
-        job_id_lst, user_lst, job_name_lst, status_lst = [], [], [], []
-        for entry in line_split_lst:
-            job_id_lst.append(JobID(entry[0]))
-            user_lst.append(entry[1])
-            job_name_lst.append(entry[2])
-            status_lst.append(entry[3])
-        df = pandas.DataFrame(
-            {
-                "jobid": job_id_lst,
-                "user": user_lst,
-                "jobname": job_name_lst,
-                "status": status_lst,
-            }
-        )
-        df.loc[df.status == "R", "status"] = "running"
-        df.loc[df.status == "S", "status"] = "pending"
-        df.loc[df.status == "D", "status"] = "pending"
-        df.loc[df.status == "C", "status"] = "error"
-        df.loc[df.status == "CA", "status"] = "error"
-        df.loc[df.status == "CD", "status"] = "finished"
-        return df
+        return {
+            "jobid": [int(JobID(entry[0])) for entry in line_split_lst],
+            "user": [entry[1] for entry in line_split_lst],
+            "jobname": [entry[2] for entry in line_split_lst],
+            "status": [
+                queue_state_dict.get(entry[3], entry[3]) for entry in line_split_lst
+            ],
+        }
 
     @staticmethod
     def render_submission_template(
         command: str,
-        submission_template: Union[str, Template] = template,
+        submission_template: Union[str, "Template"] = template,
         job_name: str = "pysqa",
         working_directory: str = os.path.abspath("."),
         cores: int = 1,
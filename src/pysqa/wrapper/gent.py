@@ -1,14 +1,15 @@
-from typing import Union
-
-import pandas
-
-from pysqa.wrapper.slurm import SlurmCommands
+from pysqa.wrapper.slurm import SlurmCommands, squeue_state_dict
 from pysqa.wrapper.slurm import template as template_slurm
 
 template = template_slurm
 
 
 class GentCommands(SlurmCommands):
+    @property
+    def supports_dependencies(self) -> bool:
+        """Returns whether job dependencies are supported, the job IDs of the modular adapter encode the cluster."""
+        return False
+
     @staticmethod
     def get_job_id_from_output(queue_submit_output: str) -> int:
         """
@@ -38,38 +39,33 @@ class GentCommands(SlurmCommands):
         return str(queue_submit_output.splitlines()[-1].rstrip().lstrip().split(";")[1])
 
     @staticmethod
-    def convert_queue_status(queue_status_output: str) -> Union[pandas.DataFrame, None]:
+    def convert_queue_status_to_dict(
+        queue_status_output: str,
+    ) -> dict[str, list]:
         """
-        Converts the queue status output into a pandas DataFrame.
+        Converts the queue status output into a dictionary of columns.
 
         Args:
             queue_status_output (str): The output of the queue status command.
 
         Returns:
-            pandas.DataFrame: The converted queue status.
+            dict[str, list]: The converted queue status, the columns are empty if there are no jobs.
 
         """
         qstat = queue_status_output.splitlines()
         queue = qstat[0].split(":")[1].strip()
-        if len(qstat) <= 1:  # first row contains cluster name, check if there are jobs
-            return None
-
+        # first row contains cluster name, the remaining rows the jobs
         line_split_lst = [line.split("|") for line in qstat[1:]]
-        job_id_lst, user_lst, status_lst, job_name_lst, queue_lst = zip(
-            *[
-                (int(jobid), user, status.lower(), jobname, queue)
-                for jobid, user, status, jobname in line_split_lst
-            ]
-        )
-        return pandas.DataFrame(
-            {
-                "cluster": queue_lst,
-                "jobid": job_id_lst,
-                "user": user_lst,
-                "jobname": job_name_lst,
-                "status": status_lst,
-            }
-        )
+        return {
+            "cluster": [queue] * len(line_split_lst),
+            "jobid": [int(line_split[0]) for line_split in line_split_lst],
+            "user": [line_split[1] for line_split in line_split_lst],
+            "jobname": [line_split[3] for line_split in line_split_lst],
+            "status": [
+                squeue_state_dict.get(line_split[2].lower(), line_split[2].lower())
+                for line_split in line_split_lst
+            ],
+        }
 
     @staticmethod
     def dependencies(dependency_list: list[str]) -> list[str]:
@@ -1,15 +1,15 @@
 import os
-from typing import Optional, Union
-
-import pandas
-from jinja2 import Template
+from typing import TYPE_CHECKING, Optional, Union
 
 from pysqa.wrapper.abstract import SchedulerCommands
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 template = """\
 #!/bin/bash
 #BSUB -q queue
-#BSUB -J {{job_name}}
+#BSUB -J {{job_name}}{% if array_size %}[1-{{array_size}}]{% endif %}
 #BSUB -o time.out
 #BSUB -n {{cores}}
 #BSUB -cwd {{working_directory}}
@@ -24,6 +24,20 @@ template = """\
 {{command}}
 """
 
+# Job states of the bjobs output, a query for specific job IDs also lists the recently finished jobs.
+state_dict = {
+    "RUN": "running",
+    "PROV": "running",
+    "PEND": "pending",
+    "WAIT": "pending",
+    "PSUSP": "pending",
+    "USUSP": "pending",
+    "SSUSP": "pending",
+    "DONE": "finished",
+    "EXIT": "failed",
+    "ZOMBI": "error",
+}
+
 
 class LsfCommands(SchedulerCommands):
     @property
@@ -41,40 +55,73 @@ class LsfCommands(SchedulerCommands):
         """Return the command to get the queue status."""
         return ["bjobs"]
 
+    @property
+    def supports_array_jobs(self) -> bool:
+        """Returns whether the LSF template renders the job array."""
+        return True
+
+    @property
+    def array_task_id_variable(self) -> str:
+        """Returns the environment variable containing the index of the array task."""
+        return "LSB_JOBINDEX"
+
+    def get_user_filter_arguments(self, user: str) -> list[str]:
+        """Return the arguments to restrict the queue status to the jobs of a user."""
+        return ["-u", user]
+
+    def get_job_filter_arguments(self, process_id_lst: list[int]) -> list[str]:
+        """Return the arguments to restrict the queue status to a list of job IDs."""
+        return [str(process_id) for process_id in process_id_lst]
+
+    def get_accounting_commands(self, process_id_lst: list[int]) -> list[list[str]]:
+        """Return the command to get the state of a list of jobs including the recently finished jobs."""
+        return [
+            ["bjobs", "-a", "-noheader", "-o", "jobid stat"]
+            + [str(process_id) for process_id in process_id_lst]
+        ]
+
     @staticmethod
     def get_job_id_from_output(queue_submit_output: str) -> int:
         """Extract the job ID from the queue submit output."""
         return int(queue_submit_output.split("<")[1].split(">", maxsplit=1)[0])
 
     @staticmethod
-    def convert_queue_status(queue_status_output: str) -> pandas.DataFrame:
-        """Convert the queue status output to a pandas DataFrame."""
-        job_id_lst, user_lst, status_lst, job_name_lst = [], [], [], []
+    def convert_accounting_status(accounting_output: str) -> dict[int, str]:
+        """Convert the output of bjobs -a to the status of the individual jobs."""
+        status_dict = {}
+        for line in accounting_output.splitlines():
+            job_id, _, state = line.strip().partition(" ")
+            state = state.strip()
+            if job_id.isdigit() and len(state) > 0:
+                status_dict[int(job_id)] = state_dict.get(state, state.lower())
+        return status_dict
+
+    @staticmethod
+    def convert_queue_status_to_dict(queue_status_output: str) -> dict[str, list]:
+        """Convert the queue status output to a dictionary of columns."""
+        queue_status: dict[str, list] = {
+            "jobid": [],
+            "user": [],
+            "jobname": [],
+            "status": [],
+        }
         line_split_lst = queue_status_output.split("\n")
         if len(line_split_lst) > 1:
             for line in line_split_lst[1:]:
                 line_segments = line.split()
                 if len(line_segments) > 1:
-                    job_id_lst.append(int(line_segments[0]))
-                    user_lst.append(line_segments[1])
-                    status_lst.append(line_segments[2])
-                    job_name_lst.append(line_segments[6])
-        df = pandas.DataFrame(
-            {
-                "jobid": job_id_lst,
-                "user": user_lst,
-                "jobname": job_name_lst,
-                "status": status_lst,
-            }
-        )
-        df.loc[df.status == "RUN", "status"] = "running"
-        df.loc[df.status == "PEND", "status"] = "pending"
-        return df
+                    queue_status["jobid"].append(int(line_segments[0]))
+                    queue_status["user"].append(line_segments[1])
+                    queue_status["jobname"].append(line_segments[6])
+                    queue_status["status"].append(
+                        state_dict.get(line_segments[2], line_segments[2])
+                    )
+        return queue_status
 
     @staticmethod
     def render_submission_template(
         command: str,
-        submission_template: Union[str, Template] = template,
+        submission_template: Union[str, "Template"] = template,
         job_name: str = "pysqa",
         working_directory: str = os.path.abspath("."),
         cores: int = 1,
@@ -1,10 +1,11 @@
 import os
-from typing import Optional, Union
-
-from jinja2 import Template
+from typing import TYPE_CHECKING, Optional, Union
 
 from pysqa.wrapper.abstract import SchedulerCommands
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 template = """\
 #!/bin/bash
 #MSUB -N {{job_name}}
@@ -53,7 +54,7 @@ class MoabCommands(SchedulerCommands):
     @staticmethod
     def render_submission_template(
         command: str,
-        submission_template: Union[str, Template] = template,
+        submission_template: Union[str, "Template"] = template,
         job_name: str = "pysqa",
         working_directory: str = os.path.abspath("."),
         cores: int = 1,
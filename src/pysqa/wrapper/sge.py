@@ -1,16 +1,20 @@
 import os
-from typing import Optional, Union
-
-import defusedxml.ElementTree as ETree
-import pandas
-from jinja2 import Template
+from typing import IO, TYPE_CHECKING, Optional, Union
 
+from pysqa.base.status import queue_status_to_dataframe
 from pysqa.wrapper.abstract import SchedulerCommands
 
+if TYPE_CHECKING:
+    import pandas
+    from jinja2 import Template
+
 template = """\
 #!/bin/bash
 #$ -N {{job_name}}
 #$ -wd {{working_directory}}
+{%- if array_size %}
+#$ -t 1-{{array_size}}
+{%- endif %}
 {%- if cores %}
 #$ -pe {{partition}} {{cores}}
 {%- endif %}
@@ -26,6 +30,51 @@ template = """\
 {{command}}
 """
 
+section_tag_lst = ["queue_info", "job_info"]
+job_field_lst = ["JB_job_number", "JB_owner", "JB_name", "state"]
+state_dict = {
+    "r": "running",
+    "t": "running",
+    "Rr": "running",
+    "Rt": "running",
+    "dr": "running",
+    "dt": "running",
+    "qw": "pending",
+    "hqw": "pending",
+    "hRwq": "pending",
+    "s": "pending",
+    "ts": "pending",
+    "S": "pending",
+    "tS": "pending",
+    "T": "pending",
+    "tT": "pending",
+    "Eqw": "error",
+    "Ehqw": "error",
+    "EhRqw": "error",
+}
+# qacct failure code of jobs killed by qmaster for exceeding the h_rt, h_cpu or h_vmem limit
+accounting_timeout_code = "37"
+
+
+class _StringReader:
+    """
+    Minimal file object to parse the output of the queue status command incrementally without copying it.
+
+    Args:
+        content (str): The output of the queue status command.
+    """
+
+    def __init__(self, content: str):
+        self._content = content
+        self._position = 0
+
+    def read(self, size: int = -1) -> str:
+        if size < 0:
+            size = len(self._content) - self._position
+        chunk = self._content[self._position : self._position + size]
+        self._position += len(chunk)
+        return chunk
+
 
 class SunGridEngineCommands(SchedulerCommands):
     @property
@@ -48,10 +97,57 @@ class SunGridEngineCommands(SchedulerCommands):
         """Return the command to get the queue status."""
         return ["qstat", "-xml"]
 
+    @property
+    def supports_array_jobs(self) -> bool:
+        """Returns whether the SGE template renders the job array."""
+        return True
+
+    @property
+    def array_task_id_variable(self) -> str:
+        """Returns the environment variable containing the index of the array task."""
+        return "SGE_TASK_ID"
+
+    def get_user_filter_arguments(self, user: str) -> list[str]:
+        """Return the arguments to restrict the queue status to the jobs of a user."""
+        return ["-u", user]
+
+    def get_accounting_commands(self, process_id_lst: list[int]) -> list[list[str]]:
+        """Return the qacct commands to get the final state of a list of jobs, qacct accepts one job per call."""
+        return [["qacct", "-j", str(process_id)] for process_id in process_id_lst]
+
     @staticmethod
-    def convert_queue_status(queue_status_output: str) -> pandas.DataFrame:
+    def convert_accounting_status(accounting_output: str) -> dict[int, str]:
+        """Convert the output of qacct to the status of the individual jobs, failed tasks take precedence."""
+        status_dict: dict[int, str] = {}
+        record: dict[str, str] = {}
+        for line in accounting_output.splitlines() + ["="]:
+            if line.startswith("="):
+                if record.get("jobnumber", "").isdigit():
+                    job_id = int(record["jobnumber"])
+                    failed = record.get("failed", "0").split()[0]
+                    if failed == accounting_timeout_code:
+                        status = "timeout"
+                    elif failed == "0" and record.get("exit_status", "0") == "0":
+                        status = "finished"
+                    else:
+                        status = "failed"
+                    if status_dict.get(job_id, "finished") == "finished":
+                        status_dict[job_id] = status
+                record = {}
+            else:
+                key, _, value = line.partition(" ")
+                record[key] = value.strip()
+        return status_dict
+
+    @staticmethod
+    def convert_queue_status(
+        queue_status_output: Union[str, IO[str], IO[bytes]],
+    ) -> "pandas.DataFrame":
         """Convert the queue status output to a pandas DataFrame.
 
+        In contrast to the dictionary of columns, the index of the DataFrame restarts for the pending jobs, matching the
+        concatenation of the running and pending jobs.
+
         Args:
             queue_status_output: The output of the queue status command.
 
@@ -59,28 +155,37 @@ class SunGridEngineCommands(SchedulerCommands):
             A pandas DataFrame containing the converted queue status.
 
         """
-
-        def leaf_to_dict(leaf):
-            return [
-                {sub_child.tag: sub_child.text for sub_child in child} for child in leaf
+        queue_status, section_length_lst = _parse_queue_status(
+            queue_status_output=queue_status_output
+        )
+        df = queue_status_to_dataframe(queue_status=queue_status)
+        if df is not None:
+            df.index = [
+                position
+                for section_length in section_length_lst[:2]
+                for position in range(section_length)
             ]
+        return df
 
-        tree = ETree.fromstring(queue_status_output)
-        df_running_jobs = pandas.DataFrame(leaf_to_dict(leaf=tree[0]))
-        df_pending_jobs = pandas.DataFrame(leaf_to_dict(leaf=tree[1]))
-        df_merge = pandas.concat([df_running_jobs, df_pending_jobs], sort=True)
-        df_merge.loc[df_merge.state == "r", "state"] = "running"
-        df_merge.loc[df_merge.state == "qw", "state"] = "pending"
-        df_merge.loc[df_merge.state == "Eqw", "state"] = "error"
-        return pandas.DataFrame(
-            {
-                "jobid": pandas.to_numeric(df_merge.JB_job_number),
-                "user": df_merge.JB_owner,
-                "jobname": df_merge.JB_name,
-                "status": df_merge.state,
-                "working_directory": [""] * len(df_merge),
-            }
-        )
+    @staticmethod
+    def convert_queue_status_to_dict(
+        queue_status_output: Union[str, IO[str], IO[bytes]],
+    ) -> dict[str, list]:
+        """Convert the queue status output to a dictionary of columns.
+
+        The XML document is parsed incrementally, only the job number, the owner, the job name and the state of each
+        job are kept and the parsed elements are cleared, so only the extracted fields are kept in memory rather than the
+        whole document. In addition to a string, the output can be provided as file object, for example the stdout of the
+        qstat process.
+
+        Args:
+            queue_status_output: The output of the queue status command.
+
+        Returns:
+            A dictionary of columns containing the converted queue status.
+
+        """
+        return _parse_queue_status(queue_status_output=queue_status_output)[0]
 
     @staticmethod
     def get_job_id_from_output(queue_submit_output: str) -> int:
@@ -90,7 +195,7 @@ class SunGridEngineCommands(SchedulerCommands):
     @staticmethod
     def render_submission_template(
         command: str,
-        submission_template: Union[str, Template] = template,
+        submission_template: Union[str, "Template"] = template,
         job_name: str = "pysqa",
         working_directory: str = os.path.abspath("."),
         cores: int = 1,
@@ -126,3 +231,52 @@ class SunGridEngineCommands(SchedulerCommands):
             submission_template=submission_template,
             **kwargs,
         )
+
+
+def _parse_queue_status(
+    queue_status_output: Union[str, IO[str], IO[bytes]],
+) -> tuple[dict[str, list], list[int]]:
+    """Parse the XML output of qstat incrementally.
+
+    Args:
+        queue_status_output: The output of the queue status command.
+
+    Returns:
+        The queue status as dictionary of columns and the number of jobs in each section of the XML document.
+
+    """
+    import defusedxml.ElementTree as ETree
+
+    source: Union[IO[str], IO[bytes], _StringReader] = (
+        _StringReader(queue_status_output)
+        if isinstance(queue_status_output, str)
+        else queue_status_output
+    )
+    job_id_lst: list[int] = []
+    user_lst: list[Optional[str]] = []
+    job_name_lst: list[Optional[str]] = []
+    status_lst: list[Optional[str]] = []
+    section_length_lst = [0]
+    for _, element in ETree.iterparse(source, events=("end",)):
+        if element.tag == "job_list":
+            job = {
+                child.tag: child.text for child in element if child.tag in job_field_lst
+            }
+            job_id_lst.append(int(job["JB_job_number"]))
+            user_lst.append(job.get("JB_owner"))
+            job_name_lst.append(job.get("JB_name"))
+            state = job.get("state")
+            status_lst.append(None if state is None else state_dict.get(state, state))
+            section_length_lst[-1] += 1
+            element.clear()
+        elif element.tag in section_tag_lst:
+            section_length_lst.append(0)
+            element.clear()
+    queue_status: dict[str, list] = {
+        "jobid": job_id_lst,
+        "user": user_lst,
+        "jobname": job_name_lst,
+        "status": status_lst,
+        "working_directory": [""] * len(job_id_lst),
+    }
+    return queue_status, section_length_lst
@@ -1,11 +1,12 @@
+import json
 import os
-from typing import Optional, Union
-
-import pandas
-from jinja2 import Template
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from pysqa.wrapper.abstract import SchedulerCommands
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 template = """\
 #!/bin/bash
 #SBATCH --output=time.out
@@ -13,6 +14,9 @@ template = """\
 #SBATCH --chdir={{working_directory}}
 #SBATCH --get-user-env=L
 #SBATCH --partition={{partition}}
+{%- if array_size %}
+#SBATCH --array=1-{{array_size}}
+{%- endif %}
 {%- if run_time_max %}
 #SBATCH --time={{ [1, run_time_max // 60]|max }}
 {%- endif %}
@@ -28,6 +32,133 @@ template = """\
 """
 
 
+state_dict = {
+    "RUNNING": "running",
+    "COMPLETING": "running",
+    "CONFIGURING": "running",
+    "RESIZING": "running",
+    "SIGNALING": "running",
+    "STAGE_OUT": "running",
+    "PENDING": "pending",
+    "REQUEUED": "pending",
+    "REQUEUE_FED": "pending",
+    "REQUEUE_HOLD": "pending",
+    "RESV_DEL_HOLD": "pending",
+    "SUSPENDED": "pending",
+    "STOPPED": "pending",
+    "COMPLETED": "finished",
+    "BOOT_FAIL": "failed",
+    "FAILED": "failed",
+    "SPECIAL_EXIT": "failed",
+    "CANCELLED": "cancelled",
+    "REVOKED": "cancelled",
+    "DEADLINE": "timeout",
+    "TIMEOUT": "timeout",
+    "PREEMPTED": "preempted",
+    "OUT_OF_MEMORY": "out_of_memory",
+    "NODE_FAIL": "node_fail",
+}
+
+# Abbreviated job states of the squeue text output in lower case, a query for specific job IDs also lists the recently
+# finished jobs.
+squeue_state_dict = {
+    "r": "running",
+    "cg": "running",
+    "cf": "running",
+    "rs": "running",
+    "si": "running",
+    "so": "running",
+    "pd": "pending",
+    "rq": "pending",
+    "rf": "pending",
+    "rh": "pending",
+    "rd": "pending",
+    "s": "pending",
+    "st": "pending",
+    "cd": "finished",
+    "bf": "failed",
+    "f": "failed",
+    "se": "failed",
+    "ca": "cancelled",
+    "rv": "cancelled",
+    "dl": "timeout",
+    "to": "timeout",
+    "pr": "preempted",
+    "oom": "out_of_memory",
+    "nf": "node_fail",
+}
+
+
+def _get_json_jobs(content: str) -> list[dict]:
+    """
+    Get the "jobs" list of the JSON output of squeue or sacct.
+
+    Args:
+        content (str): The JSON output of squeue --json or sacct --json.
+
+    Returns:
+        list[dict]: The individual jobs, an empty list for an empty output.
+    """
+    if len(content.strip()) == 0:
+        return []
+    return json.loads(content)["jobs"]
+
+
+def _get_json_value(value: Any) -> Any:
+    """
+    Get the plain value of a JSON field, Slurm wraps numbers as {"set": ..., "infinite": ..., "number": ...} and
+    states as lists in recent versions.
+
+    Args:
+        value: The value of the JSON field.
+
+    Returns:
+        The plain value or None if the value is not set.
+    """
+    if isinstance(value, dict):
+        if not value.get("set", True) or value.get("infinite", False):
+            return None
+        return value.get("number")
+    elif isinstance(value, list):
+        return value[0] if len(value) > 0 else None
+    else:
+        return value
+
+
+def _convert_json_job(job: dict) -> tuple:
+    """
+    Extract the columns of the queue status from a single job of the squeue --json or sacct --json output.
+
+    Args:
+        job (dict): The job.
+
+    Returns:
+        tuple: The job ID, user, job name, status, working directory, partition, nodes, submit time, start time, reason
+               and the ID of the job array the job belongs to.
+    """
+    state = job.get("state")
+    time_dict = job.get("time", {})
+    if isinstance(state, dict):  # sacct
+        state_name = _get_json_value(state.get("current"))
+        reason = state.get("reason")
+    else:  # squeue
+        state_name = _get_json_value(job.get("job_state", state))
+        reason = job.get("state_reason")
+    return (
+        int(_get_json_value(job["job_id"])),
+        job.get("user_name", job.get("user")),
+        job.get("name"),
+        state_dict.get(state_name, str(state_name).lower()),
+        job.get("current_working_directory", job.get("working_directory")),
+        job.get("partition"),
+        job.get("nodes"),
+        _get_json_value(job.get("submit_time", time_dict.get("submission"))) or None,
+        _get_json_value(job.get("start_time", time_dict.get("start"))) or None,
+        reason if reason != "None" else None,
+        _get_json_value(job.get("array_job_id")) or None,
+    )
+
+
 class SlurmCommands(SchedulerCommands):
     @property
     def submit_job_command(self) -> list[str]:
@@ -42,7 +173,45 @@ class SlurmCommands(SchedulerCommands):
     @property
     def get_queue_status_command(self) -> list[str]:
         """Returns the command to get the queue status from Slurm."""
-        return ["squeue", "--format", "%A|%u|%t|%.15j|%Z", "--noheader"]
+        return ["squeue", "--format", "%A|%u|%t|%.15j|%Z|%F", "--noheader"]
+
+    @property
+    def supports_dependencies(self) -> bool:
+        """Returns whether the Slurm template renders the job dependencies."""
+        return True
+
+    @property
+    def supports_array_jobs(self) -> bool:
+        """Returns whether the Slurm template renders the job array."""
+        return True
+
+    @property
+    def array_task_id_variable(self) -> str:
+        """Returns the environment variable containing the index of the array task."""
+        return "SLURM_ARRAY_TASK_ID"
+
+    def get_user_filter_arguments(self, user: str) -> list[str]:
+        """Returns the arguments to restrict the queue status to the jobs of a user."""
+        return ["--user", user]
+
+    def get_job_filter_arguments(self, process_id_lst: list[int]) -> list[str]:
+        """Returns the arguments to restrict the queue status to a list of job IDs."""
+        return ["--jobs", ",".join([str(process_id) for process_id in process_id_lst])]
+
+    def get_accounting_commands(self, process_id_lst: list[int]) -> list[list[str]]:
+        """Returns the sacct command to get the final state of a list of jobs."""
+        return [
+            [
+                "sacct",
+                "--noheader",
+                "--parsable2",
+                "--allocations",
+                "--format",
+                "JobIDRaw,State",
+                "--jobs",
+                ",".join([str(process_id) for process_id in process_id_lst]),
+            ]
+        ]
 
     @staticmethod
     def get_job_id_from_output(queue_submit_output: str) -> int:
@@ -50,36 +219,64 @@ class SlurmCommands(SchedulerCommands):
         return int(queue_submit_output.splitlines()[-1].rstrip().lstrip().split()[-1])
 
     @staticmethod
-    def convert_queue_status(queue_status_output: str) -> pandas.DataFrame:
-        """Converts the queue status output from Slurm into a pandas DataFrame."""
+    def convert_accounting_status(accounting_output: str) -> dict[int, str]:
+        """Converts the output of sacct to the status of the individual jobs."""
+        status_dict = {}
+        for line in accounting_output.splitlines():
+            job_id, _, state = line.partition("|")
+            job_id = job_id.split("_")[0].split(".")[0]
+            if job_id.isdigit() and len(state.split()) > 0:
+                state_name = state.split()[0].rstrip("+")
+                status_dict[int(job_id)] = state_dict.get(
+                    state_name, state_name.lower()
+                )
+        return status_dict
+
+    @staticmethod
+    def convert_queue_status_to_dict(queue_status_output: str) -> dict[str, list]:
+        """
+        Converts the queue status output from Slurm into a dictionary of columns. The running elements of a job array
+        are listed with their own job ID, so the ID of the job array is recorded in the array_jobid column, for jobs which
+        are not part of a job array Slurm reports their own job ID. Output
+        without the array job ID, as written by the previous format, is converted without the array_jobid column.
+
+        Args:
+            queue_status_output (str): The output of the queue status command.
+
+        Returns:
+            dict[str, list]: The queue status as dictionary of columns.
+        """
         line_split_lst = [line.split("|") for line in queue_status_output.splitlines()]
-        if len(line_split_lst) != 0:
-            job_id_lst, user_lst, status_lst, job_name_lst, working_directory_lst = zip(
-                *[
-                    (int(jobid), user, status.lower(), jobname, working_directory)
-                    for jobid, user, status, jobname, working_directory in line_split_lst
-                ]
+        queue_status: dict[str, list] = {
+            "jobid": [],
+            "user": [],
+            "jobname": [],
+            "status": [],
+            "working_directory": [],
+        }
+        array_jobid_lst = []
+        for (
+            jobid,
+            user,
+            status,
+            jobname,
+            working_directory,
+            *array_jobid,
+        ) in line_split_lst:
+            queue_status["jobid"].append(int(jobid))
+            queue_status["user"].append(user)
+            queue_status["jobname"].append(jobname)
+            queue_status["status"].append(
+                squeue_state_dict.get(status.lower(), status.lower())
             )
-        else:
-            job_id_lst, user_lst, status_lst, job_name_lst, working_directory_lst = (
-                (),
-                (),
-                (),
-                (),
-                (),
-            )
-        df = pandas.DataFrame(
-            {
-                "jobid": job_id_lst,
-                "user": user_lst,
-                "jobname": job_name_lst,
-                "status": status_lst,
-                "working_directory": working_directory_lst,
-            }
-        )
-        df.loc[df.status == "r", "status"] = "running"
-        df.loc[df.status == "pd", "status"] = "pending"
-        return df
+            queue_status["working_directory"].append(working_directory)
+            array_jobid_lst += array_jobid
+        if len(line_split_lst) > 0 and len(array_jobid_lst) == len(line_split_lst):
+            queue_status["array_jobid"] = [
+                int(jobid) if jobid.strip().isdigit() else None
+                for jobid in array_jobid_lst
+            ]
+        return queue_status
 
     @staticmethod
     def dependencies(dependency_list: list[str]) -> list[str]:
@@ -92,7 +289,7 @@ class SlurmCommands(SchedulerCommands):
     @staticmethod
     def render_submission_template(
         command: str,
-        submission_template: Union[str, Template] = template,
+        submission_template: Union[str, "Template"] = template,
         job_name: str = "pysqa",
         working_directory: str = os.path.abspath("."),
         cores: int = 1,
@@ -128,3 +325,74 @@ class SlurmCommands(SchedulerCommands):
             submission_template=submission_template,
             **kwargs,
         )
+
+
+class SlurmJsonCommands(SlurmCommands):
+    """
+    Slurm commands using the JSON output of squeue. The JSON output does not truncate job names, is not confused by
+    separators in the individual fields and provides the partition, the nodes, the submit and start time and the reason
+    a job is pending without an additional query.
+    """
+
+    @property
+    def get_queue_status_command(self) -> list[str]:
+        """Returns the command to get the queue status from Slurm in JSON format."""
+        return ["squeue", "--json"]
+
+    def get_accounting_commands(self, process_id_lst: list[int]) -> list[list[str]]:
+        """Returns the sacct command to get the final state of a list of jobs in JSON format."""
+        return [
+            [
+                "sacct",
+                "--json",
+                "--jobs",
+                ",".join([str(process_id) for process_id in process_id_lst]),
+            ]
+        ]
+
+    @staticmethod
+    def convert_accounting_status(accounting_output: str) -> dict[int, str]:
+        """Converts the JSON output of sacct to the status of the individual jobs."""
+        return {
+            job_id: status
+            for job_id, _, _, status, *_ in (
+                _convert_json_job(job=job)
+                for job in _get_json_jobs(content=accounting_output)
+            )
+        }
+
+    @staticmethod
+    def convert_queue_status_to_dict(queue_status_output: str) -> dict[str, list]:
+        """
+        Converts the JSON output of squeue --json or sacct --json into a dictionary of columns. Only the required fields
+        of each job are extracted. The submit time and the start time are given in
+        seconds since the epoch.
+
+        Args:
+            queue_status_output (str): The JSON output of the queue status command.
+
+        Returns:
+            dict[str, list]: The queue status as dictionary of columns.
+        """
+        column_lst = [
+            "jobid",
+            "user",
+            "jobname",
+            "status",
+            "working_directory",
+            "partition",
+            "nodes",
+            "submit_time",
+            "start_time",
+            "reason",
+            "array_jobid",
+        ]
+        row_lst = [
+            _convert_json_job(job=job)
+            for job in _get_json_jobs(content=queue_status_output)
+        ]
+        if len(row_lst) == 0:
+            return {column: [] for column in column_lst}
+        return {
+            column: list(values) for column, values in zip(column_lst, zip(*row_lst))
+        }
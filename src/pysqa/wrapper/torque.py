@@ -1,16 +1,20 @@
 import os
 import re
-from typing import Optional, Union
-
-import pandas
-from jinja2 import Template
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Optional, Union
 
 from pysqa.wrapper.abstract import SchedulerCommands
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 template = """\
 #!/bin/bash
 #PBS -l ncpus={{cores}}
 #PBS -N {{job_name}}
+{%- if array_size %}
+#PBS -t 1-{{array_size}}
+{%- endif %}
 {%- if memory_max %}
 #PBS -l mem={{ memory_max| int }}GB
 {%- endif %}
@@ -25,6 +29,61 @@ template = """\
 {{command}}
 """
 
+token_pattern = re.compile(
+    r"^Job Id: *(?P<jobid>[^\r\n]+)"
+    r"|^[ \t]+(?P<key>Job_Name|Job_Owner|job_state|Variable_List) = "
+    r"(?P<value>[^\r\n]*(?:\r?\n(?:\t|        )[^\r\n]*)*)",
+    re.MULTILINE,
+)
+# Job states of the full qstat output which are not pending, a query for specific job IDs also lists the completed jobs
+# which are kept by the server.
+state_dict = {
+    "R": "running",
+    "E": "running",
+    "B": "running",
+    "C": "finished",
+    "F": "finished",
+    "X": "finished",
+}
+continuation_pattern = re.compile(r"\r?\n(?:\t|        )")
+working_directory_pattern = re.compile(
+    r"PBS_O_WORKDIR=(.*?)(?:,[A-Za-z_][A-Za-z0-9_]*=|,?$)"
+)
+
+
+def _iter_job_blocks(line_iter: Iterable[str]) -> Iterator[str]:
+    """
+    Group the lines of the qstat -f output into blocks of one job each, so only a single job is kept in memory.
+
+    Args:
+        line_iter (Iterable[str]): The lines of the qstat -f output.
+
+    Returns:
+        Iterator[str]: The qstat -f output of the individual jobs.
+    """
+    block_lst: list[str] = []
+    for line in line_iter:
+        if line.startswith("Job Id:") and len(block_lst) > 0:
+            yield "\n".join(block_lst)
+            block_lst = []
+        block_lst.append(line.rstrip("\r\n"))
+    if len(block_lst) > 0:
+        yield "\n".join(block_lst)
+
+
+def _iter_tokens(content: str) -> Iterator[tuple[Optional[str], ...]]:
+    """
+    Iterate over the tokens of the qstat -f output in a single pass of the compiled token pattern. Only the job IDs and
+    the attributes Job_Name, Job_Owner, job_state and Variable_List are extracted, all other lines are skipped.
+
+    Args:
+        content (str): The qstat -f output.
+
+    Returns:
+        Iterator[tuple]: The job ID for the first line of a job or the attribute name and the attribute value.
+    """
+    return map(re.Match.groups, token_pattern.finditer(content))
+
 
 class TorqueCommands(SchedulerCommands):
     @property
@@ -42,6 +101,29 @@ class TorqueCommands(SchedulerCommands):
         """Returns the command to get the queue status."""
         return ["qstat", "-f"]
 
+    @property
+    def supports_dependencies(self) -> bool:
+        """Returns whether the torque template renders the job dependencies."""
+        return True
+
+    @property
+    def supports_array_jobs(self) -> bool:
+        """Returns whether the torque template renders the job array."""
+        return True
+
+    @property
+    def array_task_id_variable(self) -> str:
+        """Returns the environment variable containing the index of the array task."""
+        return "PBS_ARRAYID"
+
+    def get_job_filter_arguments(self, process_id_lst: list[int]) -> list[str]:
+        """Returns the arguments to restrict the queue status to a list of job IDs.
+
+        The user filter of qstat is not compatible with the full status format, so
+        only the job ID filter is supported.
+        """
+        return [str(process_id) for process_id in process_id_lst]
+
     @staticmethod
     def get_job_id_from_output(queue_submit_output: str) -> int:
         """Extracts the job ID from the queue submit output.
@@ -60,60 +142,74 @@ class TorqueCommands(SchedulerCommands):
         )
 
     @staticmethod
-    def convert_queue_status(queue_status_output: str) -> pandas.DataFrame:
-        """Converts the queue status output into a pandas DataFrame.
+    def convert_queue_status_to_dict(
+        queue_status_output: Union[str, Iterable[str]],
+    ) -> dict[str, list]:
+        """Converts the queue status output into a dictionary of columns.
+
+        The output is parsed in a single pass of a compiled token pattern, continuation lines of wrapped attribute
+        values are joined and only the job ID, the owner, the job name, the state and the working directory of each
+        job are kept. In addition to a string, the output can be provided as iterable of lines, for example the stdout
+        of the qstat process.
 
         Args:
-            queue_status_output (str): The output of the queue status command.
+            queue_status_output (str/Iterable[str]): The output of the queue status command.
 
         Returns:
-            pandas.DataFrame: The queue status as a DataFrame.
+            dict[str, list]: The queue status as dictionary of columns.
         """
-        lines = queue_status_output.split("\n")
-        input_string = "".join(lines)
-        # remove all whitespaces
-        input_string = "".join(input_string.split())
-
-        # Extract the job ID, user, job name, status, and working directory for each running job
-        regex_pattern_job_id = r"JobId:(.*?)Job_Name"
-        job_id_lst = re.findall(regex_pattern_job_id, input_string)
-        job_id_lst = [int(job_id_str.split(sep=".")[0]) for job_id_str in job_id_lst]
-
-        regex_pattern_user = r"Job_Owner=(.*?)job_state"
-        user_lst = re.findall(regex_pattern_user, input_string)
-        user_lst = [user_str.split("@")[0] for user_str in user_lst]
-
-        regex_pattern_job_name = r"Job_Name=(.*?)Job_Owner"
-        job_name_lst = re.findall(regex_pattern_job_name, input_string)
-
-        regex_pattern_status = r"job_state=(.*?)queue"
-        status_lst = re.findall(regex_pattern_status, input_string)
-
-        regex_pattern_working_directory = r"PBS_O_WORKDIR=(.*?),PBS"
-        working_directory_lst = re.findall(
-            regex_pattern_working_directory, input_string
-        )
-
-        df = pandas.DataFrame(
-            {
-                "jobid": job_id_lst,
-                "user": user_lst,
-                "jobname": job_name_lst,
-                "status": status_lst,
-                "working_directory": working_directory_lst,
-            }
-        )
-
-        df["status"] = df["status"].apply(
-            lambda x: "running" if x == "R" else "pending"
-        )
-
-        return df
+        if isinstance(queue_status_output, str):
+            token_iter = _iter_tokens(content=queue_status_output)
+        else:
+            token_iter = (
+                token
+                for block in _iter_job_blocks(line_iter=queue_status_output)
+                for token in _iter_tokens(content=block)
+            )
+        column_dict: dict[str, list] = {
+            "Job Id": [],
+            "Job_Owner": [],
+            "Job_Name": [],
+            "job_state": [],
+            "Variable_List": [],
+        }
+        column_lst = list(column_dict.values())
+        for job_id, key, raw_value in token_iter:
+            if job_id is not None:
+                for column in column_lst:
+                    column.append(None)
+                column_dict["Job Id"][-1] = job_id
+            elif key is not None and raw_value is not None and len(column_lst[0]) > 0:
+                value = (
+                    continuation_pattern.sub("", raw_value)
+                    if "\n" in raw_value
+                    else raw_value
+                )
+                if key == "Variable_List":
+                    match = working_directory_pattern.search(value)
+                    column_dict[key][-1] = match.group(1) if match is not None else None
+                else:
+                    column_dict[key][-1] = value
+        return {
+            "jobid": [
+                int(job_id.split(".")[0].split("[")[0])
+                for job_id in column_dict["Job Id"]
+            ],
+            "user": [
+                user.split("@")[0] if user is not None else None
+                for user in column_dict["Job_Owner"]
+            ],
+            "jobname": column_dict["Job_Name"],
+            "status": [
+                state_dict.get(state, "pending") for state in column_dict["job_state"]
+            ],
+            "working_directory": column_dict["Variable_List"],
+        }
 
     @staticmethod
     def render_submission_template(
         command: str,
-        submission_template: Union[str, Template] = template,
+        submission_template: Union[str, "Template"] = template,
         job_name: str = "pysqa",
         working_directory: str = os.path.abspath("."),
         cores: int = 1,
@@ -0,0 +1,137 @@
+"""
+Benchmark for the import time of pysqa.
+
+The RemoteQueueAdapter calls "python -m pysqa" on the remote cluster for every operation, so the import time of the
+command line interface is paid for every status query, submission and deletion. The benchmark measures the cumulative
+import time reported by "python -X importtime" for the public entry points in a fresh interpreter and verifies that
+the optional heavy dependencies are not imported:
+
+    python tests/benchmark/benchmark_import.py --output import.json --budget 0.3
+
+The command exits with a non-zero exit code if the import time of any module exceeds the budget or if any of the
+heavy dependencies is imported.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from typing import Optional
+
+default_module_lst = ["pysqa", "pysqa.base.cmd", "pysqa.queueadapter"]
+lazy_module_lst = ["defusedxml", "flux", "jinja2", "pandas", "paramiko", "yaml"]
+
+
+def measure_import(module: str, repeat: int = 5) -> dict:
+    """
+    Measure the import time of a module in a fresh interpreter.
+
+    Args:
+        module (str): The name of the module.
+        repeat (int): Number of timed runs, the fastest run is reported. Defaults to 5.
+
+    Returns:
+        dict: Dictionary with the cumulative import time in seconds and the heavy dependencies which were imported.
+    """
+    time_lst = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in output.stderr.splitlines():
+            entry_lst = line.split("|")
+            if len(entry_lst) == 3 and entry_lst[2].strip() == module:
+                time_lst.append(int(entry_lst[1]) / 1e6)
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, "
+            + module
+            + "; print(json.dumps(sorted(m for m in "
+            + str(lazy_module_lst)
+            + " if m in sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {"time": min(time_lst), "imported": json.loads(output.stdout)}
+
+
+def run_benchmark(module_lst: list[str], repeat: int = 5) -> dict:
+    """
+    Measure the import time of multiple modules.
+
+    Args:
+        module_lst (list[str]): The names of the modules.
+        repeat (int): Number of timed runs per module. Defaults to 5.
+
+    Returns:
+        dict: The benchmark results including the python version.
+    """
+    result_dict = {}
+    for module in module_lst:
+        result = measure_import(module=module, repeat=repeat)
+        result_dict[module] = result
+        print(
+            module
+            + ": "
+            + format(result["time"], ".4f")
+            + " s, imported "
+            + str(result["imported"])
+        )
+    return {"python": platform.python_version(), "results": result_dict}
+
+
+def check_budget(result_dict: dict, budget: float) -> list[str]:
+    """
+    Compare the benchmark results to the import time budget.
+
+    Args:
+        result_dict (dict): The benchmark results.
+        budget (float): Maximum accepted import time in seconds.
+
+    Returns:
+        list[str]: Description of each violation, an empty list if there are no violations.
+    """
+    violation_lst = []
+    for module, result in result_dict["results"].items():
+        if result["time"] > budget:
+            violation_lst.append(
+                module
+                + ": import time "
+                + str(result["time"])
+                + " s exceeds the budget of "
+                + str(budget)
+                + " s"
+            )
+        if len(result["imported"]) > 0:
+            violation_lst.append(module + ": imports " + str(result["imported"]))
+    return violation_lst
+
+
+def main(argument_lst: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the import time of pysqa.")
+    parser.add_argument("--modules", nargs="+", default=default_module_lst)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.3)
+    parser.add_argument("--output", default="benchmark_import.json")
+    args = parser.parse_args(argument_lst)
+    result_dict = run_benchmark(module_lst=args.modules, repeat=args.repeat)
+    with open(args.output, "w") as f:
+        json.dump(result_dict, f, indent=2)
+    violation_lst = check_budget(result_dict=result_dict, budget=args.budget)
+    for violation in violation_lst:
+        print("Violation: " + violation)
+    if len(violation_lst) > 0:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
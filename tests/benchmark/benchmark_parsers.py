@@ -0,0 +1,394 @@
+"""
+Micro-benchmark for the queue status parsers SchedulerCommands.convert_queue_status() of the individual wrappers.
+
+The benchmark generates synthetic output of the queue status command for a given number of jobs, measures the parse
+time and the peak memory of the parser and stores the results as JSON. A previous result can be used as baseline to
+detect regressions:
+
+    python tests/benchmark/benchmark_parsers.py --output baseline.json
+    python tests/benchmark/benchmark_parsers.py --output current.json --baseline baseline.json
+
+The command exits with a non-zero exit code if the parse time or the peak memory of any wrapper exceeds the baseline
+by more than the tolerance. With the --columnar option the pure python parsers convert_queue_status_to_dict() are
+measured instead, which are used for the status lookups and the command line interface.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Optional, Union
+
+import pandas
+
+default_size_lst = [1000, 10000, 100000, 1000000]
+
+
+def _status(i: int, running: str, pending: str) -> str:
+    return running if i % 3 else pending
+
+
+def generate_slurm_output(job_count: int) -> str:
+    return "\n".join(
+        [
+            str(1000000 + i)
+            + "|user"
+            + str(i % 10)
+            + "|"
+            + _status(i, "R", "PD")
+            + "|job_"
+            + str(i)
+            + "|/home/user/calc/job_"
+            + str(i)
+            for i in range(job_count)
+        ]
+    )
+
+
+def generate_slurm_json_output(job_count: int) -> str:
+    return json.dumps(
+        {
+            "jobs": [
+                {
+                    "current_working_directory": "/home/user/calc/job_" + str(i),
+                    "job_id": 1000000 + i,
+                    "job_state": [_status(i, "RUNNING", "PENDING")],
+                    "name": "job_" + str(i),
+                    "nodes": "node" + str(i % 100),
+                    "partition": "normal",
+                    "start_time": {
+                        "infinite": False,
+                        "number": 1700000100,
+                        "set": True,
+                    },
+                    "state_reason": _status(i, "None", "Priority"),
+                    "submit_time": {
+                        "infinite": False,
+                        "number": 1700000000,
+                        "set": True,
+                    },
+                    "user_name": "user" + str(i % 10),
+                }
+                for i in range(job_count)
+            ],
+            "meta": {"command": ["squeue", "--json"]},
+            "errors": [],
+            "warnings": [],
+        },
+        indent=2,
+    )
+
+
+def generate_gent_output(job_count: int) -> str:
+    return "cluster:benchmark\n" + "\n".join(
+        [
+            str(1000000 + i)
+            + "|user"
+            + str(i % 10)
+            + "|"
+            + _status(i, "R", "PD")
+            + "|job_"
+            + str(i)
+            for i in range(job_count)
+        ]
+    )
+
+
+def generate_lsf_output(job_count: int) -> str:
+    return (
+        "JOBID      USER    STAT  QUEUE      FROM_HOST   EXEC_HOST   JOB_NAME   SUBMIT_TIME\n"
+        + "\n".join(
+            [
+                str(1000000 + i)
+                + "    user"
+                + str(i % 10)
+                + " "
+                + _status(i, "RUN", "PEND")
+                + "   normal     login01     node"
+                + str(i % 100)
+                + "      job_"
+                + str(i)
+                + "    Aug 22 12:28"
+                for i in range(job_count)
+            ]
+        )
+    )
+
+
+def generate_flux_output(job_count: int) -> str:
+    return "\n".join(
+        [
+            str(1000000 + i)
+            + " user"
+            + str(i % 10)
+            + "     job_"
+            + str(i)
+            + "  "
+            + _status(i, "R", "S")
+            + "      2      2   1.931s [0-1]"
+            for i in range(job_count)
+        ]
+    )
+
+
+def generate_sge_output(job_count: int) -> str:
+    def job_list(i: int, state: str, xml_state: str) -> str:
+        return (
+            '    <job_list state="'
+            + xml_state
+            + '">\n      <JB_job_number>'
+            + str(1000000 + i)
+            + "</JB_job_number>\n      <JAT_prio>0.51103</JAT_prio>\n      <JB_name>job_"
+            + str(i)
+            + "</JB_name>\n      <JB_owner>user"
+            + str(i % 10)
+            + "</JB_owner>\n      <state>"
+            + state
+            + "</state>\n      <queue_name></queue_name>\n      <slots>20</slots>\n    </job_list>\n"
+        )
+
+    return (
+        "<?xml version='1.0'?>\n<job_info>\n  <queue_info>\n"
+        + "".join([job_list(i, "r", "running") for i in range(job_count) if i % 3])
+        + "  </queue_info>\n  <job_info>\n"
+        + "".join([job_list(i, "qw", "pending") for i in range(job_count) if not i % 3])
+        + "  </job_info>\n</job_info>\n"
+    )
+
+
+def generate_torque_output(job_count: int) -> str:
+    return "\n".join(
+        [
+            "Job Id: "
+            + str(1000000 + i)
+            + ".pbs-server\n    Job_Name = job_"
+            + str(i)
+            + "\n    Job_Owner = user"
+            + str(i % 10)
+            + "@login01\n    job_state = "
+            + _status(i, "R", "Q")
+            + "\n    queue = normal\n    server = pbs-server\n    Resource_List.ncpus = 48\n"
+            + "    Variable_List = PBS_O_HOME=/home/user,PBS_O_LOGNAME=user,\n"
+            + "        PBS_O_WORKDIR=/home/user/calc/job_"
+            + str(i)
+            + ",PBS_O_SYSTEM=Linux,\n        PBS_O_QUEUE=normal\n"
+            for i in range(job_count)
+        ]
+    )
+
+
+generator_dict: dict[str, tuple[str, str, Callable[[int], str]]] = {
+    "slurm": ("pysqa.wrapper.slurm", "SlurmCommands", generate_slurm_output),
+    "slurm_json": (
+        "pysqa.wrapper.slurm",
+        "SlurmJsonCommands",
+        generate_slurm_json_output,
+    ),
+    "gent": ("pysqa.wrapper.gent", "GentCommands", generate_gent_output),
+    "lsf": ("pysqa.wrapper.lsf", "LsfCommands", generate_lsf_output),
+    "flux": ("pysqa.wrapper.flux", "FluxCommands", generate_flux_output),
+    "sge": ("pysqa.wrapper.sge", "SunGridEngineCommands", generate_sge_output),
+    "torque": ("pysqa.wrapper.torque", "TorqueCommands", generate_torque_output),
+}
+
+# The wrappers import their optional dependencies only when the parser is called.
+optional_dependency_dict = {"flux": "flux", "sge": "defusedxml"}
+
+
+def load_parser(
+    wrapper: str, columnar: bool = False
+) -> Optional[Callable[[str], Union[pandas.DataFrame, dict]]]:
+    """
+    Load the queue status parser of a wrapper.
+
+    Args:
+        wrapper (str): The name of the wrapper.
+        columnar (bool): Load the parser to a dictionary of columns instead of a pandas DataFrame. Defaults to False.
+
+    Returns:
+        Callable: The parser or None if the optional dependencies of the wrapper are not installed.
+    """
+    module_name, class_name, _ = generator_dict[wrapper]
+    dependency = optional_dependency_dict.get(wrapper)
+    if dependency is not None and importlib.util.find_spec(dependency) is None:
+        return None
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    if columnar:
+        return getattr(module, class_name).convert_queue_status_to_dict
+    return getattr(module, class_name).convert_queue_status
+
+
+def benchmark_parser(
+    parser: Callable[[str], Union[pandas.DataFrame, dict]],
+    queue_status_output: str,
+    job_count: int,
+    repeat: int = 3,
+) -> dict:
+    """
+    Measure the parse time and the peak memory of a parser.
+
+    Args:
+        parser (Callable): The queue status parser.
+        queue_status_output (str): The synthetic output of the queue status command.
+        job_count (int): The number of jobs in the output, used to validate the result.
+        repeat (int): Number of timed runs, the fastest run is reported. Defaults to 3.
+
+    Returns:
+        dict: Dictionary with the parse time in seconds and the peak memory in bytes.
+    """
+    time_lst = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = parser(queue_status_output)
+        time_lst.append(time.perf_counter() - start)
+        parsed_count = len(df["jobid"]) if isinstance(df, dict) else len(df)
+        if parsed_count != job_count:
+            raise ValueError(
+                "The parser returned "
+                + str(parsed_count)
+                + " jobs, but the output contains "
+                + str(job_count)
+                + " jobs."
+            )
+        del df
+    tracemalloc.start()
+    parser(queue_status_output)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"time": min(time_lst), "peak_memory": peak_memory}
+
+
+def run_benchmark(
+    wrapper_lst: list[str], size_lst: list[int], repeat: int = 3, columnar: bool = False
+) -> dict:
+    """
+    Run the benchmark for all combinations of wrappers and job counts.
+
+    Args:
+        wrapper_lst (list[str]): The names of the wrappers.
+        size_lst (list[int]): The job counts.
+        repeat (int): Number of timed runs per measurement. Defaults to 3.
+        columnar (bool): Measure the parsers to a dictionary of columns. Defaults to False.
+
+    Returns:
+        dict: The benchmark results including the python and pandas versions.
+    """
+    result_dict: dict[str, dict[str, dict]] = {}
+    for wrapper in wrapper_lst:
+        parser = load_parser(wrapper=wrapper, columnar=columnar)
+        if parser is None:
+            print(wrapper + ": skipped, the optional dependencies are not installed")
+            continue
+        result_dict[wrapper] = {}
+        for job_count in size_lst:
+            queue_status_output = generator_dict[wrapper][2](job_count)
+            result = benchmark_parser(
+                parser=parser,
+                queue_status_output=queue_status_output,
+                job_count=job_count,
+                repeat=repeat,
+            )
+            result_dict[wrapper][str(job_count)] = result
+            print(
+                wrapper
+                + " "
+                + str(job_count)
+                + " jobs: "
+                + format(result["time"], ".4f")
+                + " s, "
+                + format(result["peak_memory"] / 1024**2, ".1f")
+                + " MiB"
+            )
+    return {
+        "python": platform.python_version(),
+        "pandas": pandas.__version__,
+        "columnar": columnar,
+        "results": result_dict,
+    }
+
+
+def compare_results(
+    result_dict: dict, baseline_dict: dict, tolerance: float = 0.2
+) -> list[str]:
+    """
+    Compare benchmark results to a baseline.
+
+    Args:
+        result_dict (dict): The current benchmark results.
+        baseline_dict (dict): The baseline benchmark results.
+        tolerance (float): Accepted relative increase of the parse time and the peak memory. Defaults to 0.2.
+
+    Returns:
+        list[str]: Description of each regression, an empty list if there are no regressions.
+    """
+    regression_lst = []
+    for wrapper, size_dict in result_dict["results"].items():
+        for job_count, result in size_dict.items():
+            baseline = baseline_dict["results"].get(wrapper, {}).get(job_count)
+            if baseline is None:
+                continue
+            for key in ["time", "peak_memory"]:
+                if baseline[key] > 0 and result[key] > baseline[key] * (1 + tolerance):
+                    regression_lst.append(
+                        wrapper
+                        + " "
+                        + job_count
+                        + " jobs: "
+                        + key
+                        + " increased from "
+                        + str(baseline[key])
+                        + " to "
+                        + str(result[key])
+                    )
+    return regression_lst
+
+
+def main(argument_lst: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the queue status parsers of the pysqa wrappers."
+    )
+    parser.add_argument(
+        "--wrappers",
+        nargs="+",
+        default=list(generator_dict.keys()),
+        choices=list(generator_dict.keys()),
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=default_size_lst)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_parsers.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--columnar", action="store_true")
+    args = parser.parse_args(argument_lst)
+    result_dict = run_benchmark(
+        wrapper_lst=args.wrappers,
+        size_lst=args.sizes,
+        repeat=args.repeat,
+        columnar=args.columnar,
+    )
+    with open(args.output, "w") as f:
+        json.dump(result_dict, f, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline_dict = json.load(f)
+        regression_lst = compare_results(
+            result_dict=result_dict,
+            baseline_dict=baseline_dict,
+            tolerance=args.tolerance,
+        )
+        for regression in regression_lst:
+            print("Regression: " + regression)
+        if len(regression_lst) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -145,6 +145,30 @@ class TestCMD(unittest.TestCase):
             "S\n",
         )
 
+    def test_delete_multiple(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return ""
+
+        self.assert_stdout_command_line(
+            [
+                "--config_directory",
+                os.path.join(self.config_dir, "slurm"),
+                "--delete",
+                "--id",
+                "1",
+                "--id",
+                "2",
+            ],
+            execute_command,
+            '["", ""]\n',
+        )
+
     def test_status(self):
         def execute_command(
             commands,
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import sys
 from unittest.mock import patch
@@ -84,3 +86,154 @@ class TestQueueAdapterWithConfigErrors(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             qa._job_submission_template(queue="sq", cores=None, command="test")
         self.assertIn("sq", str(context.exception))
+
+
+class TestQueueAdapterWithConfigTemplates(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.directory.name, "header.sh"), "w") as f:
+            f.write("#!/bin/bash\n#SBATCH --job-name={{job_name}}")
+        with open(os.path.join(self.directory.name, "slurm.sh"), "w") as f:
+            f.write('{% include "header.sh" %}\n#SBATCH --ntasks={{cores}}\n\n{{command}}')
+        self.config = {
+            "queue_type": "SLURM",
+            "queue_primary": "sq",
+            "queues": {"sq": {"script": "slurm.sh"}},
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_include(self):
+        from pysqa.base.config import QueueAdapterWithConfig
+
+        qa = QueueAdapterWithConfig(config=self.config, directory=self.directory.name)
+        self.assertEqual(
+            qa._job_submission_template(queue="sq", job_name="test", cores=2, command="echo hello"),
+            "#!/bin/bash\n#SBATCH --job-name=test\n#SBATCH --ntasks=2\n\necho hello",
+        )
+
+    def test_eager_loading(self):
+        from jinja2.exceptions import TemplateNotFound
+        from pysqa.base.config import QueueAdapterWithConfig
+
+        qa = QueueAdapterWithConfig(config=self.config, directory=self.directory.name)
+        template = qa._get_queue_template(queue="sq")
+        self.assertIs(qa.config["queues"]["sq"]["template"], template)
+        self.assertEqual(list(qa._template_dict.keys()), ["sq"])
+        config = {
+            "queue_type": "SLURM",
+            "queue_primary": "sq",
+            "queues": {"sq": {"script": "slurm.sh"}, "missing": {"script": "missing.sh"}},
+        }
+        with self.assertRaises(TemplateNotFound):
+            QueueAdapterWithConfig(config=config, directory=self.directory.name)
+
+    def test_shared_environment(self):
+        from pysqa.base.config import QueueAdapterWithConfig, get_template_environment, load_template
+
+        qa_1 = QueueAdapterWithConfig(config=self.config, directory=self.directory.name)
+        qa_2 = QueueAdapterWithConfig(config=self.config, directory=self.directory.name)
+        self.assertIs(qa_1._get_queue_template(queue="sq"), qa_2._get_queue_template(queue="sq"))
+        environment = get_template_environment(search_path=(self.directory.name,))
+        self.assertIsNotNone(environment.bytecode_cache)
+        self.assertIs(
+            load_template(file_name="slurm.sh", directory=self.directory.name).environment,
+            environment,
+        )
+
+    def test_queue_without_template(self):
+        from pysqa.base.config import QueueAdapterWithConfig
+
+        config = {"queue_type": "SLURM", "queue_primary": "sq", "queues": {"sq": {}}}
+        qa = QueueAdapterWithConfig(config=config, directory=self.directory.name)
+        with self.assertRaises(ValueError):
+            qa._get_queue_template(queue="sq")
+
+
+class TestReadConfig(unittest.TestCase):
+    def setUp(self):
+        from pysqa.base.config import clear_config_cache
+
+        clear_config_cache()
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "queue.yaml")
+        with open(self.file_name, "w") as f:
+            f.write("queue_type: SLURM\nqueue_primary: sq\nqueues:\n  sq: {cores_max: 10, script: slurm.sh}\n")
+        with open(os.path.join(self.directory.name, "slurm.sh"), "w") as f:
+            f.write("#!/bin/bash\n{{command}}")
+
+    def tearDown(self):
+        from pysqa.base.config import clear_config_cache
+
+        clear_config_cache()
+        self.directory.cleanup()
+
+    def test_cache_returns_copy(self):
+        from pysqa.base.config import read_config
+
+        config = read_config(file_name=self.file_name)
+        config["queues"]["sq"]["cores_max"] = 1
+        self.assertEqual(read_config(file_name=self.file_name)["queues"]["sq"]["cores_max"], 10)
+
+    def test_cache_hit(self):
+        import yaml
+        from pysqa.base.config import read_config
+
+        config = read_config(file_name=self.file_name)
+        with patch.object(yaml, "load") as mock_load:
+            self.assertEqual(read_config(file_name=self.file_name), config)
+            mock_load.assert_not_called()
+
+    def test_cache_invalidation(self):
+        from pysqa.base.config import read_config
+
+        self.assertEqual(read_config(file_name=self.file_name)["queue_primary"], "sq")
+        with open(self.file_name, "w") as f:
+            f.write("queue_type: SLURM\nqueue_primary: other\nqueues:\n  other: {script: slurm.sh}\n")
+        self.assertEqual(read_config(file_name=self.file_name)["queue_primary"], "other")
+
+    def test_validated_config(self):
+        from pysqa.base.config import QueueAdapterWithConfig, ValidatedConfig, read_config
+
+        config = read_config(file_name=self.file_name, validate=True)
+        self.assertIsInstance(config, ValidatedConfig)
+        self.assertNotIsInstance(read_config(file_name=self.file_name), ValidatedConfig)
+        with patch("pysqa.base.config.validate_config") as mock_validate:
+            qa = QueueAdapterWithConfig(config=config, directory=self.directory.name)
+            mock_validate.assert_not_called()
+        self.assertEqual(qa.config["queue_primary"], "sq")
+
+    def test_safe_loader(self):
+        import yaml
+        from pysqa.base.config import read_config
+
+        with patch.object(yaml, "load", return_value={}) as mock_load:
+            read_config(file_name=self.file_name)
+        self.assertEqual(
+            mock_load.call_args.kwargs["Loader"],
+            getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        )
+
+    def test_disk_cache(self):
+        import yaml
+        from pysqa.base.config import clear_config_cache, read_config
+
+        cache_directory = os.path.join(self.directory.name, "cache")
+        with patch.dict(os.environ, {"PYSQA_CONFIG_CACHE": cache_directory}):
+            config = read_config(file_name=self.file_name, validate=True)
+            self.assertEqual(len(os.listdir(cache_directory)), 1)
+            clear_config_cache()
+            with patch.object(yaml, "load") as mock_load:
+                self.assertEqual(read_config(file_name=self.file_name, validate=True), config)
+                mock_load.assert_not_called()
+
+    def test_disk_cache_not_serializable(self):
+        from pysqa.base.config import _write_config_cache
+
+        cache_directory = os.path.join(self.directory.name, "cache")
+        _write_config_cache(
+            cache_file=os.path.join(cache_directory, "config.json"),
+            config={"queues": {"sq": {"template": object()}}},
+        )
+        self.assertEqual(os.listdir(cache_directory), [])
@@ -1,6 +1,12 @@
 import os
+import shutil
 import unittest
-from pysqa.base.core import QueueAdapterCore, execute_command
+from pysqa.base.core import (
+    QueueAdapterCore,
+    execute_command,
+    get_delete_output_per_job,
+    split_process_id_list,
+)
 
 
 class TestExecuteCommand(unittest.TestCase):
@@ -100,3 +106,447 @@ class TestQueueAdapterCore(unittest.TestCase):
         self.assertIsNone(qa.get_queue_status())
         self.assertEqual(qa._list_command_to_be_executed(queue_script_path="x"), [])
         self.assertEqual(qa._job_submission_template(command="echo hello"), "")
+
+
+class TestQueueAdapterCoreStatusCache(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.dirname(os.path.abspath(__file__))
+        self.calls = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            self.calls.append(commands)
+            if commands[0] == "squeue":
+                with open(
+                    os.path.join(
+                        self.path, "..", "..", "static", "slurm", "squeue_output"
+                    )
+                ) as f:
+                    return f.read()
+            return "1\n"
+
+        self.qa = QueueAdapterCore(
+            queue_type="SLURM", execute_command=execute_command, status_cache_ttl=3600
+        )
+
+    def test_status_lookups_share_snapshot(self):
+        self.assertEqual(self.qa.get_status_of_job(process_id=5322019), "running")
+        self.assertEqual(
+            self.qa.get_status_of_jobs(process_id_lst=[5322016, 1]),
+            ["running", "finished"],
+        )
+        self.assertEqual(len(self.qa.get_status_of_my_jobs()), 0)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.qa.status_cache_info["hits"], 2)
+        self.assertEqual(self.qa.status_cache_info["misses"], 1)
+
+    def test_refresh(self):
+        self.qa.get_status_of_job(process_id=5322019)
+        self.qa.get_status_of_job(process_id=5322019, refresh=True)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_invalidate_on_delete(self):
+        self.qa.get_status_of_job(process_id=5322019)
+        self.qa.delete_job(process_id=5322019)
+        self.qa.get_status_of_job(process_id=5322019)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_clear_status_cache(self):
+        self.qa.get_status_of_job(process_id=5322019)
+        self.qa.clear_status_cache()
+        self.qa.get_status_of_job(process_id=5322019)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_disabled(self):
+        self.qa.status_cache_ttl = 0
+        self.qa.get_status_of_job(process_id=5322019)
+        self.qa.get_status_of_job(process_id=5322019)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.qa.status_cache_ttl, 0.0)
+
+    def test_status_snapshot(self):
+        snapshot = self.qa.get_status_snapshot()
+        self.assertEqual(len(snapshot), 5)
+        self.assertEqual(
+            snapshot.lookup(process_id_lst=[5322013], column="user"), ["maxi"]
+        )
+        self.assertIs(snapshot, self.qa.get_status_snapshot())
+
+
+class TestSplitProcessIdList(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual(
+            split_process_id_list(process_id_lst=[1, 22, 333, 4], max_length=5),
+            [[1, 22], [333], [4]],
+        )
+
+    def test_empty(self):
+        self.assertEqual(split_process_id_list(process_id_lst=[]), [])
+
+
+class TestQueueAdapterCoreFilteredStatus(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.dirname(os.path.abspath(__file__))
+        self.calls = []
+        self.fail_filtered = False
+        self.fail_all = False
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            self.calls.append(commands)
+            if self.fail_all or (self.fail_filtered and "--jobs" in commands):
+                return None
+            with open(
+                os.path.join(self.path, "..", "..", "static", "slurm", "squeue_output")
+            ) as f:
+                return f.read()
+
+        self.qa = QueueAdapterCore(queue_type="SLURM", execute_command=execute_command)
+
+    def test_status_of_jobs_filtered_by_id(self):
+        self.assertEqual(
+            self.qa.get_status_of_jobs(process_id_lst=[5322019, 1, 5322019]),
+            ["running", "finished", "running"],
+        )
+        self.assertEqual(
+            self.calls,
+            [
+                [
+                    "squeue",
+                    "--format",
+                    "%A|%u|%t|%.15j|%Z|%F",
+                    "--noheader",
+                    "--jobs",
+                    "5322019,1",
+                ]
+            ],
+        )
+
+    def test_status_of_jobs_fallback(self):
+        self.fail_filtered = True
+        self.assertEqual(
+            self.qa.get_status_of_jobs(process_id_lst=[5322013, 1]),
+            ["running", "finished"],
+        )
+        self.assertEqual(len(self.calls), 2)
+        self.assertNotIn("--jobs", self.calls[-1])
+
+    def test_status_of_single_job_fallback(self):
+        self.fail_filtered = True
+        self.assertEqual(
+            self.qa.get_status_of_jobs(process_id_lst=[5322013]), ["running"]
+        )
+        self.assertEqual(len(self.calls), 2)
+        self.assertIn("--jobs", self.calls[0])
+        self.assertNotIn("--jobs", self.calls[-1])
+
+    def test_status_of_jobs_queue_unavailable(self):
+        self.fail_all = True
+        self.assertEqual(self.qa.get_status_of_jobs(process_id_lst=[5322013]), [])
+        self.assertIsNone(self.qa.get_status_of_job(process_id=5322013))
+        self.assertIsNone(self.qa.get_queue_status_dict())
+
+    def test_queue_status_filtered_by_user(self):
+        df = self.qa.get_queue_status(user="maxi")
+        self.assertEqual(list(df["jobid"]), [5322013])
+        self.assertEqual(self.calls[0][-2:], ["--user", "maxi"])
+
+    def test_queue_status_dict_filtered_by_user(self):
+        queue_status = self.qa.get_queue_status_dict(user="maxi")
+        self.assertEqual(queue_status["jobid"], [5322013])
+        self.assertEqual(queue_status["status"], ["running"])
+        self.assertEqual(self.calls[0][-2:], ["--user", "maxi"])
+
+
+class TestQueueAdapterCoreSubmitJobs(unittest.TestCase):
+    def test_submit_jobs(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return working_directory.split("_")[-1] + "\n"
+
+        qa = QueueAdapterCore(queue_type="SLURM", execute_command=execute_command)
+        job_spec_lst = [
+            {"working_directory": "submit_jobs_" + str(i), "command": "echo hello"}
+            for i in range(5)
+        ] + [{"working_directory": "submit jobs", "command": "echo hello"}]
+        result_lst = qa.submit_jobs(job_spec_lst=job_spec_lst, max_workers=3)
+        self.assertEqual(result_lst[:5], [0, 1, 2, 3, 4])
+        self.assertIsInstance(result_lst[5], ValueError)
+        for i in range(5):
+            working_directory = "submit_jobs_" + str(i)
+            self.assertTrue(
+                os.path.exists(os.path.join(working_directory, "run_queue.sh"))
+            )
+            os.remove(os.path.join(working_directory, "run_queue.sh"))
+            os.rmdir(working_directory)
+
+    def test_submit_jobs_empty(self):
+        qa = QueueAdapterCore(queue_type="SLURM")
+        self.assertEqual(qa.submit_jobs(job_spec_lst=[]), [])
+
+
+class TestQueueAdapterCoreArrayJob(unittest.TestCase):
+    def test_submit_array_job(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            if commands[0] == "sbatch":
+                return "1234\n"
+            return "1234|user|PD|pysqa|" + os.path.abspath("array_job") + "\n"
+
+        qa = QueueAdapterCore(queue_type="SLURM", execute_command=execute_command)
+        working_directory = os.path.abspath("array_job")
+        process_id = qa.submit_array_job(
+            working_directory_lst=[
+                os.path.join(working_directory, "task_" + str(i)) for i in range(3)
+            ],
+            command_lst=["echo " + str(i) for i in range(3)],
+            working_directory=working_directory,
+            partition="slurm",
+        )
+        self.assertEqual(process_id, 1234)
+        with open(os.path.join(working_directory, "run_queue.sh")) as f:
+            content = f.read()
+        self.assertIn("#SBATCH --array=1-3", content)
+        self.assertIn(
+            "bash "
+            + os.path.join(working_directory, "pysqa_tasks.sh")
+            + " $SLURM_ARRAY_TASK_ID",
+            content,
+        )
+        self.assertEqual(
+            qa.get_status_of_array_job(process_id=process_id),
+            ["pending", "pending", "pending"],
+        )
+        with self.assertRaises(ValueError):
+            qa.get_status_of_array_job(process_id=1)
+        with self.assertRaises(ValueError):
+            qa.submit_array_job(working_directory_lst=["."], command_lst=[])
+        shutil.rmtree(working_directory)
+
+    def test_status_of_array_job_lead_left_queue(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            if commands[0] == "sbatch":
+                return "1234\n"
+            return (
+                "1236|user|R|pysqa|" + working_directory_array + "|1234\n"
+                "1234|user|PD|pysqa|" + working_directory_array + "|1234\n"
+            )
+
+        qa = QueueAdapterCore(queue_type="SLURM", execute_command=execute_command)
+        self.assertTrue(qa.supports_array_jobs)
+        working_directory_array = os.path.abspath("array_job_lead")
+        process_id = qa.submit_array_job(
+            working_directory_lst=[
+                os.path.join(working_directory_array, "task_" + str(i))
+                for i in range(3)
+            ],
+            command_lst=["echo " + str(i) for i in range(3)],
+            working_directory=working_directory_array,
+            partition="slurm",
+        )
+        os.makedirs(os.path.join(working_directory_array, "pysqa_tasks"))
+        with open(
+            os.path.join(working_directory_array, "pysqa_tasks", "1.exit"), "w"
+        ) as f:
+            f.write("0\n")
+        self.assertEqual(
+            qa.get_status_of_array_job(process_id=process_id),
+            ["finished", "pending", "pending"],
+        )
+        shutil.rmtree(working_directory_array)
+
+
+class TestQueueAdapterCorePackedJobs(unittest.TestCase):
+    def test_submit_packed_jobs(self):
+        process_id_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            if commands[0] == "sbatch":
+                process_id_lst.append(1234 + len(process_id_lst))
+                return str(process_id_lst[-1]) + "\n"
+            return "".join(
+                str(process_id) + "|user|PD|pysqa|" + os.path.abspath("packed_job") + "\n"
+                for process_id in process_id_lst
+            )
+
+        qa = QueueAdapterCore(queue_type="SLURM", execute_command=execute_command)
+        working_directory = os.path.abspath("packed_job")
+        result_lst = qa.submit_packed_jobs(
+            working_directory_lst=[
+                os.path.join(working_directory, "task_" + str(i)) for i in range(5)
+            ],
+            command_lst=["echo " + str(i) for i in range(5)],
+            working_directory=working_directory,
+            cores=2,
+            partition="slurm",
+        )
+        self.assertEqual(sorted(result_lst), [1234, 1235, 1236])
+        with open(os.path.join(working_directory, "pack_1", "run_queue.sh")) as f:
+            content = f.read()
+        self.assertIn("#SBATCH --ntasks=2", content)
+        self.assertIn(
+            "seq 1 2 | xargs -P 2 -n 1 bash "
+            + os.path.join(working_directory, "pack_1", "pysqa_tasks.sh"),
+            content,
+        )
+        self.assertEqual(
+            qa.get_status_of_packed_jobs(process_id_lst=result_lst),
+            ["pending"] * 5,
+        )
+        self.assertEqual(
+            qa.get_status_of_array_job(process_id=result_lst[2]), ["pending"]
+        )
+        with self.assertRaises(ValueError):
+            qa.get_status_of_packed_jobs(process_id_lst=[1])
+        with self.assertRaises(ValueError):
+            qa.submit_packed_jobs(working_directory_lst=["."], command_lst=[])
+        shutil.rmtree(working_directory)
+
+
+class TestQueueAdapterCoreDeleteJobs(unittest.TestCase):
+    def test_delete_jobs(self):
+        command_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            command_lst.append(commands)
+            if "3" in commands:
+                return None
+            return "\n".join(["deleted " + c for c in commands[1:]])
+
+        qa = QueueAdapterCore(queue_type="SGE", execute_command=execute_command)
+        qa._split_delete_jobs = lambda process_id_lst: [
+            process_id_lst[:2],
+            process_id_lst[2:],
+        ]
+        self.assertEqual(
+            qa.delete_jobs(process_id_lst=[1, 2, 3, 2]),
+            ["deleted 1", "deleted 2", None, "deleted 2"],
+        )
+        self.assertEqual(command_lst, [["qdel", "1", "2"], ["qdel", "3"]])
+        self.assertEqual(qa.delete_jobs(process_id_lst=[]), [])
+
+    def test_get_delete_output_per_job(self):
+        self.assertEqual(
+            get_delete_output_per_job(
+                output="job 12 deleted\njob 1 deleted\n", process_id_lst=[1, 12, 5]
+            ),
+            ["job 1 deleted", "job 12 deleted", "job 12 deleted"],
+        )
+        self.assertEqual(
+            get_delete_output_per_job(output=None, process_id_lst=[1, 2]), [None, None]
+        )
+
+
+class TestQueueAdapterCoreWaitForJobs(unittest.TestCase):
+    def test_wait_for_jobs(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return ""
+
+        qa = QueueAdapterCore(queue_type="SLURM", execute_command=execute_command)
+        self.assertEqual(
+            qa.wait_for_jobs(process_id_lst=[1, 2], timeout=10),
+            {1: "finished", 2: "finished"},
+        )
+        self.assertEqual(
+            list(qa.iter_wait_for_jobs(process_id_lst=[3])), [(3, "finished")]
+        )
+
+
+class TestQueueAdapterCoreAccounting(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.dirname(os.path.abspath(__file__))
+        self.calls = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            self.calls.append(commands)
+            if commands[0] == "sacct":
+                return "1|COMPLETED\n2|TIMEOUT\n3|CANCELLED by 1000\n4|RUNNING\n"
+            with open(
+                os.path.join(self.path, "..", "..", "static", "slurm", "squeue_output")
+            ) as f:
+                return f.read()
+
+        self.qa = QueueAdapterCore(
+            queue_type="SLURM", execute_command=execute_command, accounting=True
+        )
+
+    def test_status_of_jobs(self):
+        self.assertEqual(
+            self.qa.get_status_of_jobs(process_id_lst=[5322019, 1, 2, 3, 4, 5]),
+            ["running", "finished", "timeout", "cancelled", "running", "finished"],
+        )
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.calls[1][-2:], ["--jobs", "1,2,3,4,5"])
+        self.assertEqual(
+            self.qa.get_status_of_jobs(process_id_lst=[1, 2, 3]),
+            ["finished", "timeout", "cancelled"],
+        )
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.qa.get_status_of_job(process_id=4), "running")
+        self.assertEqual(self.calls[-1][-2:], ["--jobs", "4"])
+
+    def test_status_of_job(self):
+        self.assertEqual(self.qa.get_status_of_job(process_id=5322019), "running")
+        self.assertEqual(self.qa.get_status_of_job(process_id=2), "timeout")
+        self.assertIsNone(self.qa.get_status_of_job(process_id=5))
+        self.assertEqual(len(self.calls), 5)
+        self.assertEqual(self.qa.get_status_of_job(process_id=2), "timeout")
+        self.assertEqual(len(self.calls), 5)
+
+    def test_disabled(self):
+        self.qa._accounting = False
+        self.assertEqual(
+            self.qa.get_status_of_jobs(process_id_lst=[5322019, 2]),
+            ["running", "finished"],
+        )
+        self.assertEqual(len(self.calls), 1)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from pysqa.base.registry import JobRegistry
+
+
+class TestJobRegistry(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "registry_test.db")
+        self.registry = JobRegistry(path=self.path)
+
+    def tearDown(self):
+        self.registry.close()
+        self.directory.cleanup()
+
+    def test_add_and_get_job(self):
+        self.registry.add_job(
+            cluster="default",
+            process_id=1,
+            job_name="test",
+            working_directory="calc",
+            queue="slurm",
+            cores=4,
+            memory_max=10,
+            run_time_max=3600,
+        )
+        job = self.registry.get_job(cluster="default", process_id=1)
+        self.assertEqual(job["job_name"], "test")
+        self.assertEqual(job["working_directory"], os.path.abspath("calc"))
+        self.assertEqual(job["cores"], 4)
+        self.assertEqual(job["memory_max"], "10")
+        self.assertEqual(job["status"], "pending")
+        self.assertIsNone(self.registry.get_job(cluster="other", process_id=1))
+
+    def test_update_status_and_query(self):
+        self.registry.add_jobs(
+            cluster="default",
+            job_lst=[
+                {"jobid": 1, "queue": "slurm", "working_directory": "calc_1"},
+                {"jobid": 2, "queue": "slurm", "working_directory": "calc_2"},
+                {"jobid": 3, "queue": "other", "working_directory": "calc_2"},
+            ],
+        )
+        self.registry.update_status(
+            cluster="default",
+            status_dict={1: "running", 2: "finished", 3: "running", 4: "running"},
+        )
+        df = self.registry.get_jobs(queue="slurm", status="running")
+        self.assertEqual(df["jobid"].tolist(), [1])
+        df = self.registry.get_jobs(working_directory="calc_2")
+        self.assertEqual(df["jobid"].tolist(), [2, 3])
+        self.assertEqual(len(self.registry.get_jobs()), 3)
+        self.registry.remove_jobs(cluster="default", process_id_lst=[1, 2])
+        self.assertEqual(self.registry.get_jobs()["jobid"].tolist(), [3])
+
+    def test_persistence(self):
+        self.registry.add_job(cluster="default", process_id=5)
+        registry = JobRegistry(path=self.path)
+        self.assertEqual(registry.get_jobs()["jobid"].tolist(), [5])
+        registry.close()
@@ -59,6 +59,20 @@ class TestRemoteQueueAdapter(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.remote.submit_job(queue="remote", dependency_list=[])
 
+    def test_submit_array_job_remote(self):
+        self.assertFalse(self.remote.supports_array_jobs)
+        with self.assertRaises(NotImplementedError):
+            self.remote.submit_array_job(
+                working_directory_lst=["calc_1"], command_lst=["/bin/true"]
+            )
+
+    def test_submit_packed_jobs_remote(self):
+        self.assertFalse(self.remote.supports_packed_jobs)
+        with self.assertRaises(NotImplementedError):
+            self.remote.submit_packed_jobs(
+                working_directory_lst=["calc_1"], command_lst=["/bin/true"]
+            )
+
     def test_submit_command(self):
         with self.subTest("remote config"):
             command = self.remote._adapter._submit_command(
@@ -108,6 +122,12 @@ class TestRemoteQueueAdapter(unittest.TestCase):
             self.remote._adapter._delete_command(job_id=123),
         )
 
+    def test_delete_jobs_command(self):
+        self.assertEqual(
+            self.remote._adapter._delete_jobs_command(job_id_lst=[1, 2]),
+            self.remote._adapter._remote_command() + "--delete --id 1 --id 2",
+        )
+
     def test_reservation_command(self):
         self.assertEqual(
             "python -m pysqa --config_directory /u/share/pysqa/resources/queues/ --reservation --id 123",
@@ -0,0 +1,69 @@
+import pickle
+import unittest
+
+from pysqa.base.routing import (
+    ClusterJobID,
+    ClusterLoad,
+    fits_queue_limits,
+    sort_clusters_by_load,
+)
+
+
+class TestClusterJobID(unittest.TestCase):
+    def test_int(self):
+        job_id = ClusterJobID(123, cluster="cluster1")
+        self.assertEqual(job_id, 123)
+        self.assertEqual(str(job_id), "123")
+        self.assertEqual(job_id.cluster, "cluster1")
+        self.assertEqual({123: "running"}[job_id], "running")
+
+    def test_pickle(self):
+        job_id = pickle.loads(pickle.dumps(ClusterJobID(123, cluster="cluster1")))
+        self.assertIsInstance(job_id, ClusterJobID)
+        self.assertEqual(job_id, 123)
+        self.assertEqual(job_id.cluster, "cluster1")
+
+
+class TestClusterLoad(unittest.TestCase):
+    def test_from_queue_status(self):
+        load = ClusterLoad.from_queue_status(
+            queue_status={
+                "jobid": [1, 2, 3, 4],
+                "status": ["running", "running", "running", "pending"],
+                "submit_time": [0, 100, 200, 300],
+                "start_time": [60, 400, 260, None],
+            }
+        )
+        self.assertEqual(
+            load.to_dict(),
+            {"pending": 1, "running": 3, "wait_time": 60, "expected_start_time": 60},
+        )
+
+    def test_without_times(self):
+        load = ClusterLoad.from_queue_status(
+            queue_status={"jobid": [1, 2], "status": ["running", "pending"]}
+        )
+        self.assertIsNone(load.wait_time)
+        self.assertIsNone(load.expected_start_time)
+        self.assertEqual(ClusterLoad.from_queue_status(queue_status=None).expected_start_time, 0.0)
+
+    def test_sort_clusters_by_load(self):
+        self.assertEqual(
+            sort_clusters_by_load(
+                load_dict={
+                    "unknown": ClusterLoad(pending=1),
+                    "busy": ClusterLoad(pending=10, wait_time=3600),
+                    "slow": ClusterLoad(pending=1, wait_time=7200),
+                    "idle": ClusterLoad(pending=0, wait_time=7200),
+                }
+            ),
+            ["idle", "busy", "slow", "unknown"],
+        )
+
+
+class TestFitsQueueLimits(unittest.TestCase):
+    def test_fits_queue_limits(self):
+        self.assertTrue(fits_queue_limits(requested=(4, None, None), checked=(4, 100, None)))
+        self.assertTrue(fits_queue_limits(requested=(4, 60, "1GB"), checked=(4, 60, "1GB")))
+        self.assertFalse(fits_queue_limits(requested=(40, None, None), checked=(10, 100, None)))
+        self.assertFalse(fits_queue_limits(requested=(4, 600, None), checked=(4, 100, None)))
@@ -0,0 +1,187 @@
+import unittest
+
+import pandas
+
+from pysqa.base.status import (
+    StatusCache,
+    StatusSnapshot,
+    concat_queue_status,
+    filter_queue_status,
+    queue_status_to_dataframe,
+)
+
+
+class TestStatusCache(unittest.TestCase):
+    def test_disabled(self):
+        cache = StatusCache(ttl=0)
+        self.assertEqual(cache.get(function=lambda: 1), 1)
+        self.assertEqual(cache.get(function=lambda: 2), 2)
+        self.assertEqual(cache.info(), {"hits": 0, "misses": 2, "ttl": 0.0})
+
+    def test_hit_and_refresh(self):
+        cache = StatusCache(ttl=3600)
+        self.assertEqual(cache.get(function=lambda: 1), 1)
+        self.assertEqual(cache.get(function=lambda: 2), 1)
+        self.assertEqual(cache.get(function=lambda: 3, refresh=True), 3)
+        self.assertEqual(cache.info(), {"hits": 1, "misses": 2, "ttl": 3600.0})
+
+    def test_clear(self):
+        cache = StatusCache(ttl=3600)
+        cache.get(function=lambda: 1)
+        cache.clear()
+        self.assertEqual(cache.get(function=lambda: 2), 2)
+
+    def test_none_is_not_cached(self):
+        cache = StatusCache(ttl=3600)
+        self.assertIsNone(cache.get(function=lambda: None))
+        self.assertEqual(cache.get(function=lambda: 1), 1)
+
+    def test_incomplete_snapshot_is_not_cached(self):
+        cache = StatusCache(ttl=3600)
+        snapshot = StatusSnapshot(queue_status={"jobid": [1]}, complete=False)
+        self.assertIs(cache.get(function=lambda: snapshot), snapshot)
+        self.assertEqual(cache.get(function=lambda: 1), 1)
+
+    def test_ttl_setter(self):
+        cache = StatusCache(ttl=3600)
+        cache.get(function=lambda: 1)
+        cache.ttl = 0
+        self.assertEqual(cache.ttl, 0.0)
+        self.assertEqual(cache.get(function=lambda: 2), 2)
+
+
+class TestStatusSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.snapshot = StatusSnapshot(
+            df=pandas.DataFrame(
+                {
+                    "jobid": [3, 1, 2, 1],
+                    "user": ["a", "b", "c", "d"],
+                    "jobname": ["job_3", "job_1", "job_2", "job_1_duplicate"],
+                    "status": ["running", "pending", "running", "error"],
+                }
+            )
+        )
+
+    def test_len_and_contains(self):
+        self.assertEqual(len(self.snapshot), 4)
+        self.assertIn(3, self.snapshot)
+        self.assertNotIn(4, self.snapshot)
+
+    def test_lookup_status(self):
+        self.assertEqual(
+            self.snapshot.lookup(process_id_lst=[1, 4, 3], default="finished"),
+            ["pending", "finished", "running"],
+        )
+
+    def test_lookup_jobname(self):
+        self.assertEqual(
+            self.snapshot.lookup(process_id_lst=[2, 1], column="jobname"),
+            ["job_2", "job_1"],
+        )
+
+    def test_lookup_missing_column(self):
+        self.assertEqual(
+            self.snapshot.lookup(process_id_lst=[2, 1], column="working_directory"),
+            [None, None],
+        )
+
+
+class TestStatusSnapshotQueueStatus(unittest.TestCase):
+    def setUp(self):
+        self.queue_status = {
+            "jobid": [3, 1, 2, 1],
+            "user": ["a", "b", "c", "d"],
+            "status": ["running", "pending", "running", "error"],
+        }
+        self.snapshot = StatusSnapshot(queue_status=self.queue_status)
+
+    def test_lookup(self):
+        self.assertEqual(len(self.snapshot), 4)
+        self.assertEqual(
+            self.snapshot.lookup(process_id_lst=[1, 4, 3], default="finished"),
+            ["pending", "finished", "running"],
+        )
+        self.assertEqual(
+            self.snapshot.lookup(process_id_lst=[2], column="jobname"), [None]
+        )
+
+    def test_df_is_built_on_demand(self):
+        self.assertIsNone(self.snapshot._df)
+        self.assertEqual(self.snapshot.df["user"].tolist(), ["a", "b", "c", "d"])
+        self.assertIs(self.snapshot.df, self.snapshot.df)
+        self.assertEqual(self.snapshot.queue_status, self.queue_status)
+
+    def test_array_jobid(self):
+        snapshot = StatusSnapshot(
+            queue_status={
+                "jobid": [5, 12, 13, 14],
+                "status": ["running", "pending", "running", "pending"],
+                "array_jobid": [None, 12, 12, 12],
+            }
+        )
+        self.assertIn(12, snapshot)
+        self.assertEqual(
+            snapshot.lookup(process_id_lst=[12, 11], default="finished"),
+            ["pending", "finished"],
+        )
+        snapshot = StatusSnapshot(
+            queue_status={
+                "jobid": [5, 13, 14],
+                "status": ["running", "pending", "running"],
+                "array_jobid": [None, 12, 12],
+            }
+        )
+        self.assertEqual(snapshot.lookup(process_id_lst=[12]), ["running"])
+
+    def test_queue_status_from_df(self):
+        snapshot = StatusSnapshot(df=pandas.DataFrame(self.queue_status))
+        self.assertEqual(snapshot.queue_status, self.queue_status)
+
+    def test_missing_input(self):
+        with self.assertRaises(ValueError):
+            StatusSnapshot()
+
+
+class TestQueueStatusColumns(unittest.TestCase):
+    def test_concat(self):
+        self.assertIsNone(concat_queue_status(queue_status_lst=[None, None]))
+        self.assertEqual(
+            concat_queue_status(
+                queue_status_lst=[
+                    {"jobid": [1], "status": ["running"]},
+                    None,
+                    {"jobid": [2, 3], "status": ["pending", "running"], "user": ["a", "b"]},
+                ]
+            ),
+            {
+                "jobid": [1, 2, 3],
+                "status": ["running", "pending", "running"],
+                "user": [None, "a", "b"],
+            },
+        )
+
+    def test_filter(self):
+        self.assertIsNone(filter_queue_status(queue_status=None, column="user", value="a"))
+        self.assertEqual(
+            filter_queue_status(
+                queue_status={"jobid": [1, 2, 3], "user": ["a", "b", "a"]},
+                column="user",
+                value="a",
+            ),
+            {"jobid": [1, 3], "user": ["a", "a"]},
+        )
+
+    def test_to_dataframe(self):
+        self.assertIsNone(queue_status_to_dataframe(queue_status=None))
+        df = queue_status_to_dataframe(
+            queue_status={"jobid": [], "submit_time": [], "status": []}
+        )
+        self.assertEqual(len(df), 0)
+        self.assertEqual(df["jobid"].dtype, "int64")
+        df = queue_status_to_dataframe(
+            queue_status={"jobid": [1], "submit_time": [1700000000], "status": ["running"]}
+        )
+        self.assertEqual(
+            df["submit_time"][0], pandas.Timestamp(1700000000, unit="s", tz="UTC")
+        )
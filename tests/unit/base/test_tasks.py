@@ -0,0 +1,133 @@
+import os
+import shutil
+import subprocess
+import unittest
+
+from pysqa.base.tasks import (
+    get_pack_size,
+    get_packed_task_command,
+    get_task_status_lst,
+    read_task_list,
+    task_manifest_filename,
+    task_status_directory,
+    write_task_manifest,
+)
+
+
+class TestTasks(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.abspath("tasks_test")
+        self.task_lst = [
+            (os.path.join(self.path, "task_1"), "echo hello > out.txt"),
+            (os.path.join(self.path, "task_2"), "exit 3"),
+            (os.path.join(self.path, "task_3"), "echo never"),
+        ]
+        self.manifest_path = write_task_manifest(
+            working_directory=self.path, task_lst=self.task_lst
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_write_task_manifest(self):
+        self.assertEqual(
+            self.manifest_path, os.path.join(self.path, task_manifest_filename)
+        )
+        self.assertEqual(
+            read_task_list(working_directory=self.path),
+            [
+                {"working_directory": working_directory, "command": command}
+                for working_directory, command in self.task_lst
+            ],
+        )
+        for working_directory, _ in self.task_lst:
+            self.assertTrue(os.path.isdir(working_directory))
+
+    def test_whitespace_in_working_directory(self):
+        with self.assertRaises(ValueError):
+            write_task_manifest(
+                working_directory=self.path,
+                task_lst=[(os.path.join(self.path, "task 1"), "echo hello")],
+            )
+
+    def test_task_status(self):
+        self.assertEqual(
+            get_task_status_lst(working_directory=self.path, job_status="pending"),
+            ["pending", "pending", "pending"],
+        )
+        self.assertEqual(
+            subprocess.call(["bash", self.manifest_path, "1"], cwd=self.path), 0
+        )
+        self.assertEqual(
+            subprocess.call(["bash", self.manifest_path, "2"], cwd=self.path), 3
+        )
+        with open(os.path.join(self.path, "task_1", "out.txt")) as f:
+            self.assertEqual(f.read(), "hello\n")
+        self.assertEqual(
+            get_task_status_lst(working_directory=self.path, job_status="running"),
+            ["finished", "error", "pending"],
+        )
+        self.assertEqual(
+            get_task_status_lst(working_directory=self.path, job_status=None),
+            ["finished", "error", "error"],
+        )
+        self.assertEqual(
+            get_task_status_lst(
+                working_directory=self.path,
+                job_status="finished",
+                task_index_lst=[1],
+            ),
+            ["finished"],
+        )
+
+    def test_task_status_killed(self):
+        status_path = os.path.join(self.path, task_status_directory)
+        os.makedirs(status_path, exist_ok=True)
+        open(os.path.join(status_path, "3.running"), "w").close()
+        self.assertEqual(
+            get_task_status_lst(
+                working_directory=self.path, job_status="running", task_index_lst=[3]
+            ),
+            ["running"],
+        )
+        self.assertEqual(
+            get_task_status_lst(
+                working_directory=self.path, job_status=None, task_index_lst=[3]
+            ),
+            ["error"],
+        )
+        self.assertEqual(
+            get_task_status_lst(
+                working_directory=self.path, job_status="cancelled", task_index_lst=[3]
+            ),
+            ["error"],
+        )
+
+    def test_packed_task_command(self):
+        command = get_packed_task_command(
+            manifest_path=self.manifest_path, task_count=3, parallel_task_count=2
+        )
+        self.assertEqual(
+            command, "seq 1 3 | xargs -P 2 -n 1 bash " + self.manifest_path
+        )
+        self.assertNotEqual(
+            subprocess.call(["bash", "-c", command], cwd=self.path), 0
+        )
+        self.assertEqual(
+            get_task_status_lst(working_directory=self.path, job_status=None),
+            ["finished", "error", "finished"],
+        )
+
+
+class TestPackSize(unittest.TestCase):
+    def test_pack_size(self):
+        self.assertEqual(get_pack_size(cores=8), 8)
+        self.assertEqual(get_pack_size(cores=8, task_cores=3), 2)
+        self.assertEqual(get_pack_size(cores=2, task_cores=4), 1)
+        self.assertEqual(get_pack_size(cores=8, run_time_max=3600), 8)
+        self.assertEqual(
+            get_pack_size(cores=8, run_time_max=3600, task_run_time=600), 48
+        )
+        self.assertEqual(
+            get_pack_size(cores=8, run_time_max=300, task_run_time=600), 8
+        )
@@ -0,0 +1,105 @@
+import unittest
+
+from pysqa.base.wait import PollPolicy, iter_wait_for_jobs, wait_for_jobs
+
+
+class FakeQueue:
+    def __init__(self, status_dict_lst):
+        self.status_dict_lst = status_dict_lst
+        self.query_lst = []
+        self.time = 0.0
+
+    def status_function(self, process_id_lst):
+        self.query_lst.append(list(process_id_lst))
+        status_dict = self.status_dict_lst[
+            min(len(self.query_lst), len(self.status_dict_lst)) - 1
+        ]
+        return [status_dict[process_id] for process_id in process_id_lst]
+
+    def sleep(self, interval):
+        self.time += interval
+
+    def clock(self):
+        return self.time
+
+
+class TestPollPolicy(unittest.TestCase):
+    def test_next_interval(self):
+        policy = PollPolicy(
+            interval_min=1, interval_max=60, backoff_factor=2, age_factor=0.5
+        )
+        self.assertEqual(
+            policy.next_interval(interval=None, elapsed=0, changed_fraction=0), 1
+        )
+        self.assertEqual(
+            policy.next_interval(interval=4, elapsed=100, changed_fraction=0), 8
+        )
+        self.assertEqual(
+            policy.next_interval(interval=4, elapsed=100, changed_fraction=1), 2
+        )
+        self.assertEqual(
+            policy.next_interval(interval=4, elapsed=4, changed_fraction=0), 2
+        )
+        self.assertEqual(
+            policy.next_interval(interval=50, elapsed=1000, changed_fraction=0), 60
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PollPolicy(interval_min=0)
+        with self.assertRaises(ValueError):
+            PollPolicy(interval_min=10, interval_max=1)
+        with self.assertRaises(ValueError):
+            PollPolicy(backoff_factor=0.5)
+
+
+class TestWaitForJobs(unittest.TestCase):
+    def test_wait_for_jobs(self):
+        queue = FakeQueue(
+            status_dict_lst=[
+                {1: "pending", 2: "pending", 3: "running"},
+                {1: "running", 2: "pending", 3: "finished"},
+                {1: "running", 2: "running"},
+                {1: "error", 2: "finished"},
+            ]
+        )
+        self.assertEqual(
+            wait_for_jobs(
+                status_function=queue.status_function,
+                process_id_lst=[1, 2, 3, 3],
+                sleep=queue.sleep,
+                clock=queue.clock,
+            ),
+            {1: "error", 2: "finished", 3: "finished"},
+        )
+        self.assertEqual(queue.query_lst, [[1, 2, 3], [1, 2, 3], [1, 2], [1, 2]])
+
+    def test_iter_wait_for_jobs(self):
+        queue = FakeQueue(
+            status_dict_lst=[
+                {1: "running", 2: "finished"},
+                {1: "finished"},
+            ]
+        )
+        iterator = iter_wait_for_jobs(
+            status_function=queue.status_function,
+            process_id_lst=[1, 2],
+            sleep=queue.sleep,
+            clock=queue.clock,
+        )
+        self.assertEqual(next(iterator), (2, "finished"))
+        self.assertEqual(len(queue.query_lst), 1)
+        self.assertEqual(next(iterator), (1, "finished"))
+        self.assertEqual(list(iterator), [])
+
+    def test_timeout(self):
+        queue = FakeQueue(status_dict_lst=[{1: "running"}])
+        with self.assertRaises(TimeoutError):
+            wait_for_jobs(
+                status_function=queue.status_function,
+                process_id_lst=[1],
+                timeout=30,
+                sleep=queue.sleep,
+                clock=queue.clock,
+            )
+        self.assertAlmostEqual(queue.time, 30)
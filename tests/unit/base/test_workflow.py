@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+
+from pysqa.base.core import QueueAdapterCore
+from pysqa.base.workflow import get_topological_levels, submit_workflow
+
+
+class TestTopologicalLevels(unittest.TestCase):
+    def test_levels(self):
+        self.assertEqual(
+            get_topological_levels(
+                node_lst=["merge", "a", "b", "prepare", "c"],
+                dependency_dict={
+                    "a": ["prepare"],
+                    "b": ["prepare"],
+                    "merge": ["a", "b", "c"],
+                },
+            ),
+            [["prepare", "c"], ["a", "b"], ["merge"]],
+        )
+
+    def test_no_dependencies(self):
+        self.assertEqual(get_topological_levels(node_lst=["a", "b"]), [["a", "b"]])
+        self.assertEqual(get_topological_levels(node_lst=[]), [])
+
+    def test_cycle(self):
+        with self.assertRaises(ValueError):
+            get_topological_levels(
+                node_lst=["a", "b", "c"], dependency_dict={"a": ["b"], "b": ["a"]}
+            )
+
+    def test_unknown_node(self):
+        with self.assertRaises(ValueError):
+            get_topological_levels(node_lst=["a"], dependency_dict={"a": ["b"]})
+
+
+class TestSubmitWorkflow(unittest.TestCase):
+    def test_submit_workflow(self):
+        call_lst = []
+
+        def submit_jobs(job_spec_lst):
+            call_lst.append(job_spec_lst)
+            return [100 * len(call_lst) + i for i in range(len(job_spec_lst))]
+
+        job_id_dict = submit_workflow(
+            submit_jobs=submit_jobs,
+            job_spec_dict={
+                "merge": {"command": "merge"},
+                "a": {"command": "a", "dependency_list": [7]},
+                "b": {"command": "b"},
+                "prepare": {"command": "prepare"},
+            },
+            dependency_dict={"a": ["prepare"], "b": ["prepare"], "merge": ["a", "b"]},
+        )
+        self.assertEqual(
+            job_id_dict, {"merge": 300, "a": 200, "b": 201, "prepare": 100}
+        )
+        self.assertEqual(
+            call_lst,
+            [
+                [{"command": "prepare"}],
+                [
+                    {"command": "a", "dependency_list": [7, 100]},
+                    {"command": "b", "dependency_list": [100]},
+                ],
+                [{"command": "merge", "dependency_list": [200, 201]}],
+            ],
+        )
+
+    def test_failed_upstream(self):
+        call_lst = []
+
+        def submit_jobs(job_spec_lst):
+            call_lst.append(job_spec_lst)
+            return [
+                ValueError() if job_spec["command"] == "a" else 1
+                for job_spec in job_spec_lst
+            ]
+
+        job_id_dict = submit_workflow(
+            submit_jobs=submit_jobs,
+            job_spec_dict={"a": {"command": "a"}, "b": {"command": "b"}, "c": {"command": "c"}},
+            dependency_dict={"c": ["a", "b"]},
+        )
+        self.assertIsInstance(job_id_dict["a"], ValueError)
+        self.assertEqual(job_id_dict["b"], 1)
+        self.assertIsInstance(job_id_dict["c"], RuntimeError)
+        self.assertEqual(len(call_lst), 1)
+
+    def test_dependencies_not_supported(self):
+        with self.assertRaises(NotImplementedError):
+            submit_workflow(
+                submit_jobs=lambda job_spec_lst: [],
+                job_spec_dict={"a": {}, "b": {}},
+                dependency_dict={"b": ["a"]},
+                supports_dependencies=False,
+            )
+
+
+class TestQueueAdapterCoreWorkflow(unittest.TestCase):
+    def test_slurm(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return str(len(os.path.basename(working_directory))) + "\n"
+
+        qa = QueueAdapterCore(queue_type="SLURM", execute_command=execute_command)
+        self.assertTrue(qa.supports_dependencies)
+        with tempfile.TemporaryDirectory() as directory:
+            job_id_dict = qa.submit_workflow(
+                job_spec_dict={
+                    node: {
+                        "working_directory": os.path.join(directory, node),
+                        "command": "echo " + node,
+                    }
+                    for node in ["a", "bb", "ccc"]
+                },
+                dependency_dict={"ccc": ["a", "bb"]},
+            )
+            self.assertEqual(job_id_dict, {"a": 1, "bb": 2, "ccc": 3})
+            with open(os.path.join(directory, "ccc", "run_queue.sh")) as f:
+                self.assertIn("#SBATCH --dependency=afterok:1,2", f.read())
+
+    def test_supports_dependencies(self):
+        self.assertTrue(QueueAdapterCore(queue_type="TORQUE").supports_dependencies)
+        self.assertTrue(QueueAdapterCore(queue_type="FLUX").supports_dependencies)
+        self.assertFalse(QueueAdapterCore(queue_type="LSF").supports_dependencies)
+        self.assertFalse(QueueAdapterCore(queue_type="GENT").supports_dependencies)
+        self.assertFalse(QueueAdapterCore(queue_type="REMOTE").supports_dependencies)
@@ -0,0 +1,148 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from pysqa import AsyncQueueAdapter
+from pysqa.asyncadapter import execute_command_async
+
+
+class TestExecuteCommandAsync(unittest.TestCase):
+    def test_commands_as_lst(self):
+        output = asyncio.run(
+            execute_command_async(commands=["echo", "hello"], working_directory=".")
+        )
+        self.assertEqual(output, ["hello", ""])
+
+    def test_commands_as_str_no_split(self):
+        output = asyncio.run(
+            execute_command_async(commands="echo hello", split_output=False)
+        )
+        self.assertEqual(output, "hello\n")
+
+    def test_commands_fails(self):
+        output = asyncio.run(
+            execute_command_async(
+                commands="exit 1", error_filename="pysqa_async_fails.err"
+            )
+        )
+        self.assertIsNone(output)
+        os.remove("pysqa_async_fails.err")
+
+
+class TestAsyncQueueAdapter(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.dirname(os.path.abspath(__file__))
+        self.calls = []
+        self.running = 0
+        self.running_max = 0
+
+        async def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            self.calls.append(commands)
+            self.running += 1
+            self.running_max = max(self.running, self.running_max)
+            await asyncio.sleep(0.01)
+            self.running -= 1
+            if commands[0] == "squeue":
+                with open(
+                    os.path.join(self.path, "..", "static", "slurm", "squeue_output")
+                ) as f:
+                    return f.read()
+            elif commands[0] == "sbatch":
+                return "1\n"
+            elif commands[0] == "sacct":
+                return "1|FAILED\n"
+            else:
+                return ["deleted", ""]
+
+        self.qa = AsyncQueueAdapter(
+            directory=os.path.join(self.path, "..", "static", "slurm"),
+            execute_command=execute_command,
+            max_concurrency=2,
+        )
+
+    def test_submit_job(self):
+        async def submit():
+            return await asyncio.gather(
+                *[
+                    self.qa.submit_job(queue="slurm", command="echo hello")
+                    for _ in range(4)
+                ]
+            )
+
+        self.assertEqual(asyncio.run(submit()), [1, 1, 1, 1])
+        self.assertEqual(self.running_max, 2)
+        self.assertEqual(self.calls[0], ["sbatch", "--parsable", "./run_queue.sh"])
+        os.remove("run_queue.sh")
+
+    def test_submit_job_job_registry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.qa = AsyncQueueAdapter(
+                directory=os.path.join(self.path, "..", "static", "slurm"),
+                execute_command=self.qa._execute_command_function,
+                job_registry=os.path.join(directory, "registry.db"),
+            )
+            process_id = asyncio.run(
+                self.qa.submit_job(
+                    queue="slurm",
+                    job_name="test",
+                    working_directory=directory,
+                    command="echo hello",
+                )
+            )
+            self.assertEqual(process_id, 1)
+            job_registry = self.qa.queue_adapter.job_registry
+            job = job_registry.get_job(cluster="default", process_id=1)
+            self.assertEqual(job["job_name"], "test")
+            asyncio.run(self.qa.get_status_of_jobs(process_id_lst=[1]))
+            job = job_registry.get_job(cluster="default", process_id=1)
+            self.assertEqual(job["status"], "finished")
+            job_registry.close()
+
+    def test_delete_job(self):
+        self.assertEqual(asyncio.run(self.qa.delete_job(process_id=1)), "deleted")
+        self.assertEqual(self.calls, [["scancel", "1"]])
+
+    def test_get_queue_status(self):
+        df = asyncio.run(self.qa.get_queue_status(user="maxi"))
+        self.assertEqual(list(df["jobid"]), [5322013])
+
+    def test_get_queue_status_dict(self):
+        queue_status = asyncio.run(self.qa.get_queue_status_dict(user="maxi"))
+        self.assertEqual(queue_status["jobid"], [5322013])
+        self.assertEqual(queue_status["user"], ["maxi"])
+
+    def test_get_status_of_jobs(self):
+        self.assertEqual(
+            asyncio.run(self.qa.get_status_of_jobs(process_id_lst=[5322019, 1])),
+            ["running", "finished"],
+        )
+        self.assertEqual(
+            asyncio.run(self.qa.get_status_of_job(process_id=5322013)), "running"
+        )
+
+    def test_get_status_of_jobs_accounting(self):
+        self.qa.queue_adapter._adapter._accounting = True
+        self.assertEqual(
+            asyncio.run(self.qa.get_status_of_jobs(process_id_lst=[5322019, 1, 2])),
+            ["running", "failed", "finished"],
+        )
+        self.assertEqual(asyncio.run(self.qa.get_status_of_job(process_id=1)), "failed")
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.calls[1][0], "sacct")
+
+    def test_get_status_snapshot_shared_cache(self):
+        self.qa.queue_adapter._adapter.status_cache_ttl = 3600
+        asyncio.run(self.qa.get_status_of_job(process_id=5322013))
+        self.assertEqual(len(self.qa.queue_adapter.get_status_snapshot()), 5)
+        self.assertEqual(len(asyncio.run(self.qa.get_status_of_my_jobs())), 0)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_list_clusters(self):
+        self.assertEqual(self.qa.list_clusters(), ["default"])
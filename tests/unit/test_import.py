@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+import unittest
+
+lazy_module_lst = ["defusedxml", "flux", "jinja2", "pandas", "paramiko", "yaml"]
+
+
+def get_imported_modules(statement: str) -> list[str]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            statement
+            + "; import json, sys; print(json.dumps([m for m in "
+            + str(lazy_module_lst)
+            + " if m in sys.modules]))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_pysqa(self):
+        self.assertEqual(get_imported_modules(statement="import pysqa"), [])
+
+    def test_import_command_line(self):
+        self.assertEqual(get_imported_modules(statement="import pysqa.base.cmd"), [])
+
+    def test_import_queue_adapter(self):
+        self.assertEqual(
+            get_imported_modules(statement="from pysqa import QueueAdapter"), []
+        )
+
+    def test_import_wrappers(self):
+        self.assertEqual(
+            get_imported_modules(
+                statement="import pysqa.wrapper.flux, pysqa.wrapper.sge, pysqa.wrapper.slurm"
+            ),
+            [],
+        )
+
+    def test_pandas_loaded_on_demand(self):
+        self.assertEqual(
+            get_imported_modules(
+                statement="from pysqa.wrapper.slurm import SlurmCommands; SlurmCommands.convert_queue_status('')"
+            ),
+            ["pandas"],
+        )
+
+    def test_status_without_pandas(self):
+        self.assertEqual(
+            get_imported_modules(
+                statement="from pysqa.base.core import QueueAdapterCore; "
+                + "qa = QueueAdapterCore(queue_type='SLURM', execute_command=lambda commands, working_directory=None, "
+                + "split_output=True, shell=False, error_filename='pysqa.err': '1|user|R|job|/home/user'); "
+                + "assert qa.get_status_of_jobs(process_id_lst=[1]) == ['running']; "
+                + "assert qa.get_queue_status_dict()['jobid'] == [1]"
+            ),
+            [],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
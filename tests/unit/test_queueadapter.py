@@ -1,7 +1,9 @@
 import os
+import tempfile
 import unittest
 from jinja2.exceptions import TemplateSyntaxError
 from pysqa import QueueAdapter
+from pysqa.base.routing import ClusterJobID
 
 try:
     import paramiko
@@ -83,6 +85,25 @@ class TestMultiQueueAdapter(unittest.TestCase):
         self.multi.switch_cluster("local_slurm")
         self.assertEqual(self.multi.queue_list, ["slurm"])
 
+    def test_lazy_cluster_adapter(self):
+        multi = QueueAdapter(
+            directory=os.path.join(self.path, "../static/multicluster"),
+            status_cache_ttl=60,
+        )
+        self.assertEqual(list(multi._queue_dict.keys()), ["local_slurm"])
+        self.assertEqual(multi.list_clusters(), ["local_slurm", "remote_slurm"])
+        multi.switch_cluster("remote_slurm")
+        adapter = multi._adapter
+        self.assertEqual(adapter.status_cache_ttl, 60)
+        self.assertEqual(
+            list(multi._queue_dict.keys()), ["local_slurm", "remote_slurm"]
+        )
+        multi.switch_cluster("local_slurm")
+        multi.switch_cluster("remote_slurm")
+        self.assertIs(multi._adapter, adapter)
+        with self.assertRaises(KeyError):
+            multi.switch_cluster("missing")
+
 
 @unittest.skipIf(
     skip_multi_test,
@@ -141,3 +162,268 @@ class TestNoneAdapter(unittest.TestCase):
         self.assertEqual(cores_input, cores)
         self.assertEqual(run_time_max, run_time_input)
         self.assertIsNone(memory_max)
+
+
+class TestQueueAdapterJobRegistry(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "registry.db")
+        self.working_directory = os.path.join(self.directory.name, "registry_job")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def execute_command(
+        self,
+        commands,
+        working_directory=None,
+        split_output=True,
+        shell=False,
+        error_filename="pysqa.err",
+    ):
+        if commands[0] == "sbatch":
+            return "1\n"
+        return "1|user|R|pysqa|" + self.working_directory + "\n"
+
+    def test_job_registry(self):
+        qa = QueueAdapter(
+            queue_type="slurm",
+            execute_command=self.execute_command,
+            job_registry=self.path,
+        )
+        process_id = qa.submit_job(
+            job_name="pysqa",
+            working_directory=self.working_directory,
+            cores=1,
+            command="echo hello",
+            partition="slurm",
+        )
+        self.assertEqual(process_id, 1)
+        self.assertEqual(
+            qa.job_registry.get_jobs(status="pending")["jobid"].tolist(), [1]
+        )
+        self.assertEqual(qa.get_status_of_jobs(process_id_lst=[1]), ["running"])
+        df = qa.job_registry.get_jobs(cluster="SLURM", status="running")
+        self.assertEqual(df["working_directory"].tolist(), [self.working_directory])
+        qa.job_registry.close()
+
+    def test_job_registry_defaults(self):
+        with open(os.path.join(self.directory.name, "queue.yaml"), "w") as f:
+            f.write(
+                "queue_type: SLURM\nqueue_primary: slurm\nqueues:\n"
+                + "  slurm: {cores_max: 4, cores_min: 1, run_time_max: 3600, script: slurm.sh}\n"
+            )
+        with open(os.path.join(self.directory.name, "slurm.sh"), "w") as f:
+            f.write("#!/bin/bash\n{{command}}")
+        qa = QueueAdapter(
+            directory=self.directory.name,
+            execute_command=self.execute_command,
+            job_registry=self.path,
+        )
+        qa.submit_job(working_directory=self.working_directory, command="echo hello")
+        job = qa.job_registry.get_job(cluster="default", process_id=1)
+        self.assertEqual(job["queue"], "slurm")
+        self.assertEqual(job["job_name"], "pysqa")
+        qa.job_registry.close()
+
+class TestClusterRouting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.directory.name, "clusters.yaml"), "w") as f:
+            f.write("cluster_primary: large\ncluster: {large: large.yaml, small: small.yaml}\n")
+        for name, cores_max in [("large", 100), ("small", 10)]:
+            with open(os.path.join(self.directory.name, name + ".yaml"), "w") as f:
+                f.write(
+                    "queue_type: SLURM\nqueue_primary: slurm\nqueues:\n  slurm: {cores_max: "
+                    + str(cores_max)
+                    + ", cores_min: 1, run_time_max: 3600, script: slurm.sh}\n"
+                )
+        with open(os.path.join(self.directory.name, "slurm.sh"), "w") as f:
+            f.write("#!/bin/bash\n{{command}}")
+        self.command_dict = {"large": [], "small": []}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_execute_command(self, cluster, queue_status_output, job_id):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            self.command_dict[cluster].append(commands)
+            if commands[0] == "sbatch":
+                return "Submitted batch job " + str(job_id)
+            return queue_status_output
+
+        return execute_command
+
+    def get_queue_adapter(self, cluster_routing="least_loaded"):
+        qa = QueueAdapter(directory=self.directory.name, cluster_routing=cluster_routing)
+        qa._get_cluster_adapter(cluster_name="large")._execute_command = self.get_execute_command(
+            cluster="large",
+            queue_status_output="1|user|PD|job|/home/user\n2|user|PD|job|/home/user\n",
+            job_id=1001,
+        )
+        qa._get_cluster_adapter(cluster_name="small")._execute_command = self.get_execute_command(
+            cluster="small",
+            queue_status_output="3|user|R|job|/home/user\n",
+            job_id=2001,
+        )
+        return qa
+
+    def test_least_loaded(self):
+        qa = self.get_queue_adapter()
+        job_id = qa.submit_job(cores=4, command="echo hello", working_directory=self.directory.name)
+        self.assertIsInstance(job_id, ClusterJobID)
+        self.assertEqual(job_id, 2001)
+        self.assertEqual(job_id.cluster, "small")
+        self.assertEqual(qa.get_cluster_load(cluster_name="large").pending, 2)
+        self.assertIsNone(qa.get_status_of_job(process_id=job_id))
+        self.assertEqual(self.command_dict["small"][-1][0], "squeue")
+
+    def test_queue_limits(self):
+        qa = self.get_queue_adapter()
+        job_id = qa.submit_job(cores=40, command="echo hello", working_directory=self.directory.name)
+        self.assertEqual(job_id.cluster, "large")
+        self.assertEqual(qa.select_cluster(cores=4), "small")
+        with self.assertRaises(ValueError):
+            qa.select_cluster(cores=400)
+        with self.assertRaises(ValueError):
+            qa.select_cluster(queue="missing")
+
+    def test_submit_jobs_routing(self):
+        qa = self.get_queue_adapter()
+        job_id_lst = qa.submit_jobs(
+            job_spec_lst=[
+                {"cores": 4, "command": "echo 1", "working_directory": self.directory.name},
+                {"cores": 40, "command": "echo 2", "working_directory": self.directory.name},
+                {"cores": 400, "command": "echo 3", "working_directory": self.directory.name},
+            ]
+        )
+        self.assertEqual(job_id_lst[:2], [2001, 1001])
+        self.assertEqual([job_id.cluster for job_id in job_id_lst[:2]], ["small", "large"])
+        self.assertIsInstance(job_id_lst[2], ValueError)
+
+    def test_submit_array_job_routing(self):
+        qa = self.get_queue_adapter()
+        job_id = qa.submit_array_job(
+            working_directory_lst=[
+                os.path.join(self.directory.name, "task_" + str(i)) for i in range(2)
+            ],
+            command_lst=["echo " + str(i) for i in range(2)],
+            working_directory=os.path.join(self.directory.name, "array"),
+            cores=4,
+        )
+        self.assertEqual(job_id, 2001)
+        self.assertEqual(job_id.cluster, "small")
+
+    def test_status_routing(self):
+        qa = self.get_queue_adapter(cluster_routing="active")
+        job_id = qa.submit_job(cores=4, command="echo hello", working_directory=self.directory.name)
+        self.assertEqual(job_id.cluster, "large")
+        self.assertEqual(
+            qa.get_status_of_jobs(
+                process_id_lst=[ClusterJobID(3, cluster="small"), job_id, 1]
+            ),
+            ["running", "finished", "pending"],
+        )
+
+    def test_submit_workflow_routing(self):
+        qa = self.get_queue_adapter()
+        job_id_dict = qa.submit_workflow(
+            job_spec_dict={
+                "x": {"cores": 40, "command": "echo x", "working_directory": self.directory.name},
+                "y": {"cores": 4, "command": "echo y", "working_directory": self.directory.name},
+            },
+            dependency_dict={"y": ["x"]},
+        )
+        self.assertEqual([job_id.cluster for job_id in job_id_dict.values()], ["large", "large"])
+        self.assertEqual(self.command_dict["small"], [])
+        job_id = qa.submit_job(
+            cores=4,
+            command="echo z",
+            working_directory=self.directory.name,
+            dependency_list=[ClusterJobID(5, cluster="large")],
+        )
+        self.assertEqual(job_id.cluster, "large")
+        with self.assertRaises(ValueError):
+            qa.submit_job(
+                cores=4,
+                command="echo z",
+                working_directory=self.directory.name,
+                dependency_list=[ClusterJobID(5, cluster="large"), ClusterJobID(6, cluster="small")],
+            )
+
+    def test_delete_jobs_routing(self):
+        qa = self.get_queue_adapter(cluster_routing="active")
+        qa.delete_jobs(process_id_lst=[ClusterJobID(99, cluster="small")])
+        self.assertEqual(self.command_dict["large"], [])
+        self.assertEqual(self.command_dict["small"], [["scancel", "99"]])
+
+    def test_unknown_routing(self):
+        with self.assertRaises(ValueError):
+            QueueAdapter(directory=self.directory.name, cluster_routing="random")
+
+
+class TestTaskPacking(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.directory.name, "queue.yaml"), "w") as f:
+            f.write(
+                "queue_type: SLURM\nqueue_primary: slurm\nqueues:\n"
+                + "  slurm: {cores_max: 4, cores_min: 1, run_time_max: 3600, script: slurm.sh}\n"
+            )
+        with open(os.path.join(self.directory.name, "slurm.sh"), "w") as f:
+            f.write(
+                "#!/bin/bash\n#SBATCH --ntasks={{cores}}\n#SBATCH --time={{run_time_max}}\n{{command}}"
+            )
+        self.process_id_lst = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def execute_command(
+        self,
+        commands,
+        working_directory=None,
+        split_output=True,
+        shell=False,
+        error_filename="pysqa.err",
+    ):
+        if commands[0] == "sbatch":
+            self.process_id_lst.append(1 + len(self.process_id_lst))
+            return "Submitted batch job " + str(self.process_id_lst[-1])
+        return "".join(
+            str(process_id) + "|user|R|pysqa|" + self.directory.name + "\n"
+            for process_id in self.process_id_lst
+        )
+
+    def test_submit_packed_jobs(self):
+        qa = QueueAdapter(
+            directory=self.directory.name, execute_command=self.execute_command
+        )
+        working_directory = os.path.join(self.directory.name, "packed")
+        result_lst = qa.submit_packed_jobs(
+            working_directory_lst=[
+                os.path.join(working_directory, "task_" + str(i)) for i in range(10)
+            ],
+            command_lst=["echo " + str(i) for i in range(10)],
+            working_directory=working_directory,
+            cores=100,
+            task_run_time=1800,
+        )
+        self.assertEqual(sorted(result_lst), [1, 2])
+        for pack_name in ["pack_1", "pack_2"]:
+            with open(os.path.join(working_directory, pack_name, "run_queue.sh")) as f:
+                content = f.read()
+            self.assertIn("#SBATCH --ntasks=4", content)
+            self.assertIn("#SBATCH --time=3600", content)
+            self.assertIn("xargs -P 4 -n 1 bash", content)
+        with open(os.path.join(working_directory, "pack_1", "run_queue.sh")) as f:
+            self.assertIn("seq 1 8 |", f.read())
+        self.assertEqual(
+            qa.get_status_of_packed_jobs(process_id_lst=result_lst), ["pending"] * 10
+        )
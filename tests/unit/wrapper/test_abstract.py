@@ -1,6 +1,13 @@
 import unittest
 from unittest.mock import patch
-from pysqa.wrapper.abstract import SchedulerCommands
+from pysqa.wrapper.abstract import (
+    SchedulerCommands,
+    clear_template_cache,
+    compile_template,
+    template_cache_info,
+    template_cache_size,
+)
+from pysqa.wrapper.slurm import SlurmCommands, template as slurm_template
 
 
 class TmpSchedularCommands(SchedulerCommands):
@@ -77,3 +84,42 @@ class TestSchedulerCommands(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             NoSubmitSchedularCommands()
+
+
+class TestTemplateCache(unittest.TestCase):
+    def setUp(self):
+        clear_template_cache()
+
+    def tearDown(self):
+        clear_template_cache()
+
+    def test_compiled_once(self):
+        for job_name in ["job_1", "job_2", "job_3"]:
+            self.assertEqual(
+                SchedulerCommands.render_submission_template(
+                    command="echo hello",
+                    submission_template="#{{job_name}}\n{{command}}",
+                    job_name=job_name,
+                ),
+                "#" + job_name + "\necho hello",
+            )
+        info = template_cache_info()
+        self.assertEqual(info["hits"], 2)
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["currsize"], 1)
+
+    def test_shared_by_wrappers(self):
+        SlurmCommands.render_submission_template(command="echo hello")
+        SlurmCommands.render_submission_template(command="echo world")
+        self.assertIs(
+            compile_template(source=slurm_template), compile_template(source=slurm_template)
+        )
+        self.assertEqual(template_cache_info()["misses"], 1)
+
+    def test_clear(self):
+        compile_template(source="{{command}}")
+        clear_template_cache()
+        self.assertEqual(
+            template_cache_info(),
+            {"hits": 0, "misses": 0, "maxsize": template_cache_size, "currsize": 0},
+        )
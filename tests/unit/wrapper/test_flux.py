@@ -66,6 +66,36 @@ class TestFluxQueueAdapter(unittest.TestCase):
             )
         )
 
+    def test_queue_status_finished(self):
+        content = (
+            "ƒWZEQa8X dahn     sleep_batc  R      2      2   1.931s [0-1]\n"
+            "ƒW8eCV2o dahn     sleep_batc  F      2      2   2.896s [0-1]\n"
+            "ƒVhYLeJB dahn     sleep_batc  TO     2      2   3.878s [0-1]\n"
+            "1234 dahn     sleep_batc  C      2      2   4.012s [0-1]\n"
+            "1235 dahn     sleep_batc  CA     2      2   0.512s [0-1]\n"
+        )
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return content
+
+        flux_tmp = QueueAdapter(queue_type="FLUX", execute_command=execute_command)
+        self.assertEqual(
+            flux_tmp.get_queue_status_dict()["status"],
+            ["running", "failed", "timeout", "running", "cancelled"],
+        )
+        self.assertEqual(
+            flux_tmp.wait_for_jobs(
+                process_id_lst=[1109007532032, 1092532305920], timeout=2
+            ),
+            {1109007532032: "failed", 1092532305920: "timeout"},
+        )
+
     def test_submit_job(self):
         def execute_command(
             commands,
@@ -105,3 +135,20 @@ echo hello"""
         self.assertEqual(content, output)
         os.remove("run_queue.sh")
 
+
+    def test_convert_accounting_status(self):
+        self.assertEqual(
+            self.flux._adapter._commands.get_accounting_commands(process_id_lst=[1]),
+            [["flux", "jobs", "-a", "--no-header", "-o", "{id} {result}", "1"]],
+        )
+        self.assertEqual(
+            self.flux._adapter._commands.convert_accounting_status(
+                accounting_output="ƒW8eCV2o COMPLETED\nƒVhYLeJB FAILED\n3 CANCELED\n4 TIMEOUT\n5 \n"
+            ),
+            {
+                1109007532032: "finished",
+                1092532305920: "failed",
+                3: "cancelled",
+                4: "timeout",
+            },
+        )
@@ -1,6 +1,10 @@
 import os
 import pandas
+import threading
+import time
 import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pysqa import QueueAdapter
 
 df_queue_status = pandas.DataFrame(
@@ -15,7 +19,7 @@ df_queue_status = pandas.DataFrame(
             "pi_19576487",
             "pi_19576482",
         ],
-        "status": ["r", "r", "r", "r", "r"],
+        "status": ["running", "running", "running", "running", "running"],
     }
 )
 
@@ -39,7 +43,7 @@ class TestGentQueueAdapter(unittest.TestCase):
     def test_interfaces(self):
         self.assertEqual(
             self.gent._adapter._commands.get_queue_status_command,
-            ["squeue", "--format", "%A|%u|%t|%.15j|%Z", "--noheader"],
+            ["squeue", "--format", "%A|%u|%t|%.15j|%Z|%F", "--noheader"],
         )
 
     def test__list_command_to_be_executed(self):
@@ -83,9 +87,20 @@ class TestGentQueueAdapter(unittest.TestCase):
         )
 
     def test_convert_queue_status_empty(self):
-        self.assertIsNone(self.gent._adapter._commands.convert_queue_status(
-            queue_status_output=":"
-        ))
+        self.assertEqual(
+            self.gent._adapter._commands.convert_queue_status_to_dict(
+                queue_status_output=":"
+            ),
+            {"cluster": [], "jobid": [], "user": [], "jobname": [], "status": []},
+        )
+        self.assertEqual(
+            len(
+                self.gent._adapter._commands.convert_queue_status(
+                    queue_status_output=":"
+                )
+            ),
+            0,
+        )
 
     def test_switch_cluster_command(self):
         self.assertEqual(
@@ -203,6 +218,28 @@ class TestGentQueueAdapter(unittest.TestCase):
             .equals(gent_tmp.get_queue_status())
         )
 
+    def test_get_queue_status_finished(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return "cluster:cluster1\n123|janj|CD|pi_1\n124|janj|F|pi_2\n"
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        self.assertEqual(
+            gent_tmp.get_queue_status_dict()["status"], ["finished", "failed"] * 3
+        )
+        self.assertEqual(
+            gent_tmp.wait_for_jobs(process_id_lst=[123], timeout=2),
+            {123: "finished"},
+        )
+
     def test_get_queue_status_user(self):
         def execute_command(
             commands,
@@ -223,3 +260,335 @@ class TestGentQueueAdapter(unittest.TestCase):
             .reset_index(drop=True)
             .equals(gent_tmp.get_queue_status(user="janj"))
         )
+
+    def test_get_queue_status_partial(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            if "cluster/cluster2;" in commands:
+                return None
+            with open(os.path.join(self.path,  "..", "..", "static", "gent", "gent_output")) as f:
+                return f.read()
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        with self.assertWarns(UserWarning):
+            df = gent_tmp.get_queue_status()
+        self.assertTrue(
+            pandas.concat([df_queue_status] * 2).reset_index(drop=True).equals(df)
+        )
+        self.assertEqual(list(gent_tmp._adapter.cluster_errors.keys()), ["cluster2"])
+
+    def test_get_status_of_jobs_partial(self):
+        command_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            command_lst.append(commands)
+            if "cluster/cluster2;" in commands:
+                return None
+            return "cluster: " + commands[3][8:-1] + "\n10|user|R|job\n20|user|R|job\n"
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        gent_tmp._adapter.status_cache_ttl = 3600
+        with self.assertWarns(UserWarning):
+            self.assertEqual(
+                gent_tmp.get_status_of_jobs(process_id_lst=[10, 11, 20, 21]),
+                ["running", None, "running", None],
+            )
+        query_count = len(command_lst)
+        with self.assertWarns(UserWarning):
+            gent_tmp.get_status_of_jobs(process_id_lst=[10, 11, 20, 21])
+        self.assertGreater(len(command_lst), query_count)
+
+    def test_get_queue_status_unavailable(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return None
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(gent_tmp.get_queue_status_dict())
+        with self.assertWarns(UserWarning):
+            self.assertEqual(gent_tmp.get_status_of_jobs(process_id_lst=[10]), [])
+
+    def test_get_queue_status_timeout(self):
+        event = threading.Event()
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            if "cluster/cluster3;" in commands:
+                event.wait(10)
+            with open(os.path.join(self.path,  "..", "..", "static", "gent", "gent_output")) as f:
+                return f.read()
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        gent_tmp._adapter._cluster_timeout = 0.5
+        start = time.time()
+        with self.assertWarns(UserWarning):
+            df = gent_tmp.get_queue_status()
+        self.assertLess(time.time() - start, 5)
+        event.set()
+        self.assertEqual(len(df), 10)
+        self.assertEqual(list(gent_tmp._adapter.cluster_errors.keys()), ["cluster3"])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(len(gent_tmp.get_queue_status()), 15)
+        self.assertEqual(gent_tmp._adapter.cluster_errors, {})
+
+    def test_submit_jobs(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return "123;cluster0"
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        self.assertEqual(
+            gent_tmp.submit_jobs(
+                job_spec_lst=[
+                    {
+                        "queue": "slurm",
+                        "job_name": "test",
+                        "working_directory": ".",
+                        "command": "echo hello",
+                    }
+                ]
+            ),
+            [1230],
+        )
+        os.remove("run_queue.sh")
+
+    def test_delete_jobs(self):
+        command_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            command_lst.append(commands)
+            return ""
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        self.assertEqual(
+            gent_tmp.delete_jobs(process_id_lst=[10, 21, 30], max_workers=1),
+            ["", "", ""],
+        )
+        self.assertEqual(
+            command_lst,
+            [
+                ["module", "--quiet", "swap", "cluster/cluster1;", "scancel", "1", "3"],
+                ["module", "--quiet", "swap", "cluster/cluster2;", "scancel", "2"],
+            ],
+        )
+
+    def test_cluster_environment(self):
+        command_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            command_lst.append(commands)
+            if commands == ["env", "-0"]:
+                return (
+                    "PATH=/usr/bin\0HOME=/home/user\0SLURM_CLUSTERS=old\0BASH_FUNC_ml%%=() {\n}\0"
+                    + "_ModuleTable001_=base\0__LMOD_REF_COUNT_PATH=/usr/bin:1\0"
+                )
+            elif commands[-2:] == ["env", "-0"]:
+                return (
+                    "PATH=/apps/" + commands[3][8:-1] + "/bin:/usr/bin\0HOME=/home/user\0"
+                    + "SLURM_CONF=/etc/slurm/" + commands[3][8:-1] + " cluster.conf\0"
+                    + "_ModuleTable001_=" + commands[3][8:-1] + "\0_ModuleTable_Sz_=1\0"
+                    + "__LMOD_REF_COUNT_PATH=/apps/" + commands[3][8:-1] + "/bin:1\0"
+                )
+            return "" if not split_output else [""]
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        gent_tmp._adapter._cluster_environment_ttl = 3600
+        gent_tmp.delete_jobs(process_id_lst=[10, 21, 30], max_workers=1)
+        gent_tmp.delete_job(process_id=11)
+        self.assertEqual(
+            [commands for commands in command_lst if "scancel" in commands],
+            [
+                [
+                    "env",
+                    "-u",
+                    "SLURM_CLUSTERS",
+                    "PATH=/apps/cluster1/bin:/usr/bin",
+                    "'SLURM_CONF=/etc/slurm/cluster1 cluster.conf'",
+                    "scancel",
+                    "1",
+                    "3",
+                ],
+                [
+                    "env",
+                    "-u",
+                    "SLURM_CLUSTERS",
+                    "PATH=/apps/cluster2/bin:/usr/bin",
+                    "'SLURM_CONF=/etc/slurm/cluster2 cluster.conf'",
+                    "scancel",
+                    "2",
+                ],
+                [
+                    "env",
+                    "-u",
+                    "SLURM_CLUSTERS",
+                    "PATH=/apps/cluster2/bin:/usr/bin",
+                    "'SLURM_CONF=/etc/slurm/cluster2 cluster.conf'",
+                    "scancel",
+                    "1",
+                ],
+            ],
+        )
+        self.assertEqual(len(command_lst), 7)
+        gent_tmp._adapter.clear_cluster_environment()
+        gent_tmp.delete_job(process_id=11)
+        self.assertEqual(len(command_lst), 10)
+
+    def test_cluster_environment_concurrent(self):
+        command_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            command_lst.append(commands)
+            time.sleep(0.05)
+            if commands[-2:] == ["env", "-0"]:
+                return "PATH=/usr/bin\0"
+            return "" if not split_output else [""]
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        gent_tmp._adapter._cluster_environment_ttl = 3600
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            prefix_lst = list(
+                executor.map(
+                    lambda _: gent_tmp._adapter._cluster_command_prefix(
+                        cluster_module="cluster1"
+                    ),
+                    range(4),
+                )
+            )
+        self.assertEqual(prefix_lst, [["env"]] * 4)
+        self.assertEqual(len(command_lst), 2)
+
+    def test_cluster_environment_failed(self):
+        command_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            command_lst.append(commands)
+            return "" if not split_output else [""]
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        gent_tmp._adapter._cluster_environment_ttl = 3600
+        gent_tmp.delete_job(process_id=10)
+        gent_tmp.delete_job(process_id=10)
+        self.assertEqual(
+            command_lst[2:],
+            [
+                ["module", "--quiet", "swap", "cluster/cluster1;", "scancel", "1"],
+                ["module", "--quiet", "swap", "cluster/cluster1;", "scancel", "1"],
+            ],
+        )
+
+    def test_get_status_of_jobs_accounting(self):
+        command_lst = []
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            command_lst.append(commands)
+            if "sacct" in commands:
+                return commands[-1].replace(",", "|COMPLETED\n") + "|TIMEOUT\n"
+            return "cluster: " + commands[3][8:-1] + "\n99|user|R|job\n"
+
+        gent_tmp = QueueAdapter(
+            directory=os.path.join(self.path, "../../static/gent"),
+            execute_command=execute_command,
+        )
+        gent_tmp._adapter._accounting = True
+        self.assertEqual(
+            gent_tmp.get_status_of_jobs(process_id_lst=[10, 21, 30]),
+            ["finished", "timeout", "timeout"],
+        )
+        self.assertEqual(
+            command_lst[-2:],
+            [
+                ["module", "--quiet", "swap", "cluster/cluster1;"]
+                + gent_tmp._adapter._commands.get_accounting_commands(
+                    process_id_lst=[1, 3]
+                )[0],
+                ["module", "--quiet", "swap", "cluster/cluster2;"]
+                + gent_tmp._adapter._commands.get_accounting_commands(
+                    process_id_lst=[2]
+                )[0],
+            ],
+        )
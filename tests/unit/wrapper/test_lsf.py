@@ -32,6 +32,32 @@ class TestLsfQueueAdapter(unittest.TestCase):
             template,
         )
 
+    def test_filter_arguments(self):
+        self.assertEqual(
+            self.lsf._adapter._commands.get_user_filter_arguments(user="janj"),
+            ["-u", "janj"],
+        )
+        self.assertEqual(
+            self.lsf._adapter._commands.get_job_filter_arguments(process_id_lst=[1, 2]),
+            ["1", "2"],
+        )
+
+    def test_array_job(self):
+        commands = self.lsf._adapter._commands
+        self.assertEqual(commands.array_task_id_variable, "LSB_JOBINDEX")
+        self.assertEqual(
+            commands.get_array_task_command(manifest_path="tasks.sh", array_size=3),
+            "bash tasks.sh $LSB_JOBINDEX",
+        )
+        self.assertIn(
+            "#BSUB -J pysqa[1-3]",
+            commands.render_submission_template(
+                command="echo hello",
+                submission_template=self.lsf._adapter._submission_template,
+                array_size=3,
+            ),
+        )
+
     def test_interfaces(self):
         self.assertEqual(self.lsf._adapter._commands.submit_job_command, ["bsub"])
         self.assertEqual(self.lsf._adapter._commands.delete_job_command, ["bkill"])
@@ -81,3 +107,44 @@ class TestLsfQueueAdapter(unittest.TestCase):
                 )
             )
         )
+
+    def test_convert_accounting_status(self):
+        self.assertEqual(
+            self.lsf._adapter._commands.get_accounting_commands(process_id_lst=[1, 2]),
+            [["bjobs", "-a", "-noheader", "-o", "jobid stat", "1", "2"]],
+        )
+        self.assertEqual(
+            self.lsf._adapter._commands.convert_accounting_status(
+                accounting_output="1 DONE\n2 EXIT\n3 RUN\nJob <4> is not found\n"
+            ),
+            {1: "finished", 2: "failed", 3: "running"},
+        )
+
+    def test_convert_queue_status_finished(self):
+        content = (
+            "JOBID      USER    STAT  QUEUE      FROM_HOST   EXEC_HOST   JOB_NAME   SUBMIT_TIME\n"
+            "5136563    testuse RUN   pbatch     tester709   40*batch_h  pi_None    Aug 22 12:28\n"
+            "5136570    testuse DONE  pbatch     tester709   40*batch_h  pi_None    Aug 22 12:30\n"
+            "5136571    testuse EXIT  pbatch     tester709   40*batch_h  pi_None    Aug 22 12:31\n"
+        )
+        self.assertEqual(
+            self.lsf._adapter._commands.convert_queue_status_to_dict(
+                queue_status_output=content
+            )["status"],
+            ["running", "finished", "failed"],
+        )
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return content
+
+        qa = QueueAdapter(queue_type="LSF", execute_command=execute_command)
+        self.assertEqual(
+            qa.wait_for_jobs(process_id_lst=[5136570, 5136571], timeout=2),
+            {5136570: "finished", 5136571: "failed"},
+        )
@@ -89,6 +89,31 @@ class TestSGEQueueAdapter(unittest.TestCase):
             self.sge._adapter._commands.get_queue_status_command, ["qstat", "-xml"]
         )
 
+    def test_filter_arguments(self):
+        self.assertEqual(
+            self.sge._adapter._commands.get_user_filter_arguments(user="janj"),
+            ["-u", "janj"],
+        )
+        self.assertIsNone(
+            self.sge._adapter._commands.get_job_filter_arguments(process_id_lst=[1])
+        )
+
+    def test_array_job(self):
+        commands = self.sge._adapter._commands
+        self.assertEqual(commands.array_task_id_variable, "SGE_TASK_ID")
+        self.assertEqual(
+            commands.get_array_task_command(manifest_path="tasks.sh", array_size=3),
+            "bash tasks.sh $SGE_TASK_ID",
+        )
+        self.assertIn(
+            "#$ -t 1-3",
+            commands.render_submission_template(
+                command="echo hello",
+                submission_template=self.sge._adapter._submission_template,
+                array_size=3,
+            ),
+        )
+
     def test__list_command_to_be_executed(self):
         with self.subTest("sge"):
             self.assertEqual(
@@ -146,6 +171,82 @@ class TestSGEQueueAdapter(unittest.TestCase):
             )
         )
 
+    def test_queue_status_error(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            with open(os.path.join(self.path, "../../static/sge", "qstat.xml")) as f:
+                return f.read()
+
+        sge_tmp = QueueAdapter(queue_type="SGE", execute_command=execute_command)
+        self.assertEqual(
+            sge_tmp.wait_for_jobs(process_id_lst=[2967274], timeout=2),
+            {2967274: "error"},
+        )
+
+    def test_convert_queue_status_sge_stream(self):
+        with open(os.path.join(self.path, "../../static/sge", "qstat.xml"), "r") as f:
+            df_str = self.sge._adapter._commands.convert_queue_status(
+                queue_status_output=f.read()
+            )
+        with open(os.path.join(self.path, "../../static/sge", "qstat.xml"), "rb") as f:
+            df_stream = self.sge._adapter._commands.convert_queue_status(
+                queue_status_output=f
+            )
+        self.assertTrue(df_str.equals(df_stream))
+        df_empty = self.sge._adapter._commands.convert_queue_status(
+            queue_status_output="<job_info><queue_info/><job_info/></job_info>"
+        )
+        self.assertEqual(len(df_empty), 0)
+        self.assertEqual(
+            list(df_empty.columns),
+            ["jobid", "user", "jobname", "status", "working_directory"],
+        )
+
+    def test_convert_accounting_status(self):
+        self.assertEqual(
+            self.sge._adapter._commands.get_accounting_commands(process_id_lst=[1, 2]),
+            [["qacct", "-j", "1"], ["qacct", "-j", "2"]],
+        )
+        content = """\
+==============================================================
+qname        all.q
+jobname      test1
+jobnumber    1
+failed       0
+exit_status  0
+==============================================================
+qname        all.q
+jobname      test2
+jobnumber    2
+failed       37  : qmaster enforced h_rt, h_cpu, or h_vmem limit
+exit_status  137
+==============================================================
+qname        all.q
+jobname      test3
+jobnumber    3
+taskid       1
+failed       0
+exit_status  0
+==============================================================
+qname        all.q
+jobname      test3
+jobnumber    3
+taskid       2
+failed       0
+exit_status  1
+"""
+        self.assertEqual(
+            self.sge._adapter._commands.convert_accounting_status(
+                accounting_output=content
+            ),
+            {1: "finished", 2: "timeout", 3: "failed"},
+        )
+
     def test_queue_list(self):
         self.assertEqual(
             sorted(self.sge.queue_list),
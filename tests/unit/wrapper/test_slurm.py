@@ -1,8 +1,10 @@
+import json
 import os
 import pandas
 import unittest
 import getpass
 from pysqa import QueueAdapter
+from pysqa.base.core import QueueAdapterCore
 
 
 df_queue_status = pandas.DataFrame(
@@ -54,7 +56,19 @@ class TestSlurmQueueAdapter(unittest.TestCase):
         self.assertEqual(self.slurm._adapter._commands.delete_job_command, ["scancel"])
         self.assertEqual(
             self.slurm._adapter._commands.get_queue_status_command,
-            ["squeue", "--format", "%A|%u|%t|%.15j|%Z", "--noheader"],
+            ["squeue", "--format", "%A|%u|%t|%.15j|%Z|%F", "--noheader"],
+        )
+
+    def test_filter_arguments(self):
+        self.assertEqual(
+            self.slurm._adapter._commands.get_user_filter_arguments(user="janj"),
+            ["--user", "janj"],
+        )
+        self.assertEqual(
+            self.slurm._adapter._commands.get_job_filter_arguments(
+                process_id_lst=[1, 2]
+            ),
+            ["--jobs", "1,2"],
         )
 
     def test__list_command_to_be_executed(self):
@@ -75,11 +89,66 @@ class TestSlurmQueueAdapter(unittest.TestCase):
             )
         )
 
+    def test_convert_queue_status_to_dict_slurm(self):
+        with open(os.path.join(self.path, "../../static/slurm", "squeue_output"), "r") as f:
+            content = f.read()
+        self.assertEqual(
+            self.slurm._adapter._commands.convert_queue_status_to_dict(
+                queue_status_output=content
+            ),
+            df_queue_status.to_dict(orient="list"),
+        )
+
+    def test_convert_queue_status_to_dict_array_jobid(self):
+        content = (
+            "5322019|janj|R|pi_19576488|/home/janj/job_1|5322018\n"
+            "5322020|janj|PD|pi_19576489|/home/janj/job_2|N/A\n"
+        )
+        queue_status = self.slurm._adapter._commands.convert_queue_status_to_dict(
+            queue_status_output=content
+        )
+        self.assertEqual(queue_status["jobid"], [5322019, 5322020])
+        self.assertEqual(queue_status["array_jobid"], [5322018, None])
+
     def test_convert_queue_status_slurm_empty(self):
         df = self.slurm._adapter._commands.convert_queue_status(queue_status_output="")
         self.assertEqual(len(df), 0)
         self.assertEqual(list(df.columns), ["jobid", "user", "jobname", "status", "working_directory"])
 
+    def test_convert_accounting_status(self):
+        self.assertEqual(
+            self.slurm._adapter._commands.get_accounting_commands(
+                process_id_lst=[1, 2]
+            ),
+            [
+                [
+                    "sacct",
+                    "--noheader",
+                    "--parsable2",
+                    "--allocations",
+                    "--format",
+                    "JobIDRaw,State",
+                    "--jobs",
+                    "1,2",
+                ]
+            ],
+        )
+        self.assertEqual(
+            self.slurm._adapter._commands.convert_accounting_status(
+                accounting_output="1|COMPLETED\n2|CANCELLED by 1000\n3_1|OUT_OF_MEMORY\n"
+                "4|NODE_FAIL\n5|PREEMPTED\n6|FAILED\n7|PENDING\n"
+            ),
+            {
+                1: "finished",
+                2: "cancelled",
+                3: "out_of_memory",
+                4: "node_fail",
+                5: "preempted",
+                6: "failed",
+                7: "pending",
+            },
+        )
+
     def test_dependencies(self):
         self.assertEqual(len(self.slurm._adapter._commands.dependencies(dependency_list=None)), 0)
         self.assertEqual(len(self.slurm._adapter._commands.dependencies(dependency_list=[])), 0)
@@ -212,6 +281,35 @@ echo \"hello\""""
             ["running", "finished"],
         )
 
+    def test_queue_status_finished(self):
+        content = (
+            "5322019|janj|R|pi_19576488|/home/janj/job_1\n"
+            "5322020|janj|CD|pi_19576489|/home/janj/job_2\n"
+            "5322021|janj|TO|pi_19576490|/home/janj/job_3\n"
+            "5322022|janj|OOM|pi_19576491|/home/janj/job_4\n"
+        )
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return content
+
+        slurm_tmp = QueueAdapter(queue_type="SLURM", execute_command=execute_command)
+        self.assertEqual(
+            slurm_tmp.get_queue_status_dict()["status"],
+            ["running", "finished", "timeout", "out_of_memory"],
+        )
+        self.assertEqual(
+            slurm_tmp.wait_for_jobs(
+                process_id_lst=[5322020, 5322021, 5322022], timeout=2
+            ),
+            {5322020: "finished", 5322021: "timeout", 5322022: "out_of_memory"},
+        )
+
     def test_not_implemented_functions(self):
         def execute_command(
             commands,
@@ -261,7 +359,7 @@ class TestSlurmQueueAdapterDefault(unittest.TestCase):
         self.assertEqual(self.slurm._adapter._commands.delete_job_command, ["scancel"])
         self.assertEqual(
             self.slurm._adapter._commands.get_queue_status_command,
-            ["squeue", "--format", "%A|%u|%t|%.15j|%Z", "--noheader"],
+            ["squeue", "--format", "%A|%u|%t|%.15j|%Z|%F", "--noheader"],
         )
 
     def test__list_command_to_be_executed(self):
@@ -418,3 +516,125 @@ echo \"hello\""""
 
         with self.assertRaises(NotImplementedError):
             slurm_tmp._adapter.get_job_from_remote(working_directory=".")
+
+
+class TestSlurmJsonQueueAdapter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.path = os.path.dirname(os.path.abspath(__file__))
+        cls.static = os.path.join(cls.path, "..", "..", "static", "slurm_json")
+        cls.slurm = QueueAdapter(directory=cls.static)
+
+    def test_config(self):
+        self.assertEqual(self.slurm.config["status_format"], "json")
+
+    def test_interfaces(self):
+        self.assertEqual(
+            self.slurm._adapter._commands.get_queue_status_command,
+            ["squeue", "--json"],
+        )
+        self.assertEqual(
+            self.slurm._adapter._commands.get_job_filter_arguments(
+                process_id_lst=[1, 2]
+            ),
+            ["--jobs", "1,2"],
+        )
+
+    def test_unsupported_status_format(self):
+        with self.assertRaises(ValueError):
+            QueueAdapterCore(queue_type="SGE", status_format="json")
+
+    def test_convert_queue_status_squeue(self):
+        with open(os.path.join(self.static, "squeue_output")) as f:
+            df = self.slurm._adapter._commands.convert_queue_status(
+                queue_status_output=f.read()
+            )
+        self.assertEqual(df.jobid.tolist(), [5322019, 5322020])
+        self.assertEqual(df.user.tolist(), ["janj", "maxi"])
+        self.assertEqual(
+            df.jobname.tolist(),
+            ["a job name which is longer than fifteen characters", "pi_19576489"],
+        )
+        self.assertEqual(df.status.tolist(), ["running", "pending"])
+        self.assertEqual(
+            df.working_directory.tolist(),
+            ["/cmmc/u/janj/pyiron/projects/job_1", "/cmmc/u/maxi/calc|with|pipes"],
+        )
+        self.assertEqual(df.partition.tolist(), ["s.cmfe", "s.cmfe"])
+        self.assertEqual(df.nodes.tolist(), ["cmti[001-002]", ""])
+        self.assertEqual(
+            df.submit_time.tolist(),
+            [
+                pandas.Timestamp(1700000000, unit="s", tz="UTC"),
+                pandas.Timestamp(1700000200, unit="s", tz="UTC"),
+            ],
+        )
+        self.assertEqual(
+            df.start_time[0], pandas.Timestamp(1700000100, unit="s", tz="UTC")
+        )
+        self.assertTrue(pandas.isna(df.start_time[1]))
+        self.assertTrue(pandas.isna(df.reason[0]))
+        self.assertEqual(df.reason[1], "Priority")
+
+    def test_convert_queue_status_sacct(self):
+        with open(os.path.join(self.static, "sacct_output")) as f:
+            df = self.slurm._adapter._commands.convert_queue_status(
+                queue_status_output=f.read()
+            )
+        self.assertEqual(df.jobid.tolist(), [5322010, 5322011])
+        self.assertEqual(df.user.tolist(), ["janj", "janj"])
+        self.assertEqual(df.status.tolist(), ["finished", "timeout"])
+        self.assertEqual(
+            self.slurm._adapter._commands.get_accounting_commands(process_id_lst=[1]),
+            [["sacct", "--json", "--jobs", "1"]],
+        )
+        with open(os.path.join(self.static, "sacct_output")) as f:
+            self.assertEqual(
+                self.slurm._adapter._commands.convert_accounting_status(
+                    accounting_output=f.read()
+                ),
+                {5322010: "finished", 5322011: "timeout"},
+            )
+        self.assertEqual(
+            df.working_directory.tolist(),
+            ["/cmmc/u/janj/job_10", "/cmmc/u/janj/job_11"],
+        )
+
+    def test_convert_queue_status_to_dict_squeue(self):
+        with open(os.path.join(self.static, "squeue_output")) as f:
+            queue_status = self.slurm._adapter._commands.convert_queue_status_to_dict(
+                queue_status_output=f.read()
+            )
+        self.assertEqual(queue_status["jobid"], [5322019, 5322020])
+        self.assertEqual(queue_status["submit_time"], [1700000000, 1700000200])
+        self.assertEqual(queue_status["start_time"], [1700000100, None])
+        self.assertEqual(queue_status["reason"], [None, "Priority"])
+        self.assertEqual(json.loads(json.dumps(queue_status)), queue_status)
+
+    def test_convert_queue_status_empty(self):
+        df = self.slurm._adapter._commands.convert_queue_status(
+            queue_status_output='{"jobs": [], "errors": []}'
+        )
+        self.assertEqual(len(df), 0)
+        self.assertEqual(df.columns[:5].tolist(), list(df_queue_status.columns))
+
+    def test_queue_status(self):
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            with open(os.path.join(self.static, "squeue_output")) as f:
+                return f.read()
+
+        slurm_tmp = QueueAdapter(
+            directory=self.static,
+            execute_command=execute_command,
+        )
+        self.assertEqual(len(slurm_tmp.get_queue_status(user="janj")), 1)
+        self.assertEqual(
+            slurm_tmp.get_status_of_jobs(process_id_lst=[5322019, 5322020, 0]),
+            ["running", "pending", "finished"],
+        )
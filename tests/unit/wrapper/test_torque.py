@@ -29,6 +29,33 @@ class TestTorqueQueueAdapter(unittest.TestCase):
             self.torque._adapter._commands.get_queue_status_command, ["qstat", "-f"]
         )
 
+    def test_filter_arguments(self):
+        self.assertIsNone(
+            self.torque._adapter._commands.get_user_filter_arguments(user="janj")
+        )
+        self.assertEqual(
+            self.torque._adapter._commands.get_job_filter_arguments(
+                process_id_lst=[1, 2]
+            ),
+            ["1", "2"],
+        )
+
+    def test_array_job(self):
+        commands = self.torque._adapter._commands
+        self.assertEqual(commands.array_task_id_variable, "PBS_ARRAYID")
+        self.assertEqual(
+            commands.get_array_task_command(manifest_path="tasks.sh", array_size=3),
+            "bash tasks.sh $PBS_ARRAYID",
+        )
+        self.assertIn(
+            "#PBS -t 1-3",
+            commands.render_submission_template(
+                command="echo hello",
+                submission_template=self.torque._adapter._submission_template,
+                array_size=3,
+            ),
+        )
+
     def test__list_command_to_be_executed(self):
         with self.subTest("torque"):
             self.assertEqual(
@@ -80,6 +107,93 @@ class TestTorqueQueueAdapter(unittest.TestCase):
                 )
             )
         )
+        with open(
+            os.path.join(self.path, "../../static/torque", "PBSPro_qsub_output"), "r"
+        ) as f:
+            self.assertTrue(
+                df_verify.equals(
+                    self.torque._adapter._commands.convert_queue_status(
+                        queue_status_output=f
+                    )
+                )
+            )
+
+    def test_queue_status_finished(self):
+        content = (
+            "Job Id: 123.server\n"
+            "    Job_Name = running\n"
+            "    Job_Owner = user@login\n"
+            "    job_state = R\n"
+            "\n"
+            "Job Id: 124.server\n"
+            "    Job_Name = completed\n"
+            "    Job_Owner = user@login\n"
+            "    job_state = C\n"
+            "\n"
+            "Job Id: 125.server\n"
+            "    Job_Name = exiting\n"
+            "    Job_Owner = user@login\n"
+            "    job_state = E\n"
+        )
+
+        def execute_command(
+            commands,
+            working_directory=None,
+            split_output=True,
+            shell=False,
+            error_filename="pysqa.err",
+        ):
+            return content
+
+        torque_tmp = QueueAdapter(queue_type="TORQUE", execute_command=execute_command)
+        self.assertEqual(
+            torque_tmp.get_queue_status_dict()["status"],
+            ["running", "finished", "running"],
+        )
+        self.assertEqual(
+            torque_tmp.wait_for_jobs(process_id_lst=[124], timeout=2),
+            {124: "finished"},
+        )
+
+    def test_convert_queue_status_torque_wrapped_values(self):
+        content = (
+            "Job Id: 123[1].server\n"
+            "    Job_Name = my job\n"
+            "    Job_Owner = user@login\n"
+            "    job_state = R\n"
+            "    Variable_List = PBS_O_HOME=/home/user,PBS_O_LOGNAME=user,\n"
+            "\tPBS_O_WORKDIR=/home/user/my calc\n"
+            "    queue = normal\n"
+            "\n"
+            "Job Id: 124.server\n"
+            "    Job_Name = other\n"
+            "    Job_Owner = user@login\n"
+            "    job_state = Q\n"
+            "    Variable_List = PBS_O_HOME=/home/user\n"
+        )
+        df_verify = pandas.DataFrame(
+            {
+                "jobid": [123, 124],
+                "user": ["user", "user"],
+                "jobname": ["my job", "other"],
+                "status": ["running", "pending"],
+                "working_directory": ["/home/user/my calc", None],
+            }
+        )
+        self.assertTrue(
+            df_verify.equals(
+                self.torque._adapter._commands.convert_queue_status(
+                    queue_status_output=content
+                )
+            )
+        )
+        self.assertTrue(
+            df_verify.equals(
+                self.torque._adapter._commands.convert_queue_status(
+                    queue_status_output=content.splitlines(keepends=True)
+                )
+            )
+        )
 
     def test_render_submission_template(self):
         output_str = """\